@@ -1,3 +1,91 @@
+import re
+
+START_CODON = "ATG"
+STOP_CODONS = ("TAG", "TAA", "TGA")
+CODON_PATTERN = re.compile("(?=(ATG|TAG|TAA|TGA))")
+COMPLEMENT_TABLE = str.maketrans('ACGT', 'TGCA')
+
+
+def _scan_orfs(dna_string, min_length):
+    """
+    This auxiliary function finds open reading frames in all three
+    frames of a single strand. Start and stop codons of every frame are
+    located by a single regular expression pass over the strand, and
+    for every frame the start codons that have not been closed by a stop
+    codon yet are kept as pending.
+
+    Arguments:
+        dna_string (str): DNA strand to be scanned
+        min_length (int): minimal length of a reported ORF in bases,
+                          including the stop codon
+
+    Returns:
+        Generator of tuples (start, end, frame), where start and end are
+        positions of the first and the last base of an ORF and frame is
+        1, 2 or 3
+    """
+    pending_starts = ([], [], [])
+
+    for codon in CODON_PATTERN.finditer(dna_string):
+        position = codon.start()
+        pending = pending_starts[position % 3]
+
+        if codon.group(1) == START_CODON:
+            pending.append(position)
+            continue
+
+        end = position + 2
+        for start in pending:
+            if end - start + 1 >= min_length:
+                yield start, end, start % 3 + 1
+        pending.clear()
+
+
+def find_orfs(dna_string, min_length=0, both_strands=False):
+    """
+    This function lazily finds open reading frames (ORFs) - fragments
+    of a DNA sequence that start with the start codon ATG and end with
+    the first stop codon in the same reading frame. Every frame is
+    scanned only once, so the time needed is linear in the length of
+    the sequence (and the number of reported ORFs).
+
+    Arguments:
+        dna_string (str): A string that represents the DNA sequence to
+                          search for open reading frames.
+        min_length (int): Minimal length of a reported ORF in bases,
+                          including the stop codon.
+        both_strands (bool): If True, the reverse complement of the
+                          sequence is searched as well (six frames).
+
+    Returns:
+        Generator of tuples (start, end, frame, orf), where start and
+        end are positions of the first and the last base of an ORF in
+        dna_string, frame is 1, 2, 3 for the given strand and -1, -2, -3
+        for its reverse complement, and orf is the ORF read in the
+        direction of its strand.
+
+    Raises:
+        ValueError: If it contains signs that not represent a DNA string
+                    or min_length is not a non-negative integer
+    """
+    if not set('ACGT').issuperset(dna_string):
+        raise ValueError("This is not a DNA sequence")
+
+    if not isinstance(min_length, int) or min_length < 0:
+        raise ValueError("min_length must be a non-negative integer")
+
+    for start, end, frame in _scan_orfs(dna_string, min_length):
+        yield start, end, frame, dna_string[start:end + 1]
+
+    if both_strands:
+        reverse_strand = dna_string.translate(COMPLEMENT_TABLE)[::-1]
+        last = len(dna_string) - 1
+
+        for start, end, frame in _scan_orfs(reverse_strand, min_length):
+            yield (last - end, last - start, -frame,
+                   reverse_strand[start:end + 1])
+
+
 def find_genes(dna_string):
     """
     This function searches for potential genes in a sequence of codons
@@ -17,34 +105,19 @@ def find_genes(dna_string):
             - it contains signs that not represent a DNA string
             - it doesn't end with a stop codon
             - its length is not a multiple of 3
-            - it contains intervening stop codons
             - it does not have any potential genes
     """
-    valid_bases = set('ACGT')
-    beginning_code = "ATG"
-    end_codes = ["TAG", "TAA", "TGA"]
-    potential_genes = []
-
-    for base in valid_bases:
-        if base not in valid_bases:
-            raise ValueError("This is not a DNA sequence")
+    if not set('ACGT').issuperset(dna_string):
+        raise ValueError("This is not a DNA sequence")
 
     if len(dna_string) % 3 != 0:
         raise ValueError("Given DNA string length is not a multiple of 3")
-    elif dna_string[0:3] != beginning_code:
+    elif dna_string[0:3] != START_CODON:
         raise ValueError("Given DNA does not start with the start codon ATG")
-    elif dna_string[-3:] not in end_codes:
+    elif dna_string[-3:] not in STOP_CODONS:
         raise ValueError("Given DNA does not end with any of the stop codons")
 
-    for code in end_codes:
-        if dna_string.count(code) > 1:
-            raise ValueError("Given DNA has more than one stop codon")
-
-    for i in range(len(dna_string)):
-        for j in range(i + 3, len(dna_string), 3):
-            if dna_string[j:j + 3] in end_codes:
-                potential_genes.append(dna_string[i:j + 3])
-                break
+    potential_genes = [orf for _, _, _, orf in find_orfs(dna_string)]
 
     if not potential_genes:
         raise ValueError("No potential genes found in the given DNA sequence.")
@@ -52,9 +125,10 @@ def find_genes(dna_string):
     return potential_genes
 
 
-try:
-    dna_string = input("Insert gene: ").upper()
-    check_dna_string = find_genes(dna_string)
-    print(f"Potential genes found: {check_dna_string}")
-except ValueError as e:
-    print(f"Error: {e}")
+if __name__ == '__main__':
+    try:
+        dna_string = input("Insert gene: ").upper()
+        check_dna_string = find_genes(dna_string)
+        print(f"Potential genes found: {check_dna_string}")
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -2,6 +2,9 @@ import random
 import matplotlib.pyplot as plt
 import numbers
 
+DNA_COMPLEMENT_TABLE = str.maketrans('ACGT', 'TGCA')
+
+
 def get_valid_float_input(insert):
     """
     This auxiliary function is used to constantly ask user for an input until they will provide
@@ -215,24 +218,12 @@ def dna_complement(orig_strand):
         Raises:
             ValueError: If the provided strand contains invalid chars.
     """
-    strand = ""
     valid_bases = set('ACGT')
 
-    for base in orig_strand:
-        if base not in valid_bases:
-            raise ValueError("Invalid DNA base provided.")
-
-        if base == 'A':
-            strand += 'T'
-
-        elif base == 'T':
-            strand += 'A'
-
-        elif base == 'C':
-            strand += 'G'
+    if not valid_bases.issuperset(orig_strand):
+        raise ValueError("Invalid DNA base provided.")
 
-        elif base == 'G':
-            strand += 'C'
+    strand = orig_strand.translate(DNA_COMPLEMENT_TABLE)
 
     return strand
 
@@ -0,0 +1,52 @@
+from find_genes import find_genes, find_orfs
+
+# Test for the find_orfs function
+assert list(find_orfs("CCATGAAATAGGG")) == [(2, 10, 3, "ATGAAATAG")], \
+    "Test case 1 (single ORF) for function find_orfs has failed"
+
+assert list(find_orfs("ATGATGTAAATGCCCTGA")) == [
+    (0, 8, 1, "ATGATGTAA"), (3, 8, 1, "ATGTAA"),
+    (9, 17, 1, "ATGCCCTGA")], \
+    ("Test case 2 (nested starts and many stop codons)"
+     " for function find_orfs has failed")
+
+assert list(find_orfs("ATGATGTAAATGCCCTGA", min_length=7)) == [
+    (0, 8, 1, "ATGATGTAA"), (9, 17, 1, "ATGCCCTGA")], \
+    "Test case 3 (min_length filter) for function find_orfs has failed"
+
+assert list(find_orfs("CTACATTTT", both_strands=True)) == [
+    (0, 5, -1, "ATGTAG")], \
+    "Test case 4 (reverse strand) for function find_orfs has failed"
+
+assert list(find_orfs("ATGAAA")) == [], \
+    "Test case 5 (ORF without stop codon) for function find_orfs has failed"
+
+try:
+    list(find_orfs("ATGXTAA"))
+except ValueError:
+    pass
+else:
+    assert False, ("Test case 6 (invalid bases)"
+                   " for function find_orfs has failed")
+
+# Test for the find_genes function
+assert find_genes("ATGCCCTAAATGTGA") == ["ATGCCCTAA", "ATGTGA"], \
+    "Test case 1 (many stop codons) for function find_genes has failed"
+
+try:
+    find_genes("ATGCCCTA")
+except ValueError:
+    pass
+else:
+    assert False, ("Test case 2 (length not a multiple of 3)"
+                   " for function find_genes has failed")
+
+try:
+    find_genes("ATGUUUTAA")
+except ValueError:
+    pass
+else:
+    assert False, ("Test case 3 (not a DNA sequence)"
+                   " for function find_genes has failed")
+
+print("\nAll tests passed successfully!")
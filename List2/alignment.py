@@ -0,0 +1,434 @@
+"""
+Module containing pairwise alignment of sequences: global alignment
+(Needleman-Wunsch), local alignment (Smith-Waterman) and banded global
+alignment of similar sequences. Global and local alignments keep only
+single rows of the score matrix and recover the alignment with
+Hirschberg's divide and conquer method, so they need O(n + m) memory.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GAP = '-'
+# sub-problems of at most this many cells are aligned with a full matrix
+FULL_MATRIX_CELLS = 4096
+
+
+class Alignment:
+    """
+    This class represents an alignment of two sequences: both sequences
+    with gaps inserted, the score of the alignment and the aligned
+    fragments of the original sequences given by positions of their
+    first and last characters (as in find_motif).
+    """
+
+    def __init__(self, score, first, second, first_range, second_range):
+        self.score = score
+        self.first = first
+        self.second = second
+        self.first_range = first_range
+        self.second_range = second_range
+
+    def identity(self):
+        """
+        This function calculates the fraction of aligned columns holding
+        identical characters
+
+        Returns:
+            identity (float): fraction of identical columns
+        """
+        if not self.first:
+            return 0.0
+        same = sum(x == y for x, y in zip(self.first, self.second))
+        return same / len(self.first)
+
+    def __str__(self):
+        """
+        This function creates a text representation of the alignment
+        with '|' marking identical characters
+
+        Returns:
+            alignment_str (str): three lines of the alignment
+        """
+        matches = ''.join('|' if x == y else ' '
+                          for x, y in zip(self.first, self.second))
+        return f"{self.first}\n{matches}\n{self.second}"
+
+
+def _check_scoring(match, mismatch, gap):
+    """
+    This function checks parameters of scoring
+
+    Raises:
+        ValueError: If any parameter is not a number or gap is not
+            negative
+    """
+    for value in (match, mismatch, gap):
+        if not isinstance(value, (int, float)):
+            raise ValueError("Scores have to be numbers.")
+
+    if gap >= 0:
+        raise ValueError("Gap score has to be negative.")
+
+
+def _score_columns(first, second, match, mismatch, gap):
+    """
+    This function calculates the score of aligned sequences
+
+    Returns:
+        score (int or float): sum of scores of all columns
+    """
+    score = 0
+    for x, y in zip(first, second):
+        if x == GAP or y == GAP:
+            score += gap
+        else:
+            score += match if x == y else mismatch
+    return score
+
+
+def _rows(a, b, scoring, local=False, use_numpy=False):
+    """
+    This function generates consecutive rows of the score matrix of
+    aligning a with b, keeping only one row in memory at a time. Row i
+    holds scores of aligning a[:i] with every prefix of b.
+
+    Arguments:
+        a, b (str): aligned sequences
+        scoring (tuple): match, mismatch and gap scores
+        local (bool): If True, scores of local alignment (never below 0)
+            are generated
+        use_numpy (bool): If True and NumPy is available, every row is
+            computed as a vector
+
+    Returns:
+        Generator of rows (list or numpy.ndarray) for i from 0 to len(a)
+    """
+    if use_numpy and np is not None:
+        yield from _rows_numpy(a, b, scoring, local)
+        return
+
+    match, mismatch, gap = scoring
+    row = [0] * (len(b) + 1) if local else [gap * j
+                                            for j in range(len(b) + 1)]
+    yield row
+
+    for i, char_a in enumerate(a, 1):
+        previous = row
+        row = [0 if local else gap * i]
+        left = row[0]
+
+        for j, char_b in enumerate(b, 1):
+            score = max(previous[j - 1]
+                        + (match if char_a == char_b else mismatch),
+                        previous[j] + gap,
+                        left + gap)
+            if local and score < 0:
+                score = 0
+            row.append(score)
+            left = score
+
+        yield row
+
+
+def _rows_numpy(a, b, scoring, local):
+    """
+    This function is the vectorized version of _rows. The diagonal and
+    vertical moves of a whole row are computed at once. Horizontal moves
+    depend on the previous cell of the same row, but with a linear gap
+    score H[j] = max(T[j], H[j - 1] + gap) equals
+    max over k <= j of (T[k] + gap * (j - k)), which is a cumulative
+    maximum of T[k] - gap * k shifted back by gap * j.
+    """
+    match, mismatch, gap = scoring
+    codes = np.frombuffer(b.encode('utf-32-le'), dtype=np.uint32)
+    offsets = gap * np.arange(len(b) + 1, dtype=np.float64)
+    row = np.zeros(len(b) + 1) if local else offsets.copy()
+    yield row
+
+    for i, char_a in enumerate(a, 1):
+        substitution = np.where(codes == ord(char_a), match, mismatch)
+        candidates = np.empty(len(b) + 1)
+        candidates[0] = 0 if local else gap * i
+        np.maximum(row[:-1] + substitution, row[1:] + gap,
+                   out=candidates[1:])
+        if local:
+            np.maximum(candidates, 0, out=candidates)
+        row = np.maximum.accumulate(candidates - offsets) + offsets
+        yield row
+
+
+def _last_row(a, b, scoring, use_numpy):
+    """
+    This function returns the last row of the global score matrix
+
+    Returns:
+        row (list or numpy.ndarray): scores of aligning a with every
+            prefix of b
+    """
+    for row in _rows(a, b, scoring, use_numpy=use_numpy):
+        pass
+    return row
+
+
+def _full_alignment(a, b, scoring):
+    """
+    This function aligns two short sequences globally using the full
+    score matrix and a traceback
+
+    Returns:
+        first, second (tuple): aligned sequences with gaps
+    """
+    match, mismatch, gap = scoring
+    rows = [list(row) for row in _rows(a, b, scoring)]
+    first = []
+    second = []
+    i, j = len(a), len(b)
+
+    while i or j:
+        if (i and j and rows[i][j] == rows[i - 1][j - 1]
+                + (match if a[i - 1] == b[j - 1] else mismatch)):
+            first.append(a[i - 1])
+            second.append(b[j - 1])
+            i -= 1
+            j -= 1
+        elif i and rows[i][j] == rows[i - 1][j] + gap:
+            first.append(a[i - 1])
+            second.append(GAP)
+            i -= 1
+        else:
+            first.append(GAP)
+            second.append(b[j - 1])
+            j -= 1
+
+    return ''.join(reversed(first)), ''.join(reversed(second))
+
+
+def _hirschberg(a, b, scoring, use_numpy):
+    """
+    This function aligns two sequences globally in linear memory. The
+    first sequence is split in half and the optimal split point of the
+    second one is found from the last rows of score matrices of the
+    upper half and of the reversed lower half, then both parts are
+    aligned recursively.
+
+    Returns:
+        first, second (tuple): aligned sequences with gaps
+    """
+    if len(a) <= 1 or len(b) <= 1 or len(a) * len(b) <= FULL_MATRIX_CELLS:
+        return _full_alignment(a, b, scoring)
+
+    middle = len(a) // 2
+    upper = _last_row(a[:middle], b, scoring, use_numpy)
+    lower = _last_row(a[middle:][::-1], b[::-1], scoring, use_numpy)
+    if isinstance(upper, list):
+        split = max(range(len(b) + 1),
+                    key=lambda j: upper[j] + lower[len(b) - j])
+    else:
+        split = int(np.argmax(upper + lower[::-1]))
+
+    upper_first, upper_second = _hirschberg(a[:middle], b[:split],
+                                            scoring, use_numpy)
+    lower_first, lower_second = _hirschberg(a[middle:], b[split:],
+                                            scoring, use_numpy)
+    return upper_first + lower_first, upper_second + lower_second
+
+
+def global_alignment(a, b, match=1, mismatch=-1, gap=-1, use_numpy=False):
+    """
+    This function finds an optimal global alignment of two sequences
+    (Needleman-Wunsch) in linear memory
+
+    Arguments:
+        a, b (str): aligned sequences
+        match (int or float): score of two identical characters
+        mismatch (int or float): score of two different characters
+        gap (int or float): score of a character aligned with a gap,
+            has to be negative
+        use_numpy (bool): If True, rows of the score matrix are computed
+            with NumPy (when it is installed)
+
+    Returns:
+        alignment (Alignment): the optimal alignment
+
+    Raises:
+        ValueError: If scoring parameters are invalid
+    """
+    _check_scoring(match, mismatch, gap)
+    scoring = (match, mismatch, gap)
+
+    first, second = _hirschberg(a, b, scoring, use_numpy)
+    score = _score_columns(first, second, *scoring)
+    return Alignment(score, first, second, (0, len(a) - 1), (0, len(b) - 1))
+
+
+def local_alignment(a, b, match=1, mismatch=-1, gap=-1, use_numpy=False):
+    """
+    This function finds an optimal local alignment of two sequences
+    (Smith-Waterman) in linear memory. The end of the alignment is the
+    best cell of the local score matrix, its start is the cell reaching
+    the same score when prefixes ending there are scanned backwards,
+    and the fragments between them are aligned globally.
+
+    Arguments:
+        a, b (str): aligned sequences
+        match, mismatch, gap: scores as in global_alignment
+        use_numpy (bool): If True, rows of the score matrix are computed
+            with NumPy (when it is installed)
+
+    Returns:
+        alignment (Alignment): the optimal local alignment, empty if no
+            pair of characters scores above 0
+
+    Raises:
+        ValueError: If scoring parameters are invalid
+    """
+    _check_scoring(match, mismatch, gap)
+    scoring = (match, mismatch, gap)
+
+    best, end_a, end_b = _best_cell(_rows(a, b, scoring, True, use_numpy))
+    if best <= 0:
+        return Alignment(0, '', '', None, None)
+
+    reversed_a = a[:end_a][::-1]
+    reversed_b = b[:end_b][::-1]
+    _, length_a, length_b = _best_cell(
+        _rows(reversed_a, reversed_b, scoring, use_numpy=use_numpy), best)
+
+    start_a = end_a - length_a
+    start_b = end_b - length_b
+    first, second = _hirschberg(a[start_a:end_a], b[start_b:end_b],
+                                scoring, use_numpy)
+    score = _score_columns(first, second, *scoring)
+    return Alignment(score, first, second, (start_a, end_a - 1),
+                     (start_b, end_b - 1))
+
+
+def _best_cell(rows, target=None):
+    """
+    This function scans rows of a score matrix for the cell with the
+    highest score or for the first cell reaching a target score
+
+    Arguments:
+        rows (iterable): rows generated by _rows
+        target (int or float): If provided, the first cell with at least
+            this score is returned
+
+    Returns:
+        score, i, j (tuple): score and position of the found cell
+    """
+    best, best_i, best_j = None, 0, 0
+
+    for i, row in enumerate(rows):
+        if isinstance(row, list):
+            j = max(range(len(row)), key=row.__getitem__)
+        else:
+            j = int(row.argmax())
+        if target is not None and row[j] >= target:
+            return row[j], i, j
+        if best is None or row[j] > best:
+            best, best_i, best_j = row[j], i, j
+
+    return best, best_i, best_j
+
+
+def banded_alignment(a, b, band, match=1, mismatch=-1, gap=-1):
+    """
+    This function finds an optimal global alignment of two similar
+    sequences, in which no character is shifted by more than band
+    positions from the diagonal. Only cells of the band are computed,
+    so time and memory are O(n * band).
+
+    Arguments:
+        a, b (str): aligned sequences
+        band (int): maximal distance of a path from the diagonal
+        match, mismatch, gap: scores as in global_alignment
+
+    Returns:
+        alignment (Alignment): the optimal alignment inside the band
+
+    Raises:
+        ValueError: If scoring parameters or band are invalid, or the
+            band is narrower than the difference of lengths
+    """
+    _check_scoring(match, mismatch, gap)
+
+    if not isinstance(band, int) or band < 0:
+        raise ValueError("Band has to be a non-negative integer.")
+
+    if abs(len(a) - len(b)) > band:
+        raise ValueError("Band is narrower than the difference of"
+                         " lengths of the sequences.")
+
+    width = 2 * band + 1
+    minus_infinity = float('-inf')
+    # cell (i, j) is stored at index j - i + band of row i
+    moves = [bytearray(width) for _ in range(len(a) + 1)]
+    row = [minus_infinity] * width
+    for j in range(min(len(b), band) + 1):
+        row[j + band] = gap * j
+        moves[0][j + band] = 2
+
+    for i in range(1, len(a) + 1):
+        previous = row
+        row = [minus_infinity] * width
+        for k in range(max(0, band - i), width):
+            j = i + k - band
+            if j > len(b):
+                break
+            if j == 0:
+                row[k] = gap * i
+                moves[i][k] = 1
+                continue
+
+            options = (
+                previous[k] + (match if a[i - 1] == b[j - 1] else mismatch),
+                previous[k + 1] + gap if k + 1 < width else minus_infinity,
+                row[k - 1] + gap if k > 0 else minus_infinity)
+            move = max(range(3), key=options.__getitem__)
+            row[k] = options[move]
+            moves[i][k] = move
+
+    first = []
+    second = []
+    i, j = len(a), len(b)
+
+    while i or j:
+        move = moves[i][j - i + band]
+        if move == 0:
+            first.append(a[i - 1])
+            second.append(b[j - 1])
+            i -= 1
+            j -= 1
+        elif move == 1:
+            first.append(a[i - 1])
+            second.append(GAP)
+            i -= 1
+        else:
+            first.append(GAP)
+            second.append(b[j - 1])
+            j -= 1
+
+    score = row[len(b) - len(a) + band]
+    return Alignment(score, ''.join(reversed(first)),
+                     ''.join(reversed(second)),
+                     (0, len(a) - 1), (0, len(b) - 1))
+
+
+if __name__ == '__main__':
+    first_strand = "GATTACAGATTACA"
+    second_strand = "GATCACAGTTACA"
+
+    global_result = global_alignment(first_strand, second_strand)
+    print(f"Global alignment (score {global_result.score}):"
+          f"\n{global_result}\n")
+
+    local_result = local_alignment("TTTTGATTACATTTT", "CCGATTACACC")
+    print(f"Local alignment (score {local_result.score}) of fragments"
+          f" {local_result.first_range} and {local_result.second_range}:"
+          f"\n{local_result}\n")
+
+    banded_result = banded_alignment(first_strand, second_strand, 2)
+    print(f"Banded alignment (score {banded_result.score}):"
+          f"\n{banded_result}")
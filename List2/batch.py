@@ -0,0 +1,203 @@
+"""
+Module for running operations of the Sequence hierarchy over large
+collections of sequences in a pool of worker processes
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+
+OPERATIONS = ('complement', 'reverse_complement', 'transcribe',
+              'translate', 'find_motif')
+
+
+def _chunks(sequences, chunk_size):
+    """
+    This function splits an iterable of sequences into lists of at most
+    chunk_size sequences without reading the whole iterable
+
+    Arguments:
+        sequences (iterable): sequences to be split
+        chunk_size (int): maximal number of sequences in a chunk
+
+    Returns:
+        Generator of lists of sequences
+    """
+    iterator = iter(sequences)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def _share_chunk(chunk):
+    """
+    This function copies data of all sequences of a chunk into a single
+    shared memory block, so that workers read it directly instead of
+    receiving every sequence through a pipe
+
+    Arguments:
+        chunk (list): sequences to be shared
+
+    Returns:
+        block (SharedMemory): block holding concatenated sequence data
+        layout (list): tuples (class, identifier, start, end) describing
+            where data of every sequence is stored in the block
+    """
+    payloads = [str(sequence.data).encode('ascii', 'replace')
+                for sequence in chunk]
+    block = shared_memory.SharedMemory(
+        create=True, size=max(1, sum(map(len, payloads))))
+
+    layout = []
+    start = 0
+    for sequence, payload in zip(chunk, payloads):
+        end = start + len(payload)
+        block.buf[start:end] = payload
+        layout.append((type(sequence), sequence.identifier, start, end))
+        start = end
+
+    return block, layout
+
+
+def _run_chunk(block_name, layout, operation, args):
+    """
+    This function is executed by a worker process. It rebuilds sequences
+    of a chunk from a shared memory block and applies the operation to
+    every one of them.
+
+    Arguments:
+        block_name (str): name of the shared memory block
+        layout (list): layout returned by _share_chunk
+        operation (str): name of the called method
+        args (tuple): arguments of the called method
+
+    Returns:
+        results (list): results of the operation in order of sequences
+    """
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        results = []
+        for sequence_class, identifier, start, end in layout:
+            data = bytes(block.buf[start:end]).decode('ascii')
+            sequence = sequence_class(data, identifier)
+            results.append(getattr(sequence, operation)(*args))
+        return results
+    finally:
+        block.close()
+
+
+def run_batch(sequences, operation, *args, processes=None,
+              chunk_size=1000):
+    """
+    This function applies an operation to every sequence of a collection
+    using a pool of processes. Sequences are sent to workers in chunks
+    through shared memory and only a few chunks are in flight at once,
+    so the collection may be a generator (e.g. returned by read_fasta)
+    larger than the available memory. Results are yielded in the order
+    of the input sequences.
+
+    Arguments:
+        sequences (iterable): DNASequence, RNASequence or ProteinSequence
+            objects
+        operation (str): name of the method called on every sequence,
+            one of OPERATIONS
+        *args: arguments passed to the method (e.g. a motif)
+        processes (int): number of worker processes, all CPUs by default,
+            1 runs the operation in the current process
+        chunk_size (int): number of sequences sent to a worker at once
+
+    Returns:
+        Generator of results of the operation
+
+    Raises:
+        ValueError: If the operation is not supported, processes or
+            chunk_size is not greater than 0, or the operation raises it
+            for any sequence
+    """
+    if operation not in OPERATIONS:
+        raise ValueError("Operation must be one of: "
+                         + ", ".join(OPERATIONS))
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if not isinstance(processes, int) or processes <= 0:
+        raise ValueError("processes must be an integer greater than 0.")
+
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be an integer greater than 0.")
+
+    return _run_batch(sequences, operation, args, processes, chunk_size)
+
+
+def _run_batch(sequences, operation, args, processes, chunk_size):
+    """
+    This function is the generator behind run_batch, separated so that
+    arguments are validated as soon as run_batch is called
+    """
+    if processes == 1:
+        for sequence in sequences:
+            yield getattr(sequence, operation)(*args)
+        return
+
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            for chunk in _chunks(sequences, chunk_size):
+                block, layout = _share_chunk(chunk)
+                future = executor.submit(_run_chunk, block.name, layout,
+                                         operation, args)
+                pending.append((block, future))
+
+                if len(pending) >= 2 * processes:
+                    yield from _finish(*pending.popleft())
+
+            while pending:
+                yield from _finish(*pending.popleft())
+        finally:
+            for block, future in pending:
+                future.cancel()
+                _release(block)
+
+
+def _finish(block, future):
+    """
+    This function waits for results of a chunk and releases its shared
+    memory block
+
+    Arguments:
+        block (SharedMemory): block of the chunk
+        future (Future): future of the chunk
+
+    Returns:
+        results (list): results of the chunk
+    """
+    try:
+        return future.result()
+    finally:
+        _release(block)
+
+
+def _release(block):
+    """
+    This function closes and removes a shared memory block
+
+    Arguments:
+        block (SharedMemory): block to be removed
+    """
+    block.close()
+    block.unlink()
+
+
+if __name__ == '__main__':
+    from biological_sequences import DNASequence
+
+    strands = (DNASequence("ATCGGCTAATCGAAGCT" * 3, f"HumanDNA_{i}")
+               for i in range(10))
+
+    for motifs in run_batch(strands, 'find_motif', 'GCT', processes=2,
+                            chunk_size=4):
+        print(f"Positions of the provided motif: {motifs}")
@@ -1,9 +1,236 @@
+from functools import lru_cache
+
+from alignment import banded_alignment, global_alignment, local_alignment
+from kmer import kmer_counts
+from mapped_sequence import MappedSequence
+from motif_search import (AhoCorasick, SuffixArray, find_edits,
+                          find_mismatches)
+from mutation_log import MutationLog
+from packed_sequence import PackedSequence
+from sequence_statistics import SequenceStatistics
+from validators import AlphabetValidator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _complement_table(bases, complements):
+    """
+    This function builds a 256-byte translation table mapping every base
+    to its complement and every other byte to 0, so that translating
+    a strand and validating its alphabet is done in the same pass
+
+    Arguments:
+        bases (bytes): valid bases of a strand
+        complements (bytes): complementary bases in the same order
+
+    Returns:
+        table (bytes): translation table for bytes.translate
+    """
+    table = bytearray(256)
+    for base, complement in zip(bases, complements):
+        table[base] = complement
+    return bytes(table)
+
+
+def _translate_strand(data, table, reverse=False, use_numpy=False):
+    """
+    This function translates a whole strand with a complement table
+    instead of building the result base by base
+
+    Arguments:
+        data (str): strand to be translated
+        table (bytes): table created by _complement_table
+        reverse (bool): If True, the translated strand is also reversed
+        use_numpy (bool): If True and NumPy is available, the strand is
+            translated as a uint8 array with a lookup table
+
+    Returns:
+        translated (str): translated strand
+
+    Raises:
+        ValueError: If any base of the strand is not in the table
+    """
+    try:
+        raw = data.encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError("Invalid value provided.") from None
+
+    if use_numpy and np is not None:
+        lookup = np.frombuffer(table, dtype=np.uint8)
+        translated = lookup[np.frombuffer(raw, dtype=np.uint8)]
+        if not translated.all():
+            raise ValueError("Invalid value provided.")
+        if reverse:
+            translated = translated[::-1]
+        return translated.tobytes().decode('ascii')
+
+    translated = raw.translate(table)
+    if 0 in translated:
+        raise ValueError("Invalid value provided.")
+    if reverse:
+        translated = translated[::-1]
+    return translated.decode('ascii')
+
+
+def _base_code_table(bases):
+    """
+    This function builds a translation table encoding every base as its
+    2-bit code (its index in bases) and every other byte as 4
+
+    Arguments:
+        bases (bytes): four bases in the order of their codes
+
+    Returns:
+        table (bytes): translation table for bytes.translate
+    """
+    table = bytearray([4]) * 256
+    for code, base in enumerate(bases):
+        table[base] = code
+    return bytes(table)
+
+
+def _encode_bases(data, base_codes):
+    """
+    This function encodes a whole strand with 2-bit base codes in
+    a single bytes.translate call
+
+    Arguments:
+        data (str): strand to be encoded
+        base_codes (bytes): table created by _base_code_table
+
+    Returns:
+        codes (bytes): code of every base, 4 for invalid bases
+    """
+    return data.encode('ascii', 'replace').translate(base_codes)
+
+
+def _codon_table(codon_map, bases):
+    """
+    This function converts a codon map into a 64-character string, where
+    the amino acid of a codon is stored at index 16 * b1 + 4 * b2 + b3
+    computed from 2-bit codes of its bases. Stop codons are stored as '*'.
+
+    Arguments:
+        codon_map (dict): codon as a key and amino acid as an item
+        bases (str): four bases in the order of their codes
+
+    Returns:
+        codon_table (str): amino acids ordered by codon codes
+    """
+    codon_table = ""
+    for first in bases:
+        for second in bases:
+            for third in bases:
+                amino_acid = codon_map[first + second + third]
+                codon_table += '*' if amino_acid == "STOP" else amino_acid
+    return codon_table
+
+
+@lru_cache
+def _codon_lookup(codon_table):
+    """
+    This function maps every encoded codon (3 bytes of 2-bit codes) to
+    its amino acid from a codon table
+
+    Arguments:
+        codon_table (str): table created by _codon_table
+
+    Returns:
+        codon_lookup (dict): encoded codon as a key and amino acid as
+            an item
+    """
+    return {bytes((index >> 4, (index >> 2) & 3, index & 3)): amino_acid
+            for index, amino_acid in enumerate(codon_table)}
+
+
+def _translate_codes(codes, codon_table, use_numpy=False):
+    """
+    This function translates every complete codon of an encoded strand
+    at once. Stop codons are translated to '*' and codons containing
+    an invalid base to '?'.
+
+    Arguments:
+        codes (bytes): strand encoded by _encode_bases
+        codon_table (str): table created by _codon_table
+        use_numpy (bool): If True and NumPy is available, codon indices
+            are computed for the whole strand as a uint8 array
+
+    Returns:
+        amino_acids (str): one character for every complete codon
+    """
+    codons_end = len(codes) - len(codes) % 3
+
+    if use_numpy and np is not None:
+        codons = np.frombuffer(codes, dtype=np.uint8)[:codons_end]
+        codons = codons.reshape(-1, 3)
+        indices = (codons[:, 0] << 4) | (codons[:, 1] << 2) | codons[:, 2]
+        indices[(codons > 3).any(axis=1)] = 64
+        lookup = np.frombuffer((codon_table + '?').encode('ascii'),
+                               dtype=np.uint8)
+        return lookup[indices].tobytes().decode('ascii')
+
+    lookup = _codon_lookup(codon_table)
+    return ''.join([lookup.get(codes[i:i + 3], '?')
+                    for i in range(0, codons_end, 3)])
+
+
 class Sequence:
-    valid_chars = set('')
+    validator = AlphabetValidator.for_alphabet('')
+    valid_chars = validator.alphabet
+    packed_bases = None
 
     def __init__(self, data, identifier):
         self.identifier = identifier
         self.data = data
+        self._index = None
+        self._indexed_data = None
+        self._statistics = None
+
+    @property
+    def data(self):
+        """
+        This function returns data of the sequence
+
+        Returns:
+            self._data (str or PackedSequence): the strand
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        """
+        This function stores data of the sequence and validates it once,
+        so that methods do not have to check every base again. Invalid
+        data is accepted, but methods that require a valid sequence
+        raise ValueError for it.
+
+        Arguments:
+            data (str, PackedSequence or MappedSequence): the strand
+        """
+        self._data = data
+        if isinstance(data, PackedSequence):
+            self._validated = self.valid_chars.issuperset(data.bases)
+        elif isinstance(data, MappedSequence):
+            # reading a mapped strand is deferred until it is needed
+            self._validated = None
+        else:
+            self._validated = self.validator(data)
+
+    @property
+    def validated(self):
+        """
+        This function returns whether data of the sequence is valid.
+        A strand mapped from a file is validated on the first request.
+
+        Returns:
+            bool: True if all characters of data are valid
+        """
+        if self._validated is None:
+            self._validated = self.validator(str(self._data))
+        return self._validated
 
     def __len__(self):
         """
@@ -44,57 +271,261 @@ class Sequence:
                 or not isinstance(position, int)):
             raise ValueError("Invalid position provided")
 
-        for base in value:
-            if base not in self.valid_chars:
-                raise ValueError("Invalid value provided")
+        if not self.validator(value):
+            raise ValueError("Invalid value provided")
 
         data_mutated = self.data[:position] + value + self.data[position:]
         return data_mutated
 
+    def mutation_log(self):
+        """
+        This function creates an empty log of mutations of the sequence,
+        in which many insertions, substitutions and deletions can be
+        recorded without copying the sequence
 
-class DNASequence(Sequence):
-
-    def __init__(self, data, identifier):
-        super().__init__(data, identifier)
-        self.valid_chars = set('ACTG')
+        Returns:
+            log (MutationLog): log bound to the data of the sequence
+        """
+        return MutationLog(self.data, self.valid_chars)
 
-    def find_motif(self, motif):
+    def mutate_many(self, mutations):
         """
-        This function finds positions of the given motifs in a
-        DNA sequence
+        This function applies many mutations to the sequence at once.
+        Positions of all mutations refer to the original sequence and the
+        mutated strand is built only once.
 
         Arguments:
-            motif: motif that has to be found in the strand
+            mutations (iterable): tuples (kind, position, value), where
+                kind is 'insert', 'substitute' or 'delete' and value is
+                the number of deleted bases for deletions
 
         Returns:
-            motif_positions (list of tuples): a list of positions
-                where a given motif occurs
+            data_mutated (str): Mutated strand
+
+        Raises:
+            ValueError: If any position or value is invalid or
+                        substitutions and deletions overlap
+        """
+        data_mutated = self.mutation_log().apply(mutations).materialize()
+        return data_mutated
+
+    def _check_motif(self, motif):
+        """
+        This function checks that a motif consists of valid chars
+
+        Arguments:
+            motif (str): motif to be checked
 
         Raises:
             ValueError: If the invalid motif was provided
         """
+        if not self.validator(motif):
+            raise ValueError("Invalid motif provided.")
+
+    def _find_motif(self, motif):
+        """
+        This function finds positions of a motif, also overlapping ones.
+        If an index of the sequence was built, it is used instead of
+        scanning the sequence.
+
+        Arguments:
+            motif (str): motif that has to be found in the strand
+
+        Returns:
+            motif_positions (list of tuples): a list of positions
+                where a given motif occurs
+        """
+        motif_end = len(motif) - 1
 
-        for char in motif:
-            if char not in self.valid_chars:
-                raise ValueError("Invalid motif provided.")
+        if motif and self._indexed_data is self.data:
+            return [(start, start + motif_end)
+                    for start in self._index.find(motif)]
 
-        motif_length = len(motif)
+        data = str(self.data)
         motif_positions = []
+        start = data.find(motif)
 
-        for i in range(len(self.data) - motif_length + 1):
-            if self.data[i:i + motif_length] == motif:
-                motif_start_pos = i
-                motif_end_pos = i + motif_length - 1
-                occurrence = (motif_start_pos, motif_end_pos)
-                motif_positions.append(occurrence)
+        while start != -1:
+            motif_positions.append((start, start + motif_end))
+            start = data.find(motif, start + 1)
 
         return motif_positions
 
-    def complement(self):
+    def build_index(self):
+        """
+        This function builds a suffix array of the sequence, which is
+        then used by find_motif, so that repeated searches on the same
+        sequence do not scan it again. The index is rebuilt if the data
+        of the sequence was replaced.
+
+        Returns:
+            index (SuffixArray): index of the sequence
+        """
+        if self._indexed_data is not self.data:
+            self._index = SuffixArray(str(self.data))
+            self._indexed_data = self.data
+        return self._index
+
+    def find_motifs(self, motifs):
+        """
+        This function finds positions of many motifs in a single pass
+        over the sequence with an Aho-Corasick automaton
+
+        Arguments:
+            motifs (iterable or AhoCorasick): motifs that have to be
+                found in the strand or an automaton already built from
+                them, which can be reused for many sequences
+
+        Returns:
+            motif_positions (dict): motif as a key and a list of tuples
+                (start, end) of its occurrences as an item, the same as
+                returned by find_motif
+
+        Raises:
+            ValueError: If any invalid motif was provided
+        """
+        if not isinstance(motifs, AhoCorasick):
+            motifs = list(motifs)
+            for motif in motifs:
+                self._check_motif(motif)
+            motifs = AhoCorasick(motifs)
+
+        return motifs.find_all(str(self.data))
+
+    def align(self, other, local=False, band=None, match=1, mismatch=-1,
+              gap=-1, use_numpy=False):
+        """
+        This function aligns the sequence with another one of the same
+        type, globally or locally, in memory linear in their lengths
+
+        Arguments:
+            other (Sequence): sequence of the same type
+            local (bool): If True, the best local alignment is found
+            band (int): If provided, a global alignment with no character
+                shifted by more than band positions from the diagonal is
+                found, which is much faster for similar sequences
+            match, mismatch, gap (int or float): scores of identical
+                characters, different characters and a gap
+            use_numpy (bool): If True, NumPy is used (when it is
+                installed)
+
+        Returns:
+            alignment (Alignment): the optimal alignment
+
+        Raises:
+            ValueError: If the sequences are of different types, band is
+                combined with local alignment or any argument is invalid
+        """
+        if type(other) is not type(self):
+            raise ValueError("Only sequences of the same type can be"
+                             " aligned.")
+
+        first, second = str(self.data), str(other.data)
+
+        if band is not None:
+            if local:
+                raise ValueError("Banded alignment has to be global.")
+            return banded_alignment(first, second, band, match, mismatch,
+                                    gap)
+
+        method = local_alignment if local else global_alignment
+        return method(first, second, match, mismatch, gap, use_numpy)
+
+    def statistics(self, use_numpy=False):
+        """
+        This function returns statistics of the sequence (composition,
+        GC content, GC skew) for any window. Prefix sums behind them are
+        built once and kept until the data of the sequence is replaced.
+
+        Arguments:
+            use_numpy (bool): If True, NumPy arrays are used (when NumPy
+                is installed)
+
+        Returns:
+            statistics (SequenceStatistics): statistics of the sequence
+        """
+        key = (self.data, use_numpy and np is not None)
+
+        if (self._statistics is None or self._statistics[0][0] is not key[0]
+                or self._statistics[0][1] != key[1]):
+            self._statistics = (key, SequenceStatistics(self.data,
+                                                        use_numpy))
+        return self._statistics[1]
+
+    def pack(self):
+        """
+        This function creates a copy of a nucleotide sequence, which
+        stores its bases as 2-bit codes instead of a string
+
+        Returns:
+            An object of the same class with data of type PackedSequence
+
+        Raises:
+            ValueError: If the sequence cannot be packed (it is not
+                a nucleotide sequence or contains invalid bases)
+        """
+        if self.packed_bases is None:
+            raise ValueError("Only nucleotide sequences can be packed.")
+
+        if isinstance(self.data, PackedSequence):
+            packed_data = self.data
+        else:
+            # str() reads a MappedSequence of a stored record
+            packed_data = PackedSequence(str(self.data), self.packed_bases)
+
+        return type(self)(packed_data, self.identifier)
+
+
+class DNASequence(Sequence):
+    validator = AlphabetValidator.for_alphabet('ACGT')
+    valid_chars = validator.alphabet
+    packed_bases = b'ACGT'
+    complement_table = _complement_table(b'ACGT', b'TGCA')
+    base_codes = _base_code_table(b'TCAG')
+    # with the TCAG order of codes, complementary bases differ by 2
+    complement_codes = bytes(code ^ 2 for code in range(256))
+
+    def find_motif(self, motif, max_mismatches=0, indels=False):
+        """
+        This function finds positions of the given motifs in a
+        DNA sequence. Occurrences with errors (e.g. of primers or probes)
+        are found with bit-parallel algorithms in a single pass over the
+        strand, whatever the number of allowed errors is.
+
+        Arguments:
+            motif: motif that has to be found in the strand
+            max_mismatches (int): maximal number of errors in an
+                occurrence, only exact occurrences are found by default
+            indels (bool): If True, insertions and deletions are counted
+                as errors too (edit distance), otherwise only
+                substitutions are allowed
+
+        Returns:
+            motif_positions (list of tuples): a list of positions
+                where a given motif occurs, tuples (start, end, errors)
+                if any errors are allowed
+
+        Raises:
+            ValueError: If the invalid motif or number of errors was
+                provided
+        """
+        self._check_motif(motif)
+
+        if not max_mismatches and not indels:
+            return self._find_motif(motif)
+
+        search = find_edits if indels else find_mismatches
+        return search(str(self.data), motif, max_mismatches)
+
+    def complement(self, use_numpy=False):
         """
         This function creates a complementary DNA strand to the
             provided one
 
+        Arguments:
+            use_numpy (bool): If True, NumPy is used for the translation
+                (when it is installed)
+
         Returns:
             comp_data (str): A complementary strand
 
@@ -102,24 +533,32 @@ class DNASequence(Sequence):
             ValueError: If any base of the origin strand does not belong
                 to valid chars
         """
-        comp_data = ""
-        for base in self.data:
-            if base not in self.valid_chars:
-                raise ValueError("Invalid value provided.")
-
-            if base == 'A':
-                comp_data += 'T'
+        comp_data = _translate_strand(str(self.data),
+                                      self.complement_table,
+                                      use_numpy=use_numpy)
+        return comp_data
 
-            elif base == 'T':
-                comp_data += 'A'
+    def reverse_complement(self, use_numpy=False):
+        """
+        This function creates a reverse complementary DNA strand to the
+            provided one, which is the other strand read in 5' to 3'
+            direction
 
-            elif base == 'C':
-                comp_data += 'G'
+        Arguments:
+            use_numpy (bool): If True, NumPy is used for the translation
+                (when it is installed)
 
-            elif base == 'G':
-                comp_data += 'C'
+        Returns:
+            rev_comp_data (str): A reverse complementary strand
 
-        return comp_data
+        Raises:
+            ValueError: If any base of the origin strand does not belong
+                to valid chars
+        """
+        rev_comp_data = _translate_strand(str(self.data),
+                                          self.complement_table,
+                                          reverse=True, use_numpy=use_numpy)
+        return rev_comp_data
 
     def transcribe(self):
         """
@@ -132,16 +571,84 @@ class DNASequence(Sequence):
             ValueError: If any base of the origin strand does not belong
                 to valid chars
         """
-        for base in self.data:
-            if base not in self.valid_chars:
-                raise ValueError("Invalid value provided.")
+        if not self.validated:
+            raise ValueError("Invalid value provided.")
 
-        transcribed_sequence = self.data.replace('T', 'U')
+        transcribed_sequence = str(self.data).replace('T', 'U')
 
         return RNASequence(transcribed_sequence, self.identifier)
 
+    def kmer_counts(self, k, canonical=False, use_numpy=False):
+        """
+        This function counts all k-mers (substrings of length k) of the
+        strand. k-mers are tracked as 2-bit encoded integers with
+        a rolling hash, so no string is created for any position.
+
+        Arguments:
+            k (int): length of k-mers, from 1 to 32
+            canonical (bool): If True, a k-mer and its reverse complement
+                are counted together under the smaller of them
+            use_numpy (bool): If True, NumPy is used for counting
+                (when it is installed)
+
+        Returns:
+            counts (dict): k-mer as a key and number of its occurrences
+                as an item
+
+        Raises:
+            TypeError: If k is not an integer
+            ValueError: If k is out of range or any base of the strand
+                does not belong to valid chars
+        """
+        if not self.validated:
+            raise ValueError("Invalid value provided.")
+
+        counts = kmer_counts(str(self.data), k, canonical, use_numpy)
+        return counts
+
+    def six_frame_translation(self, use_numpy=False):
+        """
+        This function translates the strand in all six reading frames:
+        three frames of the strand and three frames of its reverse
+        complement. The strand is encoded only once and the reverse
+        complement is derived from the codes. Every complete codon is
+        translated and stop codons are marked with '*'.
+
+        Arguments:
+            use_numpy (bool): If True, NumPy is used for the translation
+                (when it is installed)
+
+        Returns:
+            frames (dict): frame (1, 2, 3 for the strand and -1, -2, -3
+                for the reverse complement) as a key and translated
+                frame (str) as an item
+
+        Raises:
+            ValueError: If any base of the origin strand does not belong
+                to valid chars
+        """
+        if not self.validated:
+            raise ValueError("Invalid value provided.")
+
+        codes = _encode_bases(str(self.data), self.base_codes)
+
+        reverse_codes = codes[::-1].translate(self.complement_codes)
+        codon_table = RNASequence.codon_table
+        frames = {}
+
+        for frame in range(3):
+            frames[frame + 1] = _translate_codes(codes[frame:], codon_table,
+                                                 use_numpy)
+        for frame in range(3):
+            frames[-frame - 1] = _translate_codes(reverse_codes[frame:],
+                                                  codon_table, use_numpy)
+
+        return frames
+
 
 class RNASequence(Sequence):
+    validator = AlphabetValidator.for_alphabet('ACGU')
+    valid_chars = validator.alphabet
     codon_map = {
         "UUU": "F", "UUC": "F", "UUA": "L", "UUG": "L",
         "UCU": "S", "UCC": "S", "UCA": "S", "UCG": "S",
@@ -160,16 +667,20 @@ class RNASequence(Sequence):
         "GAU": "D", "GAC": "D", "GAA": "E", "GAG": "E",
         "GGU": "G", "GGC": "G", "GGA": "G", "GGG": "G"
     }
+    codon_table = _codon_table(codon_map, 'UCAG')
+    packed_bases = b'ACGU'
+    base_codes = _base_code_table(b'UCAG')
+    complement_table = _complement_table(b'ACGU', b'UGCA')
 
-    def __init__(self, data, identifier):
-        super().__init__(data, identifier)
-        self.valid_chars = set('ACUG')
-
-    def complement(self):
+    def complement(self, use_numpy=False):
         """
         This function creates a complementary RNA strand to the
             provided one
 
+        Arguments:
+            use_numpy (bool): If True, NumPy is used for the translation
+                (when it is installed)
+
         Returns:
             comp_data (str): A complementary strand
 
@@ -177,28 +688,43 @@ class RNASequence(Sequence):
             ValueError: If any base of the origin strand does not belong
                 to valid chars
         """
-        comp_data = ""
-        for base in self.data:
-            if base not in self.valid_chars:
-                raise ValueError("Invalid value provided.")
-
-            if base == 'A':
-                comp_data += 'U'
+        comp_data = _translate_strand(str(self.data),
+                                      self.complement_table,
+                                      use_numpy=use_numpy)
+        return comp_data
 
-            elif base == 'U':
-                comp_data += 'A'
+    def reverse_complement(self, use_numpy=False):
+        """
+        This function creates a reverse complementary RNA strand to the
+            provided one, which is the other strand read in 5' to 3'
+            direction
 
-            elif base == 'C':
-                comp_data += 'G'
+        Arguments:
+            use_numpy (bool): If True, NumPy is used for the translation
+                (when it is installed)
 
-            elif base == 'G':
-                comp_data += 'C'
+        Returns:
+            rev_comp_data (str): A reverse complementary strand
 
-        return comp_data
+        Raises:
+            ValueError: If any base of the origin strand does not belong
+                to valid chars
+        """
+        rev_comp_data = _translate_strand(str(self.data),
+                                          self.complement_table,
+                                          reverse=True, use_numpy=use_numpy)
+        return rev_comp_data
 
-    def translate(self):
+    def translate(self, use_numpy=False):
         """
-        This function translates RNA strand to a protein sequence
+        This function translates RNA strand to a protein sequence. All
+        codons are translated at once with a table indexed by 2-bit
+        codes of their bases and the result is cut at the first
+        stop codon.
+
+        Arguments:
+            use_numpy (bool): If True, NumPy is used for the translation
+                (when it is installed)
 
         Returns:
             translated_sequence - an object of class ProteinSequence
@@ -207,32 +733,25 @@ class RNASequence(Sequence):
             ValueError: If any codon of the origin strand does not belong
                 to codons map
         """
-        codons = []
+        codes = _encode_bases(str(self.data), self.base_codes)
+        translated_sequence = _translate_codes(codes, self.codon_table,
+                                               use_numpy)
+        stop = translated_sequence.find('*')
 
-        for i in range(0, len(self.data), 3):
-            codon = self.data[i: i + 3]
-            codons.append(codon)
+        if stop != -1:
+            translated_sequence = translated_sequence[:stop]
+        elif len(self.data) % 3:
+            raise ValueError("Invalid codon found in the sequence.")
 
-        translated_sequence = ""
-
-        for codon in codons:
-            if codon not in self.codon_map:
-                raise ValueError("Invalid codon found in the sequence.")
-
-            if codon in self.codon_map:
-                amino_acid = self.codon_map[codon]
-                if amino_acid == "STOP":
-                    break
-                translated_sequence += amino_acid
+        if '?' in translated_sequence:
+            raise ValueError("Invalid codon found in the sequence.")
 
         return ProteinSequence(translated_sequence, self.identifier)
 
 
 class ProteinSequence(Sequence):
-
-    def __init__(self, data, identifier):
-        super().__init__(data, identifier)
-        self.valid_chars = set('ACDEFGHIKLMNPQRSTVWY')
+    validator = AlphabetValidator.for_alphabet('ACDEFGHIKLMNPQRSTVWY')
+    valid_chars = validator.alphabet
 
     def find_motif(self, motif):
         """
@@ -249,21 +768,8 @@ class ProteinSequence(Sequence):
         Raises:
             ValueError: If the invalid motif was provided
         """
-        for char in motif:
-            if char not in self.valid_chars:
-                raise ValueError("Invalid motif provided.")
-
-        motif_length = len(motif)
-        motif_positions = []
-
-        for i in range(len(self.data) - motif_length + 1):
-            if self.data[i:i + motif_length] == motif:
-                motif_start_pos = i
-                motif_end_pos = i + motif_length - 1
-                occurrence = (motif_start_pos, motif_end_pos)
-                motif_positions.append(occurrence)
-
-        return motif_positions
+        self._check_motif(motif)
+        return self._find_motif(motif)
 
 
 if __name__ == '__main__':
@@ -292,6 +798,10 @@ if __name__ == '__main__':
     print(f"Complementary strand to the provided one:"
           f" {comp_strand_dna} \n")
 
+    rev_comp_strand_dna = DNASequence.reverse_complement(dna_strand)
+    print(f"Reverse complementary strand to the provided one:"
+          f" {rev_comp_strand_dna} \n")
+
     transcribed_strand_dna = DNASequence.transcribe(dna_strand)
     print(f"This strand transcribed to RNA is:"
           f" \n {transcribed_strand_dna} \n")
@@ -0,0 +1,481 @@
+"""
+Module containing calculus on polynomials given by lists of coefficients
+(from the highest power to the constant term): derivatives, integrals,
+complex roots found as eigenvalues of the companion matrix and polished
+with Newton's method, and real roots isolated exactly with Sturm
+sequences. Batched versions process many polynomials of equal degree
+stored as rows of a 2-D NumPy array.
+"""
+from fractions import Fraction
+
+from division import normalize, poly_divmod, poly_gcd
+from evaluation import horner
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# number of Newton's steps polishing every root
+NEWTON_STEPS = 3
+# iterations of the Durand-Kerner method used without NumPy
+DURAND_KERNER_ITERATIONS = 500
+
+
+def divide_exactly(coefficient, divisor):
+    """
+    This function divides a coefficient by an integer, keeping integers
+    and fractions exact
+
+    Arguments:
+        coefficient (int, float or Fraction): dividend
+        divisor (int): non-zero divisor
+
+    Returns:
+        quotient: an integer if the division is exact, a fraction for
+            other integers and fractions, otherwise a float
+    """
+    if isinstance(coefficient, (int, Fraction)):
+        result = Fraction(coefficient, divisor)
+        return int(result) if result.denominator == 1 else result
+    return coefficient / divisor
+
+
+def derivative(coefficients):
+    """
+    This function differentiates a polynomial
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+
+    Returns:
+        coefficients (list): coefficients of the derivative, [0] for
+            a constant polynomial
+    """
+    degree = len(coefficients) - 1
+    if degree < 1:
+        return [0]
+    return [coefficient * (degree - i)
+            for i, coefficient in enumerate(coefficients[:-1])]
+
+
+def integral(coefficients, constant=0):
+    """
+    This function integrates a polynomial. Integer coefficients which are
+    not divisible by their new exponents become fractions.
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        constant: constant term of the integral
+
+    Returns:
+        coefficients (list): coefficients of the integral
+    """
+    degree = len(coefficients) - 1
+    return [divide_exactly(coefficient, degree - i + 1)
+            for i, coefficient in enumerate(coefficients)] + [constant]
+
+
+def _polish(coefficients, roots):
+    """
+    This function improves roots with a few steps of Newton's method,
+    rejecting steps which do not decrease the absolute value of the
+    polynomial (e.g. close to multiple roots)
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        roots (list): approximations of roots
+
+    Returns:
+        roots (list): polished roots
+    """
+    slope = derivative(coefficients)
+    polished = []
+    for root in roots:
+        value = horner(coefficients, root)
+        for _ in range(NEWTON_STEPS):
+            step_slope = horner(slope, root)
+            if value == 0 or step_slope == 0:
+                break
+            candidate = root - value / step_slope
+            candidate_value = horner(coefficients, candidate)
+            if abs(candidate_value) >= abs(value):
+                break
+            root, value = candidate, candidate_value
+        polished.append(root)
+    return polished
+
+
+def _durand_kerner(coefficients):
+    """
+    This function finds all roots simultaneously with the Durand-Kerner
+    method (used if NumPy is not available)
+
+    Arguments:
+        coefficients (list): coefficients from the highest power, the
+            degree is at least 1
+
+    Returns:
+        roots (list): complex approximations of roots
+    """
+    monic = [complex(coefficient) / coefficients[0]
+             for coefficient in coefficients]
+    roots = [(0.4 + 0.9j) ** i for i in range(len(monic) - 1)]
+
+    for _ in range(DURAND_KERNER_ITERATIONS):
+        changed = False
+        for i, root in enumerate(roots):
+            denominator = 1
+            for j, other in enumerate(roots):
+                if i != j:
+                    denominator *= root - other
+            if denominator == 0:
+                denominator = 1e-12
+            new_root = root - horner(monic, root) / denominator
+            changed = changed or abs(new_root - root) > 1e-15 * abs(root)
+            roots[i] = new_root
+        if not changed:
+            break
+
+    return roots
+
+
+def companion_matrix(coefficients):
+    """
+    This function builds the companion matrix of a polynomial, whose
+    eigenvalues are its roots
+
+    Arguments:
+        coefficients (list): coefficients from the highest power, the
+            first one is not zero
+
+    Returns:
+        matrix (numpy.ndarray): square matrix of the size of the degree
+    """
+    degree = len(coefficients) - 1
+    matrix = np.zeros((degree, degree), dtype=np.result_type(
+        float, *coefficients))
+    matrix[0] = -np.asarray(coefficients[1:]) / coefficients[0]
+    matrix[np.arange(1, degree), np.arange(degree - 1)] = 1
+    return matrix
+
+
+def roots(coefficients, polish=True):
+    """
+    This function finds all complex roots of a polynomial (repeated
+    according to their multiplicities) as eigenvalues of the companion
+    matrix, polished with Newton's method. Zero roots are factored out
+    exactly. Without NumPy the Durand-Kerner method is used.
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        polish (bool): If True, roots are polished with Newton's method
+
+    Returns:
+        roots (list): complex roots sorted by real and imaginary parts
+
+    Raises:
+        ValueError: If the polynomial is zero
+    """
+    coefficients = normalize(coefficients)
+    if not coefficients:
+        raise ValueError("The zero polynomial has infinitely many roots.")
+
+    zeros = 0
+    while coefficients[-1 - zeros] == 0:
+        zeros += 1
+    reduced = coefficients[:len(coefficients) - zeros]
+    found = []
+
+    if len(reduced) > 1:
+        if np is not None:
+            found = np.linalg.eigvals(companion_matrix(
+                [float(value) for value in reduced])).tolist()
+        else:
+            found = _durand_kerner(reduced)
+        if polish:
+            found = _polish([float(value) for value in reduced], found)
+
+    found = [complex(root) for root in found] + [0j] * zeros
+    return sorted(found, key=lambda root: (root.real, root.imag))
+
+
+def _exact(coefficients):
+    """
+    This function converts coefficients to normalized fractions, which
+    represent integers and floats exactly
+    """
+    return normalize([Fraction(value) for value in coefficients])
+
+
+def sturm_sequence(coefficients):
+    """
+    This function builds the Sturm sequence of a polynomial: p, p' and
+    the negated remainders of the Euclidean algorithm, computed exactly.
+    The number of distinct real roots in an interval (a, b] is the
+    difference of numbers of sign changes of the sequence at a and b.
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+
+    Returns:
+        sequence (list): coefficient lists of the sequence
+    """
+    sequence = [_exact(coefficients)]
+    sequence.append(normalize(derivative(sequence[0])))
+    while sequence[-1] and len(sequence[-1]) > 1:
+        remainder = poly_divmod(sequence[-2], sequence[-1])[1]
+        if not remainder:
+            break
+        sequence.append([-value for value in remainder])
+    return [polynomial for polynomial in sequence if polynomial]
+
+
+def sign_changes(sequence, x):
+    """
+    This function counts sign changes of a Sturm sequence at a point,
+    ignoring zeros
+
+    Arguments:
+        sequence (list): coefficient lists
+        x: point
+
+    Returns:
+        int: number of sign changes
+    """
+    changes = 0
+    previous = 0
+    for polynomial in sequence:
+        value = horner(polynomial, x)
+        if value:
+            if previous and (value > 0) != (previous > 0):
+                changes += 1
+            previous = value
+    return changes
+
+
+def _square_free(coefficients):
+    """
+    This function removes repeated factors of a polynomial dividing it by
+    the GCD with its derivative, so its roots become simple
+
+    Arguments:
+        coefficients (list): exact normalized coefficients
+
+    Returns:
+        coefficients (list): coefficients of the square-free part
+    """
+    common = poly_gcd(coefficients, derivative(coefficients))
+    if len(common) <= 1:
+        return coefficients
+    return poly_divmod(coefficients, common)[0]
+
+
+def _isolate(polynomial):
+    """
+    This function isolates roots of the square-free part of a polynomial
+
+    Arguments:
+        polynomial (list): exact normalized coefficients
+
+    Returns:
+        square_free, intervals (tuple): coefficients of the square-free
+            part and sorted intervals (a, b] with exactly one root
+    """
+    if not polynomial:
+        raise ValueError("The zero polynomial has infinitely many roots.")
+    if len(polynomial) == 1:
+        return polynomial, []
+
+    polynomial = _square_free(polynomial)
+    sequence = sturm_sequence(polynomial)
+    bound = 1 + max(abs(value / polynomial[0]) for value in polynomial[1:])
+
+    intervals = []
+    pending = [(-bound, bound, sign_changes(sequence, -bound),
+                sign_changes(sequence, bound))]
+    while pending:
+        low, high, low_changes, high_changes = pending.pop()
+        count = low_changes - high_changes
+        if count == 1:
+            intervals.append((low, high))
+        elif count > 1:
+            middle = (low + high) / 2
+            middle_changes = sign_changes(sequence, middle)
+            pending.append((low, middle, low_changes, middle_changes))
+            pending.append((middle, high, middle_changes, high_changes))
+
+    return polynomial, sorted(intervals)
+
+
+def isolate_real_roots(coefficients):
+    """
+    This function isolates distinct real roots of a polynomial: the
+    interval bounding all roots (Cauchy's bound) is bisected until every
+    part contains exactly one root according to the Sturm sequence of
+    the square-free part of the polynomial
+
+    Arguments:
+        coefficients (list): real coefficients from the highest power
+
+    Returns:
+        intervals (list): sorted pairs (a, b) of fractions, every
+            interval (a, b] contains exactly one root
+
+    Raises:
+        ValueError: If the polynomial is zero
+    """
+    return _isolate(_exact(coefficients))[1]
+
+
+def real_roots(coefficients, tolerance=1e-12):
+    """
+    This function finds distinct real roots of a polynomial: they are
+    isolated with the Sturm sequence and refined by bisection of their
+    intervals, which is exact for integer and fractional coefficients
+
+    Arguments:
+        coefficients (list): real coefficients from the highest power
+        tolerance (float): maximal width of the final intervals
+
+    Returns:
+        roots (list): sorted real roots (floats)
+
+    Raises:
+        ValueError: If the polynomial is zero
+    """
+    polynomial, intervals = _isolate(_exact(coefficients))
+
+    found = []
+    for low, high in intervals:
+        # the only root is simple, so the sign at high holds between it
+        # and high, and the opposite one between low and the root
+        high_value = horner(polynomial, high)
+        high_sign = high_value > 0
+        if high_value == 0:
+            low = high
+        while high - low > tolerance:
+            middle = (low + high) / 2
+            value = horner(polynomial, middle)
+            if value == 0:
+                low = high = middle
+            elif (value > 0) == high_sign:
+                high = middle
+            else:
+                low = middle
+        found.append(float((low + high) / 2))
+    return found
+
+
+def batch_derivative(matrix):
+    """
+    This function differentiates many polynomials at once
+
+    Arguments:
+        matrix (numpy.ndarray): 2-D array, every row holds coefficients
+            of a polynomial from the highest power
+
+    Returns:
+        matrix (numpy.ndarray): coefficients of derivatives, one column
+            fewer (a zero column for constant polynomials)
+    """
+    matrix = np.asarray(matrix)
+    degree = matrix.shape[1] - 1
+    if degree < 1:
+        return np.zeros_like(matrix)
+    return matrix[:, :-1] * np.arange(degree, 0, -1)
+
+
+def batch_integral(matrix, constant=0):
+    """
+    This function integrates many polynomials at once (in floating point)
+
+    Arguments:
+        matrix (numpy.ndarray): 2-D array, every row holds coefficients
+            of a polynomial from the highest power
+        constant: constant term of all integrals, or an array with one
+            for every row
+
+    Returns:
+        matrix (numpy.ndarray): coefficients of integrals, one column
+            more
+    """
+    matrix = np.asarray(matrix)
+    degree = matrix.shape[1] - 1
+    result = np.empty((matrix.shape[0], degree + 2),
+                      dtype=np.result_type(float, matrix))
+    result[:, :-1] = matrix / np.arange(degree + 1, 0, -1)
+    result[:, -1] = constant
+    return result
+
+
+def batch_roots(matrix, polish=True):
+    """
+    This function finds roots of many polynomials of equal degree at
+    once: companion matrices of all rows are stacked into a 3-D array,
+    whose eigenvalues are computed with one call, and Newton's steps are
+    applied to all roots at once
+
+    Arguments:
+        matrix (numpy.ndarray): 2-D array, every row holds coefficients
+            of a polynomial from the highest power
+        polish (bool): If True, roots are polished with Newton's method
+
+    Returns:
+        roots (numpy.ndarray): complex array with one row of roots for
+            every polynomial
+
+    Raises:
+        ValueError: If the matrix is not 2-D or any leading coefficient
+            is zero
+    """
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2:
+        raise ValueError("Invalid input. Coefficients have to be"
+                         " a 2-D array.")
+    if np.any(matrix[:, 0] == 0):
+        raise ValueError("Invalid input. Leading coefficients cannot be"
+                         " zero.")
+
+    count, degree = matrix.shape[0], matrix.shape[1] - 1
+    if degree < 1:
+        return np.zeros((count, 0), dtype=complex)
+
+    companions = np.zeros((count, degree, degree),
+                          dtype=np.result_type(float, matrix))
+    companions[:, 0, :] = -matrix[:, 1:] / matrix[:, :1]
+    companions[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+    found = np.linalg.eigvals(companions).astype(complex)
+
+    if polish:
+        slope = batch_derivative(matrix)
+        for _ in range(NEWTON_STEPS):
+            value = np.zeros_like(found)
+            for column in range(degree + 1):
+                value = value * found + matrix[:, column:column + 1]
+            step_slope = np.zeros_like(found)
+            for column in range(degree):
+                step_slope = (step_slope * found
+                              + slope[:, column:column + 1])
+            safe = step_slope != 0
+            step = np.divide(value, step_slope, out=np.zeros_like(found),
+                             where=safe)
+            candidate = found - step
+            candidate_value = np.zeros_like(found)
+            for column in range(degree + 1):
+                candidate_value = (candidate_value * candidate
+                                   + matrix[:, column:column + 1])
+            better = np.abs(candidate_value) < np.abs(value)
+            found = np.where(better, candidate, found)
+
+    order = np.lexsort((found.imag, found.real), axis=-1)
+    return np.take_along_axis(found, order, axis=-1)
+
+
+if __name__ == '__main__':
+    polynomial = [1, 0, -3, 2]
+
+    print(f"Derivative of x^3 - 3x + 2: {derivative(polynomial)}")
+    print(f"Integral of x^3 - 3x + 2: {integral(polynomial)}")
+    print(f"Roots of x^3 - 3x + 2: {roots(polynomial)}")
+    print(f"Real roots of x^3 - 3x + 2: {real_roots(polynomial)}")
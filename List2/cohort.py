@@ -0,0 +1,299 @@
+"""
+Module containing a columnar store of patients: names, years of birth,
+heights and weights of a whole cohort are kept in columns (NumPy arrays
+for numbers and a list of interned strings for names), so ages, BMIs,
+target heart rates and risk checks are computed for all patients at once
+"""
+import sys
+from datetime import date
+
+from health_profile import (AGE_RANGE, HEIGHT_RANGE, WEIGHT_RANGE,
+                            HealthProfile)
+from running_statistics import RunningStatistics
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Cohort:
+    """
+    This class represents a cohort of patients stored in columns. Single
+    patients are available as HealthProfile views of rows, which read
+    and write the columns.
+    """
+
+    def __init__(self, names, dob, height, weight):
+        """
+        This function creates a cohort from its columns
+
+        Arguments:
+            names (iterable): names of patients
+            dob (array-like): years of birth (integers)
+            height (array-like): heights in cm (integers)
+            weight (array-like): weights in kg (integers)
+
+        Raises:
+            ValueError: If NumPy is not available, a numeric column does
+                not hold integers, a name is not a string or columns have
+                different lengths
+        """
+        if np is None:
+            raise ValueError("Cohort requires NumPy.")
+
+        self.names = []
+        for name in names:
+            if not isinstance(name, str):
+                raise ValueError("Name has to be a string.")
+            self.names.append(sys.intern(name))
+
+        columns = []
+        for column in (dob, height, weight):
+            column = np.asarray(column)
+            if column.size == 0:
+                column = column.astype(np.int64)
+            if column.ndim != 1 or not np.issubdtype(column.dtype,
+                                                     np.integer):
+                raise ValueError("Invalid data provided, integer columns"
+                                 " expected.")
+            columns.append(column)
+
+        if any(len(column) != len(self.names) for column in columns):
+            raise ValueError("Columns have to be of equal length.")
+
+        self.dob, self.height, self.weight = columns
+
+    @classmethod
+    def from_profiles(cls, profiles):
+        """
+        This function creates a cohort from HealthProfile objects
+
+        Arguments:
+            profiles (iterable): patients
+
+        Returns:
+            Cohort: a new cohort
+
+        Raises:
+            ValueError: If data of any patient is not of a valid type
+        """
+        profiles = list(profiles)
+        return cls([profile.name for profile in profiles],
+                   [profile.dob for profile in profiles],
+                   [profile.height for profile in profiles],
+                   [profile.weight for profile in profiles])
+
+    @classmethod
+    def concatenate(cls, cohorts):
+        """
+        This function joins cohorts into one
+
+        Arguments:
+            cohorts (iterable): cohorts to join, in order
+
+        Returns:
+            Cohort: a new cohort with rows of all cohorts
+        """
+        cohorts = list(cohorts)
+        if not cohorts:
+            return cls([], [], [], [])
+        return cls([name for cohort in cohorts for name in cohort.names],
+                   np.concatenate([cohort.dob for cohort in cohorts]),
+                   np.concatenate([cohort.height for cohort in cohorts]),
+                   np.concatenate([cohort.weight for cohort in cohorts]))
+
+    def __len__(self):
+        """
+        This function returns the number of patients
+
+        Returns:
+            int: number of rows
+        """
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        This function returns a patient or a part of the cohort
+
+        Arguments:
+            index: number of a row, or a slice, a boolean mask or an array
+                of indices selecting rows
+
+        Returns:
+            HealthProfile or Cohort: a view of the row for a number,
+                otherwise a new cohort with copies of selected rows
+        """
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError("Cohort index out of range.")
+            return HealthProfile.view(self, int(index) % len(self))
+
+        rows = np.arange(len(self))[index]
+        return Cohort([self.names[row] for row in rows], self.dob[rows],
+                      self.height[rows], self.weight[rows])
+
+    def __iter__(self):
+        """
+        This function iterates over views of all patients
+
+        Returns:
+            Iterator of HealthProfile objects
+        """
+        return (HealthProfile.view(self, i) for i in range(len(self)))
+
+    def valid_ages(self, year=None):
+        """
+        This function checks ages of all patients
+
+        Arguments:
+            year (int): current year, this year by default
+
+        Returns:
+            mask (numpy.ndarray): boolean array, True for patients whose
+                age is valid
+        """
+        ages = (date.today().year if year is None else year) - self.dob
+        return (ages >= AGE_RANGE[0]) & (ages <= AGE_RANGE[1])
+
+    def valid_bmi(self):
+        """
+        This function checks heights and weights of all patients
+
+        Returns:
+            mask (numpy.ndarray): boolean array, True for patients whose
+                height and weight are valid
+        """
+        return ((self.weight >= WEIGHT_RANGE[0])
+                & (self.weight <= WEIGHT_RANGE[1])
+                & (self.height >= HEIGHT_RANGE[0])
+                & (self.height <= HEIGHT_RANGE[1]))
+
+    def get_ages(self, year=None):
+        """
+        This function calculates ages of all patients
+
+        Arguments:
+            year (int): current year, this year by default
+
+        Returns:
+            ages (numpy.ndarray): ages in years
+
+        Raises:
+            ValueError: If the age of any patient is invalid (see
+                valid_ages to select valid patients)
+        """
+        if not self.valid_ages(year).all():
+            raise ValueError("Provided age of some patients is"
+                             " impossible.")
+        return (date.today().year if year is None else year) - self.dob
+
+    def get_target_hr(self, year=None):
+        """
+        This function calculates target heart rates for
+        moderate-intensity of all patients
+
+        Arguments:
+            year (int): current year, this year by default
+
+        Returns:
+            target_hr (tuple): arrays of minimal and maximal target heart
+                rates
+
+        Raises:
+            ValueError: If the age of any patient is invalid
+        """
+        max_hr = 220 - self.get_ages(year)
+        return np.round(max_hr * 0.64, 2), np.round(max_hr * 0.76, 2)
+
+    def get_bmi(self):
+        """
+        This function calculates BMIs of all patients
+
+        Returns:
+            bmi (numpy.ndarray): BMIs rounded to 2 decimal places
+
+        Raises:
+            ValueError: If the height or the weight of any patient is
+                invalid (see valid_bmi to select valid patients)
+        """
+        if not self.valid_bmi().all():
+            raise ValueError("Height or weight of some patients is"
+                             " impossible.")
+        return np.round(self.weight / (self.height / 100) ** 2, 2)
+
+    def calculate_age_stats(self, year=None):
+        """
+        This function calculates mean and standard deviation of ages
+
+        Arguments:
+            year (int): current year, this year by default
+
+        Returns:
+            mean_age (float): mean age of patients
+            std_dev_age (float): sample standard deviation of ages
+
+        Raises:
+            ValueError: If there are fewer than two patients or the age of
+                any patient is invalid
+        """
+        if len(self) < 2:
+            raise ValueError("At least two patients are required.")
+        ages = self.get_ages(year)
+        return float(ages.mean()), float(ages.std(ddof=1))
+
+    def accumulate_age_stats(self, stats=None, year=None):
+        """
+        This function adds ages of the cohort to running statistics, so
+        statistics of cohorts loaded in parts can be combined
+
+        Arguments:
+            stats (RunningStatistics): statistics to update, new ones by
+                default
+            year (int): current year, this year by default
+
+        Returns:
+            stats (RunningStatistics): the updated statistics
+
+        Raises:
+            ValueError: If the age of any patient is invalid
+        """
+        if stats is None:
+            stats = RunningStatistics()
+        stats.update(self.get_ages(year))
+        return stats
+
+    def find_people_at_risk(self):
+        """
+        This function identifies patients with their BMI out of the
+        healthy range
+
+        Returns:
+            indices (numpy.ndarray): indices of patients at risk (empty if
+                all of them are in the healthy range)
+
+        Raises:
+            ValueError: If the height or the weight of any patient is
+                invalid
+        """
+        bmi = self.get_bmi()
+        low, high = HealthProfile.range_of_healthy_bmi
+        return np.flatnonzero((bmi < low) | (bmi > high))
+
+
+if __name__ == '__main__':
+    cohort = Cohort(["John Smith", "Michael Jackson", "Ricky Martin",
+                     "Lionel Messi", "Adam Malysz"],
+                    [2003, 1958, 1971, 1987, 1977],
+                    [189, 176, 174, 170, 170],
+                    [81, 70, 72, 72, 55])
+
+    print(f"Ages: {cohort.get_ages()}")
+    print(f"BMIs: {cohort.get_bmi()}")
+    mean_age, std_dev_age = cohort.calculate_age_stats()
+    print(f"Mean age: {mean_age:.2f}")
+    print(f"Standard deviation of age: {std_dev_age:.2f}")
+    print("\nPatients with out of range BMI: ")
+    for index in cohort.find_people_at_risk():
+        patient = cohort[index]
+        print(f"{patient.name}: {patient.get_bmi():.2f} BMI")
@@ -0,0 +1,370 @@
+"""
+Module with a chunked loader of cohorts of patients from CSV and Parquet
+files. Every chunk of rows is validated with vectorized checks of the
+same bounds that HealthProfile.get_age and HealthProfile.get_bmi
+enforce; valid rows form a Cohort and invalid ones are reported in
+a side table of rejected rows instead of raising an exception, so memory
+use depends only on the size of a chunk.
+"""
+import csv
+import os
+from itertools import islice
+
+from cohort import Cohort
+from health_profile import HEIGHT_RANGE, WEIGHT_RANGE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+COLUMNS = ('name', 'dob', 'height', 'weight')
+REJECTED_COLUMNS = ('row', 'reason') + COLUMNS
+FORMATS = ('csv', 'parquet')
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+CHUNK_SIZE = 100000
+# numbers with more digits cannot be valid and could overflow
+MAX_DIGITS = 9
+# longer fields (numbers with surrounding whitespace) are invalid, which
+# bounds the memory taken by strings of a chunk
+MAX_FIELD_LENGTH = 32
+DIGITS = '0123456789'
+
+
+def _column(values):
+    """
+    This function converts raw values of a column to an array. Strings
+    are kept in an object array, since an array of fixed-width strings
+    would take the width of the longest field for every row.
+
+    Arguments:
+        values (array-like): raw values
+
+    Returns:
+        column (numpy.ndarray): array of the values
+    """
+    if isinstance(values, np.ndarray):
+        return values
+    if not any(isinstance(value, str) for value in values):
+        return np.asarray(values)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _short(value):
+    """
+    This function checks whether a raw value could be a valid number,
+    i.e. it is not a string nor an integer too long to be one
+    """
+    if isinstance(value, str):
+        return len(value) <= MAX_FIELD_LENGTH
+    return not isinstance(value, int) or abs(value) < 10 ** MAX_DIGITS
+
+
+def _integers(column):
+    """
+    This function converts a column of raw values to integers
+
+    Arguments:
+        column (numpy.ndarray): integers, floats (e.g. with NaN for
+            missing values) or strings (in an object array)
+
+    Returns:
+        values, valid (tuple): int64 array (0 for invalid entries) and
+            a boolean mask of entries which are non-negative integers
+    """
+    if np.issubdtype(column.dtype, np.integer):
+        return column.astype(np.int64), np.ones(len(column), dtype=bool)
+
+    if np.issubdtype(column.dtype, np.floating):
+        valid = np.isfinite(column) & (np.abs(column) < 10 ** MAX_DIGITS)
+        valid[valid] = column[valid] == np.floor(column[valid])
+        return np.where(valid, column, 0).astype(np.int64), valid
+
+    if column.dtype == object:
+        # longer fields are invalid and never widen the strings below
+        short = np.fromiter(map(_short, column), dtype=bool,
+                            count=len(column))
+        column = np.where(short, column, '')
+    strings = np.char.strip(column.astype(str))
+    # only ASCII digits, str.isdigit accepts e.g. superscripts, which
+    # int() rejects
+    valid = ((strings != '')
+             & (np.char.lstrip(strings, DIGITS) == '')
+             & (np.char.str_len(strings) <= MAX_DIGITS))
+    values = np.zeros(len(column), dtype=np.int64)
+    values[valid] = strings[valid].astype(np.int64)
+    return values, valid
+
+
+def validate_chunk(names, dob, height, weight, rows=None, year=None):
+    """
+    This function validates columns of a chunk of patients at once
+
+    Arguments:
+        names (list): names of patients
+        dob, height, weight (array-like): raw values of columns
+        rows (list): numbers of rows in the file, 0, 1, ... by default
+        year (int): current year, this year by default
+
+    Returns:
+        cohort, rejected (tuple): Cohort of valid patients and a list of
+            rejected rows (row, reason, name, dob, height, weight)
+    """
+    raw = [_column(column) for column in (dob, height, weight)]
+    (dob, dob_valid), (height, height_valid), (weight, weight_valid) = (
+        _integers(column) for column in raw)
+    name_valid = np.array([isinstance(name, str) and bool(name.strip())
+                           for name in names], dtype=bool)
+
+    candidates = Cohort([name if valid else ''
+                         for name, valid in zip(names, name_valid)],
+                        dob, height, weight)
+    # the same checks and their order as in get_age and get_bmi
+    reasons = np.select(
+        [~name_valid,
+         ~dob_valid,
+         ~candidates.valid_ages(year),
+         ~weight_valid,
+         ~height_valid,
+         (weight < WEIGHT_RANGE[0]) | (weight > WEIGHT_RANGE[1]),
+         (height < HEIGHT_RANGE[0]) | (height > HEIGHT_RANGE[1])],
+        ["invalid name", "invalid dob", "impossible age",
+         "invalid weight", "invalid height", "impossible weight",
+         "impossible height"], default='')
+    accepted = reasons == ''
+
+    if rows is None:
+        rows = range(len(names))
+    indices = np.flatnonzero(~accepted)
+    fields = [column[indices].tolist() for column in raw]
+    rejected = [(rows[i], str(reasons[i]), names[i], *values)
+                for i, *values in zip(indices.tolist(), *fields)]
+    return candidates[accepted], rejected
+
+
+def _csv_chunks(handle, chunk_size):
+    """
+    This function reads a CSV file with a header in chunks of rows
+
+    Arguments:
+        handle: open text file object
+        chunk_size (int): number of rows of a chunk
+
+    Returns:
+        Generator of tuples (rows, columns, malformed), where rows are
+            numbers of well-formed rows, columns is a list of name, dob,
+            height and weight columns and malformed a list of rejected
+            rows which lack some columns
+
+    Raises:
+        ValueError: If the header does not contain all required columns
+    """
+    reader = csv.reader(handle)
+    header = [field.strip().lower() for field in next(reader, [])]
+    missing = [column for column in COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}.")
+    indices = [header.index(column) for column in COLUMNS]
+    width = max(indices) + 1
+
+    first_row = 0
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            return
+
+        if min(map(len, chunk)) >= width:
+            # transposing is much faster than appending field by field
+            transposed = list(zip(*chunk))
+            yield (range(first_row, first_row + len(chunk)),
+                   [transposed[index] for index in indices], [])
+            first_row += len(chunk)
+            continue
+
+        rows = []
+        columns = [[] for _ in COLUMNS]
+        malformed = []
+        for row_number, row in enumerate(chunk, first_row):
+            if len(row) < width:
+                fields = [row[index] if index < len(row) else None
+                          for index in indices]
+                malformed.append((row_number, "missing fields", *fields))
+                continue
+            rows.append(row_number)
+            for column, index in zip(columns, indices):
+                column.append(row[index])
+
+        yield rows, columns, malformed
+        first_row += len(chunk)
+
+
+def _parquet_chunks(source, chunk_size):
+    """
+    This function reads a Parquet file in batches of rows
+
+    Arguments:
+        source: A path to the file or an open binary file object
+        chunk_size (int): number of rows of a batch
+
+    Returns:
+        Generator of tuples (rows, columns, malformed) as in _csv_chunks
+
+    Raises:
+        ValueError: If pyarrow is not available or the file does not
+            contain all required columns
+    """
+    if pq is None:
+        raise ValueError("Reading Parquet files requires pyarrow.")
+
+    parquet = pq.ParquetFile(source)
+    # names of columns are matched like the header of a CSV file
+    names = {}
+    for name in parquet.schema_arrow.names:
+        names.setdefault(name.strip().lower(), name)
+    missing = [column for column in COLUMNS if column not in names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}.")
+    selected = [names[column] for column in COLUMNS]
+
+    first_row = 0
+    for batch in parquet.iter_batches(batch_size=chunk_size,
+                                      columns=selected):
+        columns = [batch.column(selected[0]).to_pylist()]
+        columns.extend(batch.column(name).to_numpy(zero_copy_only=False)
+                       for name in selected[1:])
+        yield range(first_row, first_row + batch.num_rows), columns, []
+        first_row += batch.num_rows
+
+
+def read_cohort(source, chunk_size=CHUNK_SIZE, file_format=None,
+                year=None):
+    """
+    This function lazily loads a cohort from a CSV file (with a header
+    naming the columns name, dob, height and weight, others are ignored)
+    or a Parquet file, one chunk of rows at a time, so a file of any size
+    is loaded with memory for a single chunk
+
+    Arguments:
+        source: A path to a file or an open file object (text for CSV,
+            binary for Parquet)
+        chunk_size (int): number of rows of a chunk
+        file_format (str): 'csv' or 'parquet', by default chosen by the
+            suffix of the path ('.parquet' or '.pq' for Parquet)
+        year (int): current year used for ages, this year by default
+
+    Returns:
+        Generator of tuples (cohort, rejected): Cohort of valid patients
+            of a chunk and a list of its rejected rows (row, reason,
+            name, dob, height, weight), rows are numbered from 0 without
+            the header
+
+    Raises:
+        ValueError: If NumPy is not available, the format or the chunk
+            size is invalid or the file lacks required columns
+    """
+    if np is None:
+        raise ValueError("Loading cohorts requires NumPy.")
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("Invalid input. Chunk size has to be a positive"
+                         " integer.")
+
+    if file_format is None:
+        path = os.fspath(source) if isinstance(
+            source, (str, os.PathLike)) else ''
+        file_format = ('parquet' if path.lower().endswith(PARQUET_SUFFIXES)
+                       else 'csv')
+    if file_format not in FORMATS:
+        raise ValueError("Format must be one of: " + ", ".join(FORMATS))
+
+    if file_format == 'parquet':
+        chunks = _parquet_chunks(source, chunk_size)
+        yield from _validate_chunks(chunks, year)
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, newline='') as handle:
+            yield from _validate_chunks(_csv_chunks(handle, chunk_size),
+                                        year)
+    else:
+        yield from _validate_chunks(_csv_chunks(source, chunk_size), year)
+
+
+def _validate_chunks(chunks, year):
+    """
+    This function validates chunks read by _csv_chunks or
+    _parquet_chunks
+    """
+    for rows, columns, malformed in chunks:
+        cohort, rejected = validate_chunk(*columns, rows=rows, year=year)
+        if malformed:
+            rejected = sorted(rejected + malformed)
+        yield cohort, rejected
+
+
+def load_cohort(source, rejected_destination=None, **options):
+    """
+    This function loads a whole cohort. Rejected rows are written to
+    a side table or returned; for files which do not fit into memory
+    iterate over read_cohort instead.
+
+    Arguments:
+        source: A path to a file or an open file object
+        rejected_destination: A path or an open text file object, where
+            rejected rows are written as CSV as they are found
+        **options: chunk_size, file_format and year (see read_cohort)
+
+    Returns:
+        cohort, rejected (tuple): Cohort of all valid patients and
+            a list of rejected rows (empty if they were written to the
+            destination)
+    """
+    if rejected_destination is not None and isinstance(
+            rejected_destination, (str, os.PathLike)):
+        with open(rejected_destination, 'w', newline='') as handle:
+            return load_cohort(source, handle, **options)
+
+    cohorts = []
+    rejected = []
+    writer = None
+    if rejected_destination is not None:
+        writer = csv.writer(rejected_destination)
+        writer.writerow(REJECTED_COLUMNS)
+
+    for cohort, chunk_rejected in read_cohort(source, **options):
+        cohorts.append(cohort)
+        if writer is not None:
+            writer.writerows(chunk_rejected)
+        else:
+            rejected.extend(chunk_rejected)
+
+    return Cohort.concatenate(cohorts), rejected
+
+
+if __name__ == '__main__':
+    import io
+
+    from running_statistics import RunningStatistics
+
+    extract = io.StringIO("name,dob,height,weight\n"
+                          "John Smith,2003,189,81\n"
+                          "Michael Jackson,1958,176,70\n"
+                          "Unknown,1850,170,70\n"
+                          "Lionel Messi,1987,170,72\n"
+                          "Tall Person,1990,310,90\n"
+                          "Adam Malysz,1977,170,55\n"
+                          "Broken Row,19x7,170,55\n")
+
+    stats = RunningStatistics()
+    for chunk, rejected in read_cohort(extract, chunk_size=3):
+        chunk.accumulate_age_stats(stats)
+        print(f"Loaded {len(chunk)} patients,"
+              f" patients at risk: {chunk.find_people_at_risk().tolist()}")
+        for row in rejected:
+            print(f"Rejected row {row[0]}: {row[1]}")
+
+    print(f"Mean age: {stats.mean:.2f}")
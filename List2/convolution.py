@@ -0,0 +1,302 @@
+"""
+Module containing algorithms multiplying polynomials given by lists of
+coefficients (their convolution): the schoolbook method for short
+lists, Karatsuba's method for mid-size lists, and for long lists the
+number-theoretic transform (exact for integers) or the fast Fourier
+transform (for floats), both computed with NumPy.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Karatsuba's method is used if both lists have at least this length
+KARATSUBA_THRESHOLD = 32
+# transforms are used if the product has at least this length (and both
+# lists are long enough for Karatsuba's method)
+TRANSFORM_THRESHOLD = 1024
+# primes p = c * 2^k + 1 with their primitive roots, every one of them
+# supports transforms of length up to 2^k
+NTT_PRIMES = ((998244353, 3), (167772161, 3), (469762049, 3))
+NTT_MAX_LENGTH = 1 << 23
+
+
+def convolve(a, b):
+    """
+    This function computes the convolution of two lists, i.e. the
+    coefficients of the product of polynomials, choosing the algorithm
+    by their lengths. The result is exact for integer coefficients (and
+    other exact types, e.g. fractions, which are never transformed).
+
+    Arguments:
+        a, b (list): coefficients of polynomials (in the same order,
+            both from the highest or both from the lowest power)
+
+    Returns:
+        result (list): len(a) + len(b) - 1 coefficients of the product
+    """
+    if not a or not b:
+        return []
+
+    if min(len(a), len(b)) < KARATSUBA_THRESHOLD:
+        return schoolbook(a, b)
+
+    if np is not None and len(a) + len(b) > TRANSFORM_THRESHOLD:
+        if all(isinstance(value, int) for value in a + b):
+            result = ntt_convolve(a, b)
+            if result is not None:
+                return result
+        elif all(isinstance(value, (int, float)) for value in a + b):
+            return fft_convolve(a, b)
+
+    return karatsuba(a, b)
+
+
+def schoolbook(a, b):
+    """
+    This function computes the convolution with the schoolbook method in
+    O(n * m) time
+
+    Arguments:
+        a, b (list): coefficients of polynomials
+
+    Returns:
+        result (list): coefficients of the product
+    """
+    result = [0] * (len(a) + len(b) - 1)
+
+    for i in range(len(a)):
+        for j in range(len(b)):
+            result[i + j] += a[i] * b[j]
+
+    return result
+
+
+def _add_shifted(result, values, shift):
+    """
+    This function adds values to result starting at the position shift
+    """
+    for i, value in enumerate(values):
+        result[i + shift] += value
+
+
+def karatsuba(a, b):
+    """
+    This function computes the convolution with Karatsuba's method in
+    O(n^1.58) time: both lists are split in halves a0, a1 and b0, b1 and
+    the three products a0 * b0, a1 * b1 and (a0 + a1) * (b0 + b1) give
+    all four products of halves. A much shorter list is multiplied by
+    blocks of the longer one.
+
+    Arguments:
+        a, b (list): coefficients of polynomials
+
+    Returns:
+        result (list): coefficients of the product
+    """
+    if len(a) < len(b):
+        a, b = b, a
+
+    if len(b) < KARATSUBA_THRESHOLD:
+        return schoolbook(a, b)
+
+    result = [0] * (len(a) + len(b) - 1)
+
+    if len(b) <= len(a) // 2:
+        for start in range(0, len(a), len(b)):
+            _add_shifted(result, karatsuba(a[start:start + len(b)], b),
+                         start)
+        return result
+
+    middle = len(a) // 2
+    a0, a1 = a[:middle], a[middle:]
+    b0, b1 = b[:middle], b[middle:]
+
+    low = karatsuba(a0, b0)
+    high = karatsuba(a1, b1)
+    a_sum = [x + y for x, y in zip(a1, a0)] + a1[len(a0):]
+    b_sum = ([x + y for x, y in zip(b1, b0)] + b1[len(b0):]
+             if len(b1) >= len(b0) else
+             [x + y for x, y in zip(b0, b1)] + b0[len(b1):])
+    cross = karatsuba(a_sum, b_sum)
+
+    for i, value in enumerate(low):
+        cross[i] -= value
+    for i, value in enumerate(high):
+        cross[i] -= value
+
+    _add_shifted(result, low, 0)
+    _add_shifted(result, cross[:len(result) - middle], middle)
+    _add_shifted(result, high, 2 * middle)
+    return result
+
+
+def fft_convolve(a, b):
+    """
+    This function computes the convolution with the fast Fourier
+    transform in O(n log n) time. Results are rounded like any floating
+    point computation.
+
+    Arguments:
+        a, b (list): coefficients of polynomials
+
+    Returns:
+        result (list): coefficients (floats) of the product
+    """
+    length = len(a) + len(b) - 1
+    size = 1 << (length - 1).bit_length()
+    spectrum = np.fft.rfft(a, size) * np.fft.rfft(b, size)
+    return np.fft.irfft(spectrum, size)[:length].tolist()
+
+
+def _bit_reversal(size):
+    """
+    This function computes the bit-reversal permutation of indices
+
+    Arguments:
+        size (int): power of 2
+
+    Returns:
+        permutation (numpy.ndarray): index with reversed bits for every
+            index
+    """
+    bits = size.bit_length() - 1
+    indices = np.arange(size, dtype=np.int64)
+    permutation = np.zeros(size, dtype=np.int64)
+    for bit in range(bits):
+        permutation |= ((indices >> bit) & 1) << (bits - 1 - bit)
+    return permutation
+
+
+def _powers(base, count, prime):
+    """
+    This function computes base^0, ..., base^(count - 1) modulo a prime
+    by repeated doubling of the computed vector
+
+    Returns:
+        powers (numpy.ndarray): uint64 array of powers
+    """
+    powers = np.ones(1, dtype=np.uint64)
+    while len(powers) < count:
+        factor = np.uint64(pow(base, len(powers), prime))
+        powers = np.concatenate((powers,
+                                 powers * factor % np.uint64(prime)))
+    return powers[:count]
+
+
+def _ntt(values, prime, root, inverse=False):
+    """
+    This function computes the number-theoretic transform (the discrete
+    Fourier transform over integers modulo a prime) with the iterative
+    radix-2 algorithm, all butterflies of a stage computed at once
+
+    Arguments:
+        values (numpy.ndarray): uint64 array of residues, its length is
+            a power of 2
+        prime (int): modulus
+        root (int): primitive root modulo the prime
+        inverse (bool): If True, the inverse transform is computed
+
+    Returns:
+        transform (numpy.ndarray): uint64 array of residues
+    """
+    size = len(values)
+    modulus = np.uint64(prime)
+    unit = pow(root, (prime - 1) // size, prime)
+    if inverse:
+        unit = pow(unit, prime - 2, prime)
+    powers = _powers(unit, max(1, size // 2), prime)
+
+    values = values[_bit_reversal(size)]
+    length = 2
+    while length <= size:
+        half = length // 2
+        blocks = values.reshape(-1, length)
+        twiddles = powers[::size // length][:half]
+        even = blocks[:, :half]
+        odd = blocks[:, half:] * twiddles % modulus
+        values = np.concatenate(((even + odd) % modulus,
+                                 (even + modulus - odd) % modulus),
+                                axis=1).reshape(-1)
+        length *= 2
+
+    if inverse:
+        values = values * np.uint64(pow(size, prime - 2, prime)) % modulus
+    return values
+
+
+def ntt_convolve(a, b):
+    """
+    This function computes the exact convolution of integer lists with
+    number-theoretic transforms modulo a few primes, combining residues
+    with the Chinese remainder theorem (Garner's algorithm). The number
+    of primes is chosen from a bound of absolute values of the result.
+
+    Arguments:
+        a, b (list): integer coefficients of polynomials
+
+    Returns:
+        result (list): integer coefficients of the product, or None if
+            they may be too large for the available primes or the lists
+            are too long
+    """
+    length = len(a) + len(b) - 1
+    size = 1 << (length - 1).bit_length()
+    if size > NTT_MAX_LENGTH:
+        return None
+
+    bound = (2 * max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+             + 1)
+    primes = []
+    modulus = 1
+    for prime, root in NTT_PRIMES:
+        if modulus > bound:
+            break
+        primes.append((prime, root))
+        modulus *= prime
+    if modulus <= bound:
+        return None
+
+    residues = []
+    for prime, root in primes:
+        transforms = []
+        for values in (a, b):
+            padded = np.zeros(size, dtype=np.uint64)
+            padded[:len(values)] = [value % prime for value in values]
+            transforms.append(_ntt(padded, prime, root))
+        product = transforms[0] * transforms[1] % np.uint64(prime)
+        residues.append(_ntt(product, prime, root, inverse=True)[:length])
+
+    # Garner's algorithm: the result is d0 + p0 * (d1 + p1 * (d2 + ...))
+    digits = []
+    for j, (prime, _) in enumerate(primes):
+        modulus_j = np.uint64(prime)
+        combined = np.zeros(length, dtype=np.uint64)
+        factor = 1
+        for i, digit in enumerate(digits):
+            combined = (combined + digit * np.uint64(factor)) % modulus_j
+            factor = factor * primes[i][0] % prime
+        inverse = np.uint64(pow(factor, prime - 2, prime))
+        digits.append((residues[j] + modulus_j - combined) % modulus_j
+                      * inverse % modulus_j)
+
+    result = [0] * length
+    factor = 1
+    for (prime, _), digit in zip(primes, digits):
+        for i, value in enumerate(digit.tolist()):
+            result[i] += value * factor
+        factor *= prime
+
+    half = modulus // 2
+    return [value - modulus if value > half else value for value in result]
+
+
+if __name__ == '__main__':
+    first = list(range(1, 2001))
+    second = list(range(-1000, 1000))
+
+    product = convolve(first, second)
+    print(f"Product has {len(product)} coefficients,"
+          f" the first ones: {product[:5]}")
+    print(f"The same as Karatsuba's method:"
+          f" {product == karatsuba(first, second)}")
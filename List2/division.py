@@ -0,0 +1,468 @@
+"""
+Module containing division of polynomials given by lists of
+coefficients (from the highest power to the constant term): long
+division for small polynomials, division with Newton's iteration (which
+reduces division to fast multiplication) for large ones, and the
+greatest common divisor with the Euclidean algorithm accelerated by the
+half-GCD algorithm for large degrees (computed modulo primes for exact
+coefficients).
+
+Coefficients are exact when they are integers or fractions: quotients of
+integers which do not divide evenly become fractions.Fraction. If
+a modulus is given, coefficients are integers modulo this prime.
+"""
+from fractions import Fraction
+from math import gcd
+
+from convolution import convolve
+
+# Newton's iteration is used if both the divisor and the quotient have
+# at least this many coefficients
+NEWTON_THRESHOLD = 64
+# the half-GCD algorithm is used for polynomials of at least this degree
+# (modulo a prime it overtakes the Euclidean algorithm at degrees around
+# 2000-2500), its recursion does Euclidean steps one by one below
+# HALF_GCD_BASE
+HALF_GCD_THRESHOLD = 2048
+HALF_GCD_BASE = 128
+
+
+def _quotient(x, y, modulus=None):
+    """
+    This function divides coefficients, keeping integers and fractions
+    exact
+
+    Arguments:
+        x, y: coefficients, y is not zero
+        modulus (int): If provided, the division is done modulo it
+
+    Returns:
+        quotient: x / y
+    """
+    if modulus is not None:
+        return x * pow(y, -1, modulus) % modulus
+
+    if isinstance(x, (int, Fraction)) and isinstance(y, (int, Fraction)):
+        result = Fraction(x) / y
+        return int(result) if result.denominator == 1 else result
+
+    return x / y
+
+
+def normalize(coefficients, modulus=None):
+    """
+    This function reduces coefficients modulo the modulus (if provided)
+    and removes zero coefficients of the highest powers
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        modulus (int): modulus of coefficients
+
+    Returns:
+        coefficients (list): normalized coefficients, empty for the zero
+            polynomial
+    """
+    if modulus is not None:
+        coefficients = [coefficient % modulus for coefficient in coefficients]
+
+    for i, coefficient in enumerate(coefficients):
+        if coefficient != 0:
+            return list(coefficients[i:])
+    return []
+
+
+def _subtract(a, b, modulus=None):
+    """
+    This function subtracts coefficients aligned at constant terms
+    """
+    if len(a) < len(b):
+        a = [0] * (len(b) - len(a)) + list(a)
+    offset = len(a) - len(b)
+    result = list(a[:offset]) + [x - y for x, y in zip(a[offset:], b)]
+    return normalize(result, modulus)
+
+
+def _multiply(a, b, modulus=None):
+    """
+    This function multiplies polynomials with fast multiplication
+    """
+    if not a or not b:
+        return []
+    return normalize(convolve(list(a), list(b)), modulus)
+
+
+def long_divmod(a, b, modulus=None):
+    """
+    This function divides polynomials with long division in
+    O(len(b) * (len(a) - len(b))) time
+
+    Arguments:
+        a (list): coefficients of the dividend from the highest power
+        b (list): normalized coefficients of the divisor
+        modulus (int): modulus of coefficients
+
+    Returns:
+        quotient, remainder (tuple): normalized coefficients
+    """
+    remainder = list(a)
+    length = len(remainder) - len(b) + 1
+    if length <= 0:
+        return [], normalize(remainder, modulus)
+
+    quotient = []
+    for i in range(length):
+        coefficient = _quotient(remainder[i], b[0], modulus)
+        quotient.append(coefficient)
+        if coefficient:
+            for j in range(1, len(b)):
+                remainder[i + j] -= coefficient * b[j]
+                if modulus is not None:
+                    remainder[i + j] %= modulus
+
+    return (normalize(quotient, modulus),
+            normalize(remainder[length:], modulus))
+
+
+def series_inverse(series, length, modulus=None):
+    """
+    This function computes the inverse of a power series modulo
+    x^length with Newton's iteration g = g * (2 - f * g), which doubles
+    the number of correct terms in every step
+
+    Arguments:
+        series (list): coefficients from the constant term, the first
+            one is not zero
+        length (int): number of computed terms
+        modulus (int): modulus of coefficients
+
+    Returns:
+        inverse (list): length coefficients from the constant term
+    """
+    inverse = [_quotient(1, series[0], modulus)]
+
+    while len(inverse) < length:
+        size = min(2 * len(inverse), length)
+        error = [-value for value in
+                 convolve(list(series[:size]), inverse)[:size]]
+        error[0] += 2
+        inverse = convolve(inverse, error)[:size]
+        if modulus is not None:
+            inverse = [value % modulus for value in inverse]
+
+    return inverse[:length]
+
+
+def newton_divmod(a, b, modulus=None):
+    """
+    This function divides polynomials with Newton's iteration. Reversed
+    coefficients of a polynomial (read from the constant term) are the
+    coefficients of the reversed polynomial, so the quotient is the
+    product of the reversed dividend and the inverse series of the
+    reversed divisor, truncated to the length of the quotient. It takes
+    a few multiplications, i.e. O(n log n) time with fast
+    multiplication.
+
+    Arguments:
+        a (list): coefficients of the dividend from the highest power
+        b (list): normalized coefficients of the divisor
+        modulus (int): modulus of coefficients
+
+    Returns:
+        quotient, remainder (tuple): normalized coefficients
+    """
+    length = len(a) - len(b) + 1
+    if length <= 0:
+        return [], normalize(a, modulus)
+
+    inverse = series_inverse(b, length, modulus)
+    quotient = convolve(list(a[:length]), inverse)[:length]
+    if modulus is not None:
+        quotient = [value % modulus for value in quotient]
+
+    product = convolve(list(b), quotient)
+    remainder = [x - y for x, y in zip(a[length:], product[length:])]
+    return normalize(quotient, modulus), normalize(remainder, modulus)
+
+
+def poly_divmod(a, b, modulus=None):
+    """
+    This function divides polynomials choosing the algorithm by their
+    degrees and coefficients: Newton's iteration for large polynomials
+    modulo a prime or with floating point coefficients, long division
+    otherwise (exact integers and fractions grow too large in series
+    inverses)
+
+    Arguments:
+        a (list): coefficients of the dividend from the highest power
+        b (list): coefficients of the divisor from the highest power
+        modulus (int): modulus of coefficients (a prime)
+
+    Returns:
+        quotient, remainder (tuple): normalized coefficients (empty for
+            the zero polynomial)
+
+    Raises:
+        ZeroDivisionError: If the divisor is the zero polynomial
+    """
+    a = normalize(a, modulus)
+    b = normalize(b, modulus)
+    if not b:
+        raise ZeroDivisionError("Division by the zero polynomial.")
+
+    # exact coefficients of series inverses grow quickly, so Newton's
+    # iteration pays off only for coefficients of bounded size
+    if (min(len(b), len(a) - len(b) + 1) >= NEWTON_THRESHOLD
+            and (modulus is not None
+                 or any(isinstance(value, float) for value in a + b))):
+        return newton_divmod(a, b, modulus)
+    return long_divmod(a, b, modulus)
+
+
+def _degree(coefficients):
+    return len(coefficients) - 1
+
+
+def _apply(matrix, a, b, modulus):
+    """
+    This function multiplies a 2x2 matrix of polynomials by a vector of
+    two polynomials
+    """
+    (m00, m01), (m10, m11) = matrix
+    first = _subtract(_multiply(m00, a, modulus),
+                      [-value for value in _multiply(m01, b, modulus)],
+                      modulus)
+    second = _subtract(_multiply(m10, a, modulus),
+                       [-value for value in _multiply(m11, b, modulus)],
+                       modulus)
+    return first, second
+
+
+def _compose(left, right, modulus):
+    """
+    This function multiplies two 2x2 matrices of polynomials
+    """
+    columns = [_apply(left, right[0][j], right[1][j], modulus)
+               for j in range(2)]
+    return ((columns[0][0], columns[1][0]), (columns[0][1], columns[1][1]))
+
+
+def _half_gcd(a, b, modulus):
+    """
+    This function computes a matrix of the first steps of the Euclidean
+    algorithm for a and b, which reduce them to two consecutive
+    remainders with degrees around the half of the degree of a. The
+    steps are found recursively from the leading coefficients only,
+    because quotients of the first steps depend only on them.
+
+    Arguments:
+        a, b (list): normalized coefficients, deg a > deg b
+        modulus (int): modulus of coefficients
+
+    Returns:
+        matrix (tuple): 2x2 matrix of polynomials M, such that M * (a, b)
+            are consecutive remainders of the Euclidean algorithm
+    """
+    matrix = (([1], []), ([], [1]))
+    half = (_degree(a) + 1) // 2
+
+    if _degree(a) < HALF_GCD_BASE:
+        # small polynomials: steps of the Euclidean algorithm one by one
+        while b and _degree(b) >= half:
+            quotient, remainder = poly_divmod(a, b, modulus)
+            step = (([], [1]), ([1], [-value for value in quotient]))
+            matrix = _compose(step, matrix, modulus)
+            a, b = b, remainder
+        return matrix
+
+    if _degree(b) < half:
+        return matrix
+
+    # dividing by x^half drops the lowest half of coefficients
+    first = _half_gcd(a[:len(a) - half], b[:len(b) - half], modulus)
+    c, d = _apply(first, a, b, modulus)
+    if _degree(d) < half:
+        return first
+
+    quotient, remainder = poly_divmod(c, d, modulus)
+    step = (([], [1]), ([1], [-value for value in quotient]))
+    matrix = _compose(step, first, modulus)
+    if _degree(remainder) < half:
+        return matrix
+
+    shift = 2 * half - _degree(d)
+    if shift <= 0 or shift >= len(remainder):
+        return matrix
+    second = _half_gcd(d[:len(d) - shift], remainder[:len(remainder) - shift],
+                       modulus)
+    return _compose(second, matrix, modulus)
+
+
+def _is_prime(n):
+    """
+    This function tests primality with the Miller-Rabin test, whose bases
+    2, 3, 5 and 7 make it deterministic below 3215031751
+    """
+    if n < 2:
+        return False
+    for base in (2, 3, 5, 7):
+        if n % base == 0:
+            return n == base
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for base in (2, 3, 5, 7):
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primitive(coefficients):
+    """
+    This function divides integer coefficients by their greatest common
+    divisor, making the leading one positive
+    """
+    content = 0
+    for value in coefficients:
+        content = gcd(content, value)
+    if coefficients[0] < 0:
+        content = -content
+    return [value // content for value in coefficients]
+
+
+def _integers(coefficients):
+    """
+    This function scales exact coefficients (integers and fractions) to
+    integers by the common denominator
+    """
+    denominator = 1
+    for value in coefficients:
+        if isinstance(value, Fraction):
+            denominator = denominator * value.denominator // gcd(
+                denominator, value.denominator)
+    if denominator == 1:
+        return [int(value) for value in coefficients]
+    return [int(value * denominator) for value in coefficients]
+
+
+def _divides(divisor, dividend):
+    """
+    This function checks whether a primitive integer polynomial divides
+    an integer polynomial
+    """
+    return not long_divmod(dividend, divisor)[1]
+
+
+def _modular_gcd(a, b):
+    """
+    This function computes the greatest common divisor of primitive
+    integer polynomials from their greatest common divisors modulo primes
+    below 2^31 (with the Euclidean algorithm on small numbers), combined
+    with the Chinese remainder theorem. Images are scaled to the greatest
+    common divisor of leading coefficients, primes dividing the leading
+    coefficients are skipped, images of too high degrees (of unlucky
+    primes) are dropped and a result which did not change with the last
+    prime is checked by division.
+
+    Arguments:
+        a, b (list): primitive integer coefficients from the highest power
+
+    Returns:
+        gcd (list): primitive integer coefficients of the greatest common
+            divisor
+    """
+    leading = gcd(a[0], b[0])
+    degree = min(len(a), len(b))
+    result, modulus, candidate = None, 1, None
+    prime = 1 << 31
+
+    while True:
+        prime -= 1
+        if not _is_prime(prime) or a[0] % prime == 0 or b[0] % prime == 0:
+            continue
+
+        image = poly_gcd(a, b, prime)
+        if len(image) == 1:
+            return [1]
+        if len(image) - 1 > degree:
+            continue
+        image = [value * leading % prime for value in image]
+
+        if len(image) - 1 < degree:
+            degree = len(image) - 1
+            result, modulus = image, prime
+        else:
+            # x = r (mod m) and x = c (mod p) give x = r + m * t (mod mp)
+            inverse = pow(modulus, -1, prime)
+            result = [r + modulus * ((c - r) * inverse % prime)
+                      for r, c in zip(result, image)]
+            modulus *= prime
+
+        previous = candidate
+        candidate = _primitive([value if 2 * value <= modulus
+                                else value - modulus for value in result])
+        if (candidate == previous and _divides(candidate, a)
+                and _divides(candidate, b)):
+            return candidate
+
+
+def poly_gcd(a, b, modulus=None):
+    """
+    This function computes the monic greatest common divisor of
+    polynomials. Modulo a prime it uses the Euclidean algorithm, for
+    large degrees doing many steps at once with the half-GCD algorithm,
+    which needs O(n log^2 n) operations instead of O(n^2). Integer and
+    fractional coefficients (whose remainders in the Euclidean algorithm
+    grow very fast) are scaled to primitive integer polynomials and
+    their divisor is found modulo primes (see _modular_gcd). Floating
+    point coefficients are accepted, but rounding errors may hide
+    a common divisor.
+
+    Arguments:
+        a, b (list): coefficients from the highest power
+        modulus (int): modulus of coefficients (a prime)
+
+    Returns:
+        gcd (list): coefficients of the monic greatest common divisor,
+            empty if both polynomials are zero
+    """
+    a = normalize(a, modulus)
+    b = normalize(b, modulus)
+    if len(a) < len(b):
+        a, b = b, a
+
+    if (b and modulus is None
+            and all(isinstance(value, (int, Fraction)) for value in a + b)):
+        a = _modular_gcd(_primitive(_integers(a)), _primitive(_integers(b)))
+        b = []
+
+    while b:
+        if _degree(b) >= HALF_GCD_THRESHOLD and _degree(a) > _degree(b):
+            a, b = _apply(_half_gcd(a, b, modulus), a, b, modulus)
+            if len(a) < len(b):
+                a, b = b, a
+            if not b:
+                break
+        a, b = b, poly_divmod(a, b, modulus)[1]
+
+    if not a:
+        return []
+    leading = a[0]
+    return [_quotient(value, leading, modulus) for value in a]
+
+
+if __name__ == '__main__':
+    dividend = [1, 0, -3, 2]
+    divisor = [2, -2]
+
+    print(f"(x^3 - 3x + 2) divmod (2x - 2):"
+          f" {poly_divmod(dividend, divisor)}")
+    print(f"GCD of x^3 - 3x + 2 and x^2 - 1:"
+          f" {poly_gcd(dividend, [1, 0, -1])}")
+    print(f"GCD modulo 7: {poly_gcd([1, 0, 0, 6], [1, 5, 6], 7)}")
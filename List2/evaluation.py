@@ -0,0 +1,301 @@
+"""
+Module containing evaluation of polynomials given by lists of
+coefficients (from the highest power to the constant term): Horner's
+scheme for single points, its vectorized version for arrays of points,
+multipoint evaluation with a subproduct tree and compilation of
+polynomials into specialized Python functions
+"""
+from fractions import Fraction
+from functools import partial
+from numbers import Integral
+
+from convolution import convolve
+from division import poly_divmod
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# polynomials with more terms are not compiled into straight-line code,
+# their evaluators loop over the coefficients instead
+COMPILE_MAX_TERMS = 256
+# multipoint evaluation stops descending the subproduct tree at nodes of
+# at most this many points and evaluates their remainders directly
+TREE_LEAF_SIZE = 32
+
+
+def horner(coefficients, x):
+    """
+    This function evaluates a polynomial with Horner's scheme, i.e. as
+    (...((a_n * x + a_n-1) * x + a_n-2) ...) * x + a_0, which needs one
+    multiplication and one addition per coefficient
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        x: point (a number, or a NumPy array for vectorized evaluation)
+
+    Returns:
+        value: value of the polynomial at x
+    """
+    result = 0
+    for coefficient in coefficients:
+        result = result * x + coefficient
+    return result
+
+
+def array_dtype(coefficients, points, degree=None):
+    """
+    This function chooses the dtype of a vectorized evaluation: machine
+    numbers if they can hold every intermediate value and the object
+    dtype (Python numbers) if integers could overflow int64 or
+    coefficients are not machine numbers (e.g. fractions)
+
+    Arguments:
+        coefficients (list): coefficients of the polynomial
+        points (numpy.ndarray): points of evaluation
+        degree (int): degree of the polynomial, len(coefficients) - 1 by
+            default
+
+    Returns:
+        numpy.dtype: dtype of points and values
+    """
+    if degree is None:
+        degree = len(coefficients) - 1
+    if (points.dtype.kind not in 'biufc'
+            or not all(isinstance(coefficient, (int, float, complex,
+                                                np.number))
+                       for coefficient in coefficients)):
+        return np.dtype(object)
+
+    inexact = [coefficient for coefficient in coefficients
+               if not isinstance(coefficient, (int, np.integer))]
+    if inexact or points.dtype.kind in 'fc':
+        return np.result_type(points.dtype, np.float64, *inexact)
+
+    # |value| <= terms * max|c| * max(1, max|x|) ** degree, and the same
+    # bound holds for every intermediate value of Horner's scheme
+    largest = max((abs(int(coefficient)) for coefficient in coefficients),
+                  default=0)
+    point = (max(abs(int(points.min())), abs(int(points.max())), 1)
+             if points.size else 1)
+    bits = (largest.bit_length() + len(coefficients).bit_length()
+            + max(degree, 0) * point.bit_length())
+    return np.dtype(np.int64) if bits < 64 else np.dtype(object)
+
+
+def horner_many(coefficients, points, use_numpy=False):
+    """
+    This function evaluates a polynomial at many points. With NumPy all
+    points are processed at once by every step of Horner's scheme,
+    otherwise the scheme is repeated for every point. Integer values
+    which could overflow int64 and fractional coefficients are computed
+    in an array of Python numbers (see array_dtype).
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        points (iterable): points of evaluation
+        use_numpy (bool): If True and NumPy is available, the points are
+            converted to an array and evaluated in a vectorized way
+
+    Returns:
+        values (list or numpy.ndarray): values at all points, an array
+            if NumPy was used
+    """
+    if use_numpy and np is not None:
+        points = np.asarray(points)
+        dtype = array_dtype(coefficients, points)
+        points = points.astype(dtype, copy=False)
+        result = np.zeros(points.shape, dtype=dtype)
+        for coefficient in coefficients:
+            result *= points
+            result += coefficient
+        return result
+
+    return [horner(coefficients, x) for x in points]
+
+
+def _remainder(dividend, divisor):
+    """
+    This function computes the remainder of division by a monic
+    polynomial with fast division (see division.poly_divmod), so exact
+    coefficients remain exact
+
+    Arguments:
+        dividend (list): coefficients from the highest power
+        divisor (list): coefficients of a monic polynomial of degree at
+            least 1
+
+    Returns:
+        remainder (list): coefficients of the remainder
+    """
+    if len(dividend) < len(divisor):
+        return dividend
+    return poly_divmod(dividend, divisor)[1]
+
+
+def subproduct_tree(points):
+    """
+    This function builds the subproduct tree of points: its leaves are
+    polynomials x - x_i and every node is the product of its children,
+    computed with fast multiplication
+
+    Arguments:
+        points (list): points of evaluation
+
+    Returns:
+        tree (list): levels of the tree from the leaves to the root,
+            every level is a list of coefficient lists
+    """
+    level = [[1, -x] for x in points]
+    tree = [level]
+
+    while len(level) > 1:
+        level = [convolve(level[i], level[i + 1]) if i + 1 < len(level)
+                 else level[i] for i in range(0, len(level), 2)]
+        tree.append(level)
+
+    return tree
+
+
+def _exact(value):
+    """
+    This function converts an exact number to int or Fraction
+
+    Raises:
+        ValueError: If the value is not an integer or a fraction
+    """
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, Integral):
+        return int(value)
+    raise ValueError("Invalid input. Multipoint evaluation requires"
+                     " integer or fractional coefficients and points.")
+
+
+def multipoint_evaluate(coefficients, points):
+    """
+    This function evaluates a polynomial at many points with
+    a subproduct tree: the polynomial is reduced modulo the root of the
+    tree and then remainders are reduced modulo children down to nodes
+    of at most TREE_LEAF_SIZE points, whose remainders are evaluated
+    with Horner's scheme. Remainders are computed with fast division.
+    Results are exact, which is why only integers and fractions are
+    accepted (coefficients of the tree grow quickly and floating point
+    remainders lose all precision).
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+        points (list): points of evaluation
+
+    Returns:
+        values (list): values at all points
+
+    Raises:
+        ValueError: If any coefficient or point is not an integer or
+            a fraction
+    """
+    coefficients = [_exact(coefficient) for coefficient in coefficients]
+    points = [_exact(x) for x in points]
+    if len(points) <= TREE_LEAF_SIZE:
+        return [horner(coefficients, x) for x in points]
+
+    tree = subproduct_tree(points)
+    remainders = [_remainder(coefficients, tree[-1][0])]
+
+    level = len(tree) - 1
+    while level and len(tree[level - 1][0]) - 1 > TREE_LEAF_SIZE:
+        level -= 1
+        remainders = [_remainder(remainders[i // 2], node)
+                      for i, node in enumerate(tree[level])]
+
+    # nodes of the level cover consecutive groups of 2 ** level points
+    size = 1 << level
+    return [horner(remainders[i // size], x) for i, x in enumerate(points)]
+
+
+def _build(name, lines, constants):
+    """
+    This function compiles the source of a function of x
+
+    Arguments:
+        name (str): name of the function
+        lines (list): lines of its body
+        constants (list): values of names c0, c1, ... used in the body
+
+    Returns:
+        function: the compiled function
+    """
+    namespace = {f"c{i}": value for i, value in enumerate(constants)}
+    source = (f"def {name}(x):\n"
+              + "".join(f"    {line}\n" for line in lines))
+    exec(compile(source, f"<{name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+def _sparse_sum(terms, x):
+    return sum(coefficient * x ** power for power, coefficient in terms)
+
+
+def compile_horner(coefficients):
+    """
+    This function generates a function evaluating a polynomial with
+    Horner's scheme unrolled into straight-line code: coefficients are
+    bound to local constants and steps with zero coefficients skip the
+    addition. It works for numbers as well as NumPy arrays of points.
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+
+    Returns:
+        function: function of x returning the value of the polynomial
+    """
+    coefficients = tuple(coefficients)
+    if len(coefficients) > COMPILE_MAX_TERMS:
+        return partial(horner, coefficients)
+    if len(coefficients) < 2:
+        return _build('horner', ["return x * 0 + c0"],
+                      coefficients or (0,))
+
+    lines = ["result = c0 * x" + (" + c1" if coefficients[1] else "")]
+    for i in range(2, len(coefficients)):
+        lines.append("result = result * x"
+                     + (f" + c{i}" if coefficients[i] else ""))
+    lines.append("return result")
+    return _build('horner', lines, coefficients)
+
+
+def compile_sparse(terms):
+    """
+    This function generates a function evaluating a sparse polynomial as
+    a sum of its non-zero terms
+
+    Arguments:
+        terms (dict): exponents as keys and coefficients as items
+
+    Returns:
+        function: function of x returning the value of the polynomial
+    """
+    if len(terms) > COMPILE_MAX_TERMS:
+        return partial(_sparse_sum, tuple(terms.items()))
+    if not terms:
+        return _build('sparse', ["return x * 0"], [])
+
+    powers = sorted(terms, reverse=True)
+    parts = [f"c{i}" if power == 0 else
+             f"c{i} * x" if power == 1 else f"c{i} * x ** {power}"
+             for i, power in enumerate(powers)]
+    return _build('sparse', ["return " + " + ".join(parts)],
+                  [terms[power] for power in powers])
+
+
+if __name__ == '__main__':
+    polynomial = [2, -3, 0, 5]
+
+    print(f"Value at 2: {horner(polynomial, 2)}")
+    print(f"Values at 0..5: {horner_many(polynomial, range(6))}")
+    print(f"Values at 0..5 with a subproduct tree:"
+          f" {multipoint_evaluate(polynomial, range(6))}")
+    evaluate = compile_horner(polynomial)
+    print(f"Values at 0..5 with a compiled function:"
+          f" {[evaluate(x) for x in range(6)]}")
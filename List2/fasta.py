@@ -0,0 +1,212 @@
+"""
+Module with a streaming reader and a batched writer for FASTA and
+multi-FASTA files holding objects of the Sequence hierarchy
+"""
+import io
+import mmap
+import os
+
+from biological_sequences import DNASequence
+
+
+def _open_lines(source):
+    """
+    This function turns a FASTA source into an iterator of text lines
+    without reading the whole source into memory
+
+    Arguments:
+        source: A path to a file, an open text or binary file object,
+            or a buffer (bytes, bytearray, mmap)
+
+    Returns:
+        lines, closeable (tuple): iterator of lines of the source and an
+            object that has to be closed once reading is finished (None
+            if the caller owns the source)
+
+    Raises:
+        TypeError: If the source is not of any supported type
+    """
+    if isinstance(source, (str, os.PathLike)):
+        handle = open(source, 'rb')
+        try:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be memory-mapped
+            return iter(()), handle
+        handle.close()
+        return _buffer_lines(buffer), buffer
+
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        return _buffer_lines(source), None
+
+    if hasattr(source, 'readline'):
+        return iter(source.readline, source.read(0)), None
+
+    raise TypeError("Source must be a path, a file object or a buffer.")
+
+
+def _buffer_lines(buffer):
+    """
+    This function lazily splits a buffer into lines, so that only
+    a single line is copied out of the buffer at a time
+
+    Arguments:
+        buffer: bytes, bytearray or memory-mapped file
+
+    Returns:
+        Generator of lines (bytes) of the buffer
+    """
+    start = 0
+    end_of_buffer = len(buffer)
+
+    while start < end_of_buffer:
+        end = buffer.find(b'\n', start)
+        if end == -1:
+            end = end_of_buffer
+        yield buffer[start:end]
+        start = end + 1
+
+
+def read_fasta(source, sequence_class=DNASequence):
+    """
+    This function lazily parses a FASTA or multi-FASTA source and yields
+    one sequence object per record. Only the record that is currently
+    being built is kept in memory, so memory use does not depend on the
+    size of the whole file. Both the standard FASTA layout and the
+    FASTA-like layout produced by Sequence.__str__ are accepted. The
+    identifier of a record is the first word of its header, as in
+    SequenceStore.
+
+    Arguments:
+        source: A path to a file, an open text or binary file object,
+            or a buffer (bytes, bytearray, mmap)
+        sequence_class (type): Class of the created objects, one of
+            DNASequence, RNASequence or ProteinSequence
+
+    Returns:
+        Generator of sequence_class objects, one for every record
+
+    Raises:
+        ValueError: If sequence data is found before the first header
+        TypeError: If the source is not of any supported type
+    """
+    lines, closeable = _open_lines(source)
+    identifier = None
+    chunks = []
+
+    try:
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode('ascii')
+            line = line.strip()
+
+            if not line or line.startswith(';'):
+                continue
+
+            if line.startswith('>'):
+                if identifier is not None:
+                    yield sequence_class(''.join(chunks), identifier)
+                # like samtools, a record is named by the first word of
+                # its header, the rest is a description
+                header = line[1:].split(None, 1)
+                identifier = header[0] if header else ''
+                chunks = []
+            elif identifier is None:
+                raise ValueError("Sequence data found before the first"
+                                 " FASTA header.")
+            else:
+                chunks.append(line)
+
+        if identifier is not None:
+            yield sequence_class(''.join(chunks), identifier)
+    finally:
+        if closeable is not None:
+            closeable.close()
+
+
+def write_fasta(sequences, destination, line_width=60, batch_size=1000):
+    """
+    This function writes sequence objects in the FASTA format. Records
+    are formatted in batches and every batch is passed to the file in a
+    single write call, so any iterable (also a generator returned by
+    read_fasta) can be written without being fully loaded into memory.
+
+    Arguments:
+        sequences (iterable): Sequence objects to be written
+        destination: A path to a file or an open text file object
+        line_width (int): Maximal number of residues in one line,
+            0 means that every sequence is written in a single line
+        batch_size (int): Number of records formatted per write call
+
+    Returns:
+        written (int): Number of written records
+
+    Raises:
+        ValueError: If line_width is negative or batch_size is not
+            greater than 0
+    """
+    if not isinstance(line_width, int) or line_width < 0:
+        raise ValueError("line_width must be a non-negative integer.")
+
+    if not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError("batch_size must be an integer greater than 0.")
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, 'w') as handle:
+            return write_fasta(sequences, handle, line_width, batch_size)
+
+    written = 0
+    batch = []
+
+    for sequence in sequences:
+        batch.append(_format_record(sequence, line_width))
+        written += 1
+
+        if len(batch) == batch_size:
+            destination.write(''.join(batch))
+            batch = []
+
+    if batch:
+        destination.write(''.join(batch))
+
+    return written
+
+
+def _format_record(sequence, line_width):
+    """
+    This function formats a single sequence object as a FASTA record
+
+    Arguments:
+        sequence (Sequence): object to be formatted
+        line_width (int): Maximal number of residues in one line
+
+    Returns:
+        record (str): FASTA record ending with a newline
+    """
+    data = str(sequence.data)
+    record = io.StringIO()
+    record.write(f">{sequence.identifier}\n")
+
+    if not line_width:
+        record.write(data + "\n")
+    else:
+        for i in range(0, len(data), line_width):
+            record.write(data[i:i + line_width] + "\n")
+
+    return record.getvalue()
+
+
+if __name__ == '__main__':
+    from biological_sequences import ProteinSequence
+
+    fasta_text = (">HumanDNA\nATCGGCTAAT\nCGAAGCT\n"
+                  ">MouseDNA\nGGGCTTAA\n")
+
+    print("Records read from a FASTA buffer:")
+    for record in read_fasta(fasta_text.encode()):
+        print(record)
+
+    output = io.StringIO()
+    proteins = [ProteinSequence("MSRSLLLRFLLFLLLLPPLP", "Hemoglobin")]
+    write_fasta(proteins, output, line_width=8)
+    print(f"\nProtein written in the FASTA format:\n{output.getvalue()}")
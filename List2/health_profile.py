@@ -1,15 +1,93 @@
+import sys
 from datetime import date
-from statistics import mean, stdev
+from numbers import Integral
+
+from running_statistics import RunningStatistics
+
+# valid ranges of the age (in years), the weight (in kg) and the height
+# (in cm) of a patient
+AGE_RANGE = (0, 120)
+WEIGHT_RANGE = (2, 300)
+HEIGHT_RANGE = (50, 270)
+
+
+def _field(position, column, convert):
+    """
+    This function creates a property of a patient's field, which is kept
+    by the profile itself or in a column of its cohort
+
+    Arguments:
+        position (int): position of the field in the profile's own data
+        column (str): name of the cohort's column
+        convert (type): type of values read from the column (NumPy
+            scalars become Python numbers), values written to it have to
+            be of this type
+
+    Returns:
+        property: the field's property
+    """
+    def get(self):
+        if self._index is None:
+            return self._columns[position]
+        return convert(getattr(self._columns, column)[self._index])
+
+    def set(self, value):
+        if self._index is None:
+            self._columns[position] = value
+            return
+
+        # a cohort keeps its columns valid, like its constructor does
+        if convert is str:
+            if not isinstance(value, str):
+                raise ValueError("Name has to be a string.")
+            value = sys.intern(value)
+        elif isinstance(value, bool) or not isinstance(value, Integral):
+            raise ValueError("Invalid data provided, integer expected.")
+        try:
+            getattr(self._columns, column)[self._index] = value
+        except OverflowError:
+            raise ValueError("Invalid data provided, integer out of"
+                             " range.") from None
+
+    return property(get, set)
 
 
 class HealthProfile:
+    """
+    This class represents a patient. A profile either holds its own data
+    or is a view of a row of a Cohort (see cohort.py), reading and
+    writing its columns, so it takes just two slots.
+    """
+    __slots__ = ('_columns', '_index')
+
     range_of_healthy_bmi = (18.5, 24.9)
 
     def __init__(self, name, dob, height, weight):
-        self.name = name
-        self.dob = dob  # year of birth
-        self.height = height  # in cm
-        self.weight = weight  # in kg
+        # dob is the year of birth, height in cm and weight in kg
+        self._columns = [name, dob, height, weight]
+        self._index = None
+
+    @classmethod
+    def view(cls, cohort, index):
+        """
+        This function creates a profile backed by a row of a cohort
+
+        Arguments:
+            cohort (Cohort): cohort holding the data
+            index (int): number of the row
+
+        Returns:
+            HealthProfile: a view of the row
+        """
+        profile = cls.__new__(cls)
+        profile._columns = cohort
+        profile._index = index
+        return profile
+
+    name = _field(0, 'names', str)
+    dob = _field(1, 'dob', int)
+    height = _field(2, 'height', int)
+    weight = _field(3, 'weight', int)
 
     def get_age(self):
         """
@@ -32,7 +110,7 @@ class HealthProfile:
         today = date.today()
         age = today.year - self.dob
 
-        if age < 0 or age > 120:
+        if age < AGE_RANGE[0] or age > AGE_RANGE[1]:
             raise ValueError("Provided age of this patient is impossible.")
         else:
             return age
@@ -76,47 +154,77 @@ class HealthProfile:
         if not isinstance(self.height, int):
             raise ValueError("Invalid height provided, integer expected")
 
-        if self.weight > 300 or self.weight < 2:
+        if self.weight > WEIGHT_RANGE[1] or self.weight < WEIGHT_RANGE[0]:
             raise ValueError("Weight of this patient is impossible.")
 
-        elif self.height > 270 or self.height < 50:
+        elif (self.height > HEIGHT_RANGE[1]
+              or self.height < HEIGHT_RANGE[0]):
             raise ValueError("Height of this patient is impossible.")
 
         else:
             bmi = self.weight / ((self.height / 100) ** 2)
             return round(bmi, 2)
 
+    @staticmethod
+    def accumulate_age_stats(patients, stats=None):
+        """
+        This function accumulates statistics of ages of patients in
+        a single pass, so patients may come from a generator (e.g. read
+        from a file) and are never held in memory. Statistics of parts of
+        a cohort can be merged (see RunningStatistics.merge).
+
+        Arguments:
+            patients (iterable): patients
+            stats (RunningStatistics): statistics to update, new ones by
+                default
+
+        Returns:
+            stats (RunningStatistics): statistics of ages (count, mean,
+                variance, minimum, maximum and approximate quantiles)
+
+        Raises:
+            ValueError: If patients are not an iterable (a string is not
+                accepted) of HealthProfile objects or the age of any
+                patient is invalid
+        """
+        if isinstance(patients, (str, bytes)):
+            raise ValueError("patients must be an iterable of patients")
+        try:
+            patients = iter(patients)
+        except TypeError:
+            raise ValueError("patients must be an iterable") from None
+
+        if stats is None:
+            stats = RunningStatistics()
+        for patient in patients:
+            if not isinstance(patient, HealthProfile):
+                raise ValueError("This is not a patient. Only patients"
+                                 " have ages.")
+            stats.add(patient.get_age())
+        return stats
+
     @staticmethod
     def calculate_age_stats(patients_list):
         """
         This function calculates mean and standard deviation of ages
-        from a list of patients
+        from patients in a single pass (see accumulate_age_stats)
 
         Arguments:
-            patients_list (list): List of patients
+            patients_list (iterable): List (or any iterable) of patients
 
         Returns:
-            mean_age (float): mean age of list of patients calculated
-            by a function mean from statistics module
+            mean_age (float): mean age of patients
 
-            std_dev_age (float): standard deviation of age of a list of
-            patients calculated by a function stdev imported from
-            statistics module
+            std_dev_age (float): sample standard deviation of age of
+            patients
 
         Raises:
-            ValueError: If patients_list is not a list
+            ValueError: If patients_list is not an iterable of patients,
+                contains fewer than two patients or the age of any
+                patient is invalid
         """
-        if not isinstance(patients_list, list):
-            raise ValueError("patients_list must be a list")
-
-        ages = []
-        for patient in patients_list:
-            age = patient.get_age()
-            ages.append(age)
-
-        mean_age = mean(ages)
-        std_dev_age = stdev(ages)
-        return mean_age, std_dev_age
+        stats = HealthProfile.accumulate_age_stats(patients_list)
+        return stats.mean, stats.stdev()
 
     @staticmethod
     def find_people_at_risk(patients_list):
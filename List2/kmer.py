@@ -0,0 +1,219 @@
+"""
+Module for counting k-mers (substrings of length k) of DNA strands.
+It follows the idea of shingles from List3 - a multiset of all windows
+of length k - but every k-mer is kept as a 2-bit encoded integer updated
+by a rolling hash, so no string is created for any position.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BASES = 'ACGT'
+MAX_K = 32
+# k-mers of at most this length are counted in a flat array with one
+# counter for every possible k-mer (4 ** 10 counters take 8 MB), if the
+# strand is long enough for the array to be densely filled
+MAX_ARRAY_K = 10
+
+_BASE_CODES = bytes(BASES.index(chr(byte)) if chr(byte) in BASES
+                    else len(BASES) for byte in range(256))
+
+
+def _check_k(k):
+    """
+    This function checks the length of k-mers
+
+    Arguments:
+        k (int): length of k-mers
+
+    Raises:
+        TypeError: If k is not an integer
+        ValueError: If k is not from 1 to MAX_K
+    """
+    if not isinstance(k, int) or isinstance(k, bool):
+        raise TypeError("k must be an integer.")
+
+    if not 0 < k <= MAX_K:
+        raise ValueError(f"k must be from 1 to {MAX_K}.")
+
+
+def encode_kmer(kmer):
+    """
+    This function encodes a k-mer as an integer, two bits per base,
+    with the first base in the most significant bits
+
+    Arguments:
+        kmer (str): k-mer made of bases A, C, G, T
+
+    Returns:
+        code (int): code of the k-mer
+
+    Raises:
+        ValueError: If the k-mer contains invalid bases
+    """
+    code = 0
+    for base in kmer:
+        if base not in BASES:
+            raise ValueError("Invalid k-mer provided.")
+        code = (code << 2) | BASES.index(base)
+    return code
+
+
+def decode_kmer(code, k):
+    """
+    This function decodes a k-mer from its integer code
+
+    Arguments:
+        code (int): code of the k-mer
+        k (int): length of the k-mer
+
+    Returns:
+        kmer (str): decoded k-mer
+    """
+    return ''.join(BASES[(code >> (2 * (k - 1 - i))) & 3] for i in range(k))
+
+
+def count_kmer_codes(data, k, canonical=False, use_numpy=False):
+    """
+    This function counts codes of all k-mers of a DNA strand. A canonical
+    k-mer is the smaller (by code) of a k-mer and its reverse complement,
+    so it does not depend on the strand the k-mer was read from.
+
+    Arguments:
+        data (str): DNA strand made of bases A, C, G, T
+        k (int): length of k-mers
+        canonical (bool): If True, canonical k-mers are counted
+        use_numpy (bool): If True and NumPy is available, codes of all
+            k-mers are computed as a uint64 array and counted with
+            numpy.unique
+
+    Returns:
+        counts (dict): code of a k-mer as a key and number of its
+            occurrences as an item
+
+    Raises:
+        TypeError: If k is not an integer
+        ValueError: If k is out of range or data contains invalid bases
+    """
+    _check_k(k)
+
+    codes = data.encode('ascii', 'replace').translate(_BASE_CODES)
+    if codes.translate(None, bytes(range(len(BASES)))):
+        raise ValueError("Invalid value provided.")
+
+    if len(codes) < k:
+        return {}
+
+    if use_numpy and np is not None:
+        return _count_numpy(codes, k, canonical)
+
+    return _count_rolling(codes, k, canonical)
+
+
+def _count_rolling(codes, k, canonical):
+    """
+    This function counts k-mer codes with a rolling hash: the code of
+    the next k-mer is obtained from the previous one by shifting out
+    its first base and adding the new one, and the code of the reverse
+    complement is updated in the opposite direction
+
+    Arguments:
+        codes (bytes): 2-bit codes of bases
+        k (int): length of k-mers
+        canonical (bool): If True, canonical k-mers are counted
+
+    Returns:
+        counts (dict): code of a k-mer as a key and number of its
+            occurrences as an item
+    """
+    mask = (1 << (2 * k)) - 1
+    shift = 2 * (k - 1)
+    use_array = k <= MAX_ARRAY_K and 4 ** k <= len(codes)
+    counter = array('Q', bytes(8 << (2 * k))) if use_array else {}
+    code = 0
+    reverse_code = 0
+
+    for position, base in enumerate(codes):
+        code = ((code << 2) | base) & mask
+        reverse_code = (reverse_code >> 2) | ((3 - base) << shift)
+
+        if position < k - 1:
+            continue
+
+        key = min(code, reverse_code) if canonical else code
+        if use_array:
+            counter[key] += 1
+        else:
+            counter[key] = counter.get(key, 0) + 1
+
+    if use_array:
+        return {key: count for key, count in enumerate(counter) if count}
+
+    return counter
+
+
+def _count_numpy(codes, k, canonical):
+    """
+    This function computes codes of all k-mers at once as a uint64 array
+    (k vectorized shift-or steps) and counts them with numpy.unique
+
+    Arguments:
+        codes (bytes): 2-bit codes of bases
+        k (int): length of k-mers
+        canonical (bool): If True, canonical k-mers are counted
+
+    Returns:
+        counts (dict): code of a k-mer as a key and number of its
+            occurrences as an item
+    """
+    bases = np.frombuffer(codes, dtype=np.uint8).astype(np.uint64)
+    windows = len(bases) - k + 1
+    kmer_codes = np.zeros(windows, dtype=np.uint64)
+
+    for i in range(k):
+        kmer_codes <<= np.uint64(2)
+        kmer_codes |= bases[i:i + windows]
+
+    if canonical:
+        complements = np.uint64(3) - bases
+        reverse_codes = np.zeros(windows, dtype=np.uint64)
+        for i in range(k):
+            reverse_codes |= complements[i:i + windows] << np.uint64(2 * i)
+        kmer_codes = np.minimum(kmer_codes, reverse_codes)
+
+    unique_codes, counts = np.unique(kmer_codes, return_counts=True)
+    return dict(zip(unique_codes.tolist(), counts.tolist()))
+
+
+def kmer_counts(data, k, canonical=False, use_numpy=False):
+    """
+    This function creates a multiset (dictionary) of k-mers of a DNA
+    strand. Only distinct k-mers are decoded to strings.
+
+    Arguments:
+        data (str): DNA strand made of bases A, C, G, T
+        k (int): length of k-mers
+        canonical (bool): If True, canonical k-mers are counted
+        use_numpy (bool): If True, NumPy is used (when it is installed)
+
+    Returns:
+        counts (dict): k-mer as a key and number of its occurrences as
+            an item
+
+    Raises:
+        TypeError: If k is not an integer
+        ValueError: If k is out of range or data contains invalid bases
+    """
+    codes = count_kmer_codes(data, k, canonical, use_numpy)
+    return {decode_kmer(code, k): count for code, count in codes.items()}
+
+
+if __name__ == '__main__':
+    strand = "ATCGGCTAATCGAAGCT"
+
+    print(f"3-mers of {strand}: {kmer_counts(strand, 3)}")
+    print(f"Canonical 3-mers of {strand}:"
+          f" {kmer_counts(strand, 3, canonical=True)}")
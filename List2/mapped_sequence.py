@@ -0,0 +1,194 @@
+"""
+Module containing a read-only view of a sequence stored in a FASTA file,
+which reads bases directly from a memory-mapped file instead of keeping
+a copy of the whole sequence in memory
+"""
+ITERATION_CHUNK = 4096
+LINE_ENDINGS = b'\r\n'
+
+
+class MappedSequence:
+    """
+    This class represents a sequence (or its region) stored in lines of
+    equal length in a buffer, usually a memoryview of a memory-mapped
+    FASTA file. Every line holds line_bases bases and takes line_bytes
+    bytes together with its line ending, so the byte holding any base is
+    computed directly and only pages covering the requested bases are
+    read by indexing, slicing and iteration.
+    """
+    __slots__ = ('_buffer', '_start', '_length', '_line_bases',
+                 '_line_bytes')
+
+    def __init__(self, buffer, length, line_bases, line_bytes, start=0):
+        """
+        This function creates a view of a sequence
+
+        Arguments:
+            buffer: bytes-like object (e.g. memoryview) starting with the
+                first base of the whole sequence
+            length (int): number of bases of the view
+            line_bases (int): number of bases in a full line
+            line_bytes (int): number of bytes of a full line with its
+                line ending
+            start (int): position of the first base of the view in the
+                whole sequence
+
+        Raises:
+            ValueError: If the layout of lines is invalid
+        """
+        if length and (line_bases <= 0 or line_bytes < line_bases):
+            raise ValueError("Invalid layout of lines provided.")
+
+        self._buffer = buffer
+        self._start = start
+        self._length = length
+        self._line_bases = line_bases
+        self._line_bytes = line_bytes
+
+    def _offset(self, position):
+        """
+        This function computes the offset of the byte holding a base
+
+        Arguments:
+            position (int): position of the base in the view
+
+        Returns:
+            offset (int): offset of the byte in the buffer
+        """
+        line, column = divmod(self._start + position, self._line_bases)
+        return line * self._line_bytes + column
+
+    def _read(self, start, stop):
+        """
+        This function reads bases from start (inclusive) to stop
+        (exclusive), skipping line endings between them
+
+        Arguments:
+            start (int): position of the first read base
+            stop (int): position after the last read base
+
+        Returns:
+            text (str): read bases
+        """
+        if start >= stop:
+            return ''
+        raw = self._buffer[self._offset(start):self._offset(stop - 1) + 1]
+        return bytes(raw).translate(None, LINE_ENDINGS).decode('ascii')
+
+    def __len__(self):
+        """
+        This function returns the number of bases of the view without
+        reading any of them
+
+        Returns:
+            self._length (int): length of the view
+        """
+        return self._length
+
+    def __getitem__(self, key):
+        """
+        This function returns a single base or a slice of the view
+
+        Arguments:
+            key (int or slice): position or positions of bases
+
+        Returns:
+            base or bases (str): requested part of the view
+
+        Raises:
+            IndexError: If the position is out of range
+            TypeError: If the key is neither an integer nor a slice
+        """
+        if isinstance(key, slice):
+            positions = range(*key.indices(self._length))
+            if not positions:
+                return ''
+            if positions.step == 1:
+                return self._read(positions.start, positions.stop)
+
+            low = min(positions[0], positions[-1])
+            text = self._read(low, max(positions[0], positions[-1]) + 1)
+            return ''.join([text[i - low] for i in positions])
+
+        if not isinstance(key, int):
+            raise TypeError("Indices must be integers or slices.")
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("Position out of range.")
+
+        return self._read(key, key + 1)
+
+    def __iter__(self):
+        """
+        This function iterates over bases of the view reading them chunk
+        by chunk
+
+        Returns:
+            Generator of bases (str)
+        """
+        for start in range(0, self._length, ITERATION_CHUNK):
+            yield from self._read(start,
+                                  min(start + ITERATION_CHUNK, self._length))
+
+    def __str__(self):
+        """
+        This function reads all bases of the view
+
+        Returns:
+            text (str): the view as a string
+        """
+        return self._read(0, self._length)
+
+    def __repr__(self):
+        return (f"MappedSequence(<{self._length} bases from position"
+                f" {self._start}>)")
+
+    def __eq__(self, other):
+        """
+        This function compares the view with another view or a string
+
+        Arguments:
+            other (MappedSequence or str): compared sequence
+
+        Returns:
+            bool: True if both sequences consist of the same bases
+        """
+        if isinstance(other, (MappedSequence, str)):
+            return len(other) == self._length and str(self) == str(other)
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def region(self, start, end):
+        """
+        This function creates a view of a region of the view without
+        reading or copying any bases
+
+        Arguments:
+            start (int): position of the first base of the region
+            end (int): position after the last base of the region
+
+        Returns:
+            region (MappedSequence): view of the region
+
+        Raises:
+            ValueError: If the region is out of the view
+        """
+        if (not isinstance(start, int) or not isinstance(end, int)
+                or not 0 <= start <= end <= self._length):
+            raise ValueError("Invalid region provided.")
+
+        return MappedSequence(self._buffer, end - start, self._line_bases,
+                              self._line_bytes, self._start + start)
+
+
+if __name__ == '__main__':
+    fasta_lines = b"ATCGGCTAAT\nCGAAGCTGGG\nCCC\n"
+    mapped = MappedSequence(memoryview(fasta_lines), 23, 10, 11)
+
+    print(f"Mapped sequence: {mapped} ({len(mapped)} bases)")
+    print(f"Bases from 8 to 12: {mapped[8:12]}")
+    print(f"Region from 5 to 15: {mapped.region(5, 15)}")
@@ -0,0 +1,363 @@
+"""
+Module containing index structures used for searching motifs in
+biological sequences: a suffix array for repeated queries on a single
+sequence and an Aho-Corasick automaton for finding many motifs in
+a single pass over a sequence, as well as bit-parallel searches of
+approximate occurrences of a motif
+"""
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+
+class SuffixArray:
+    """
+    This class represents a suffix array of a text - the starting
+    positions of all suffixes of the text in lexicographical order.
+    Every occurrence of a motif is a prefix of one of the suffixes, so
+    all occurrences form a contiguous block of the array, which is
+    found by binary search in O(m log n) time.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.suffixes = self._build(text)
+
+    @staticmethod
+    def _build(text):
+        """
+        This function sorts suffixes of the text with the prefix
+        doubling algorithm: in every round suffixes are ranked by their
+        first 2k characters using ranks of the first k characters
+
+        Arguments:
+            text (str): text to be indexed
+
+        Returns:
+            suffixes (list): starting positions of sorted suffixes
+        """
+        length = len(text)
+        suffixes = list(range(length))
+        rank = [ord(char) for char in text]
+        k = 1
+
+        while True:
+            def key(i):
+                return rank[i], rank[i + k] if i + k < length else -1
+
+            suffixes.sort(key=key)
+
+            new_rank = [0] * length
+            for previous, current in zip(suffixes, suffixes[1:]):
+                new_rank[current] = (new_rank[previous]
+                                     + (key(previous) != key(current)))
+            rank = new_rank
+
+            if length == 0 or rank[suffixes[-1]] == length - 1:
+                return suffixes
+            k *= 2
+
+    def find(self, motif):
+        """
+        This function finds all starting positions of a motif in the
+        indexed text
+
+        Arguments:
+            motif (str): motif to be found
+
+        Returns:
+            positions (list): sorted starting positions of the motif
+        """
+        motif_length = len(motif)
+
+        def prefix(i):
+            return self.text[i:i + motif_length]
+
+        start = bisect_left(self.suffixes, motif, key=prefix)
+        end = bisect_right(self.suffixes, motif, lo=start, key=prefix)
+
+        return sorted(self.suffixes[start:end])
+
+
+class AhoCorasick:
+    """
+    This class represents an Aho-Corasick automaton built from a set of
+    motifs. The automaton is a trie of the motifs extended by failure
+    links, which lets it report all (also overlapping) occurrences of
+    all motifs while reading the text only once.
+    """
+
+    def __init__(self, motifs):
+        self.motifs = {}
+        self.transitions = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for motif in motifs:
+            self._add(motif)
+
+        self._link()
+
+    def _add(self, motif):
+        """
+        This function adds a motif to the trie of the automaton
+
+        Arguments:
+            motif (str): motif to be added
+
+        Raises:
+            ValueError: If an empty motif was provided
+        """
+        if not motif:
+            raise ValueError("Invalid motif provided.")
+
+        if motif in self.motifs:
+            return
+
+        state = 0
+        for char in motif:
+            if char not in self.transitions[state]:
+                self.transitions.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.transitions[state][char] = len(self.transitions) - 1
+            state = self.transitions[state][char]
+
+        self.output[state].append(motif)
+        self.motifs[motif] = state
+
+    def _link(self):
+        """
+        This function computes failure links of the trie in breadth
+        first order and merges outputs of states linked by them
+        """
+        queue = deque(self.transitions[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self.transitions[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.transitions[fallback].get(char, 0)
+                self.output[child] = (self.output[child]
+                                      + self.output[self.fail[child]])
+
+    def search(self, text):
+        """
+        This function scans the text once and yields every occurrence of
+        every motif of the automaton
+
+        Arguments:
+            text (str): text to be searched
+
+        Returns:
+            Generator of tuples (motif, start, end), where start and end
+                are positions of the first and the last character of
+                an occurrence
+        """
+        transitions = self.transitions
+        fail = self.fail
+        output = self.output
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+
+            for motif in output[state]:
+                yield motif, position - len(motif) + 1, position
+
+    def find_all(self, text):
+        """
+        This function finds positions of all motifs of the automaton in
+        the text
+
+        Arguments:
+            text (str): text to be searched
+
+        Returns:
+            motif_positions (dict): motif as a key and list of tuples
+                (start, end) of its occurrences as an item
+        """
+        motif_positions = {motif: [] for motif in self.motifs}
+
+        for motif, start, end in self.search(text):
+            motif_positions[motif].append((start, end))
+
+        return motif_positions
+
+
+def _check_approximate(motif, max_errors):
+    """
+    This function checks arguments of approximate searches
+
+    Raises:
+        ValueError: If the motif is empty or max_errors is not
+            a non-negative integer
+    """
+    if not motif:
+        raise ValueError("Motif cannot be empty.")
+
+    if (not isinstance(max_errors, int) or isinstance(max_errors, bool)
+            or max_errors < 0):
+        raise ValueError("Number of errors must be a non-negative"
+                         " integer.")
+
+
+def find_mismatches(text, motif, max_mismatches):
+    """
+    This function finds all occurrences of a motif with at most
+    max_mismatches substituted characters with the Shift-Add algorithm.
+    A single integer holds a counter of mismatches for every prefix of
+    the motif, all of them are updated by one shift and one addition per
+    character of the text, so the text is scanned once whatever the
+    number of allowed mismatches is.
+
+    Arguments:
+        text (str): text to be searched
+        motif (str): searched motif
+        max_mismatches (int): maximal number of mismatches
+
+    Returns:
+        motif_positions (list of tuples): tuples (start, end, mismatches)
+            of all occurrences, also overlapping ones
+
+    Raises:
+        ValueError: If the motif is empty or max_mismatches is invalid
+    """
+    _check_approximate(motif, max_mismatches)
+
+    length = len(motif)
+    width = length.bit_length()
+    field = (1 << width) - 1
+    mask = (1 << (width * length)) - 1
+    last = width * (length - 1)
+
+    # field i of a mask is 1 if the character differs from motif[i]
+    all_fields = sum(1 << (width * i) for i in range(length))
+    masks = {char: all_fields for char in set(text)}
+    for i, char in enumerate(motif):
+        if char in masks:
+            masks[char] -= 1 << (width * i)
+
+    motif_positions = []
+    state = 0
+
+    for position, char in enumerate(text):
+        state = ((state << width) + masks[char]) & mask
+        if position >= length - 1:
+            mismatches = (state >> last) & field
+            if mismatches <= max_mismatches:
+                motif_positions.append((position - length + 1, position,
+                                        mismatches))
+
+    return motif_positions
+
+
+def find_edits(text, motif, max_edits):
+    """
+    This function finds all occurrences of a motif with an edit distance
+    (substitutions, insertions and deletions) of at most max_edits with
+    Myers' bit-parallel algorithm. A column of the edit distance matrix
+    is kept as two bit vectors of vertical differences, which are
+    updated with a few bitwise operations per character of the text.
+
+    Arguments:
+        text (str): text to be searched
+        motif (str): searched motif
+        max_edits (int): maximal edit distance
+
+    Returns:
+        motif_positions (list of tuples): tuples (start, end, edits) for
+            every end of an occurrence, with the start of the closest in
+            length fragment of the text at the minimal distance
+
+    Raises:
+        ValueError: If the motif is empty or max_edits is invalid
+    """
+    _check_approximate(motif, max_edits)
+
+    length = len(motif)
+    mask = (1 << length) - 1
+    high = 1 << (length - 1)
+
+    equal = {}
+    for i, char in enumerate(motif):
+        equal[char] = equal.get(char, 0) | (1 << i)
+
+    positive = mask
+    negative = 0
+    distance = length
+    motif_positions = []
+
+    for position, char in enumerate(text):
+        matches = equal.get(char, 0)
+        vertical = matches | negative
+        horizontal = (((matches & positive) + positive) ^ positive) | matches
+        positive_h = negative | (~(horizontal | positive) & mask)
+        negative_h = positive & horizontal
+
+        if positive_h & high:
+            distance += 1
+        elif negative_h & high:
+            distance -= 1
+
+        positive_h = (positive_h << 1) & mask
+        negative_h = (negative_h << 1) & mask
+        positive = negative_h | (~(vertical | positive_h) & mask)
+        negative = positive_h & vertical
+
+        if distance <= max_edits:
+            start = _edit_start(text, motif, position, distance)
+            motif_positions.append((start, position, distance))
+
+    return motif_positions
+
+
+def _edit_start(text, motif, end, edits):
+    """
+    This function finds the start of an approximate occurrence ending at
+    a given position, computing edit distances of the motif and
+    fragments of the text ending there (at most len(motif) + edits long)
+
+    Arguments:
+        text (str): searched text
+        motif (str): searched motif
+        end (int): position of the last character of the occurrence
+        edits (int): edit distance of the occurrence
+
+    Returns:
+        start (int): start of the fragment at distance edits, the one of
+            the length closest to the length of the motif
+    """
+    window = text[max(0, end + 1 - len(motif) - edits):end + 1][::-1]
+    reversed_motif = motif[::-1]
+    column = list(range(len(motif) + 1))
+    best = (len(motif), 0) if column[-1] == edits else None
+
+    for size, char in enumerate(window, 1):
+        previous = column
+        column = [size]
+        for i, motif_char in enumerate(reversed_motif, 1):
+            column.append(min(previous[i - 1] + (motif_char != char),
+                              previous[i] + 1, column[i - 1] + 1))
+        if column[-1] == edits and (best is None
+                                    or abs(size - len(motif)) < best[0]):
+            best = (abs(size - len(motif)), size)
+
+    return end - best[1] + 1
+
+
+if __name__ == '__main__':
+    text = "ATCGGCTAATCGAAGCT"
+
+    index = SuffixArray(text)
+    print(f"Suffix array of {text}: {index.suffixes}")
+    print(f"Positions of 'GCT': {index.find('GCT')}")
+
+    automaton = AhoCorasick(["GCT", "ATC", "CG"])
+    print(f"Positions of all motifs: {automaton.find_all(text)}")
+    print(f"Occurrences of 'GCA' with 1 mismatch:"
+          f" {find_mismatches(text, 'GCA', 1)}")
@@ -0,0 +1,219 @@
+"""
+Module containing a log of mutations of a sequence, which records
+insertions, substitutions and deletions without copying the sequence
+and builds the mutated sequence only once, when it is needed
+"""
+
+INSERTION = 'insert'
+SUBSTITUTION = 'substitute'
+DELETION = 'delete'
+
+# insertions at a position are placed before the base at this position,
+# so they are applied before substitutions and deletions starting there
+_KIND_ORDER = {INSERTION: 0, SUBSTITUTION: 1, DELETION: 1}
+
+
+class MutationLog:
+    """
+    This class represents a list of mutations of an original sequence.
+    All positions refer to the original sequence (as positions in
+    a variant file refer to the reference genome), so the order in
+    which mutations are recorded does not matter, except for many
+    insertions at the same position, which are kept in recording order.
+    The mutated sequence is built in a single pass over the original
+    one, in O(n + k log k) time for k mutations.
+    """
+
+    def __init__(self, data, valid_chars=None):
+        """
+        This function creates an empty log of mutations
+
+        Arguments:
+            data (str or PackedSequence): original sequence, it is never
+                modified
+            valid_chars (set): If provided, values of mutations are
+                checked against it
+        """
+        self.data = data
+        self.valid_chars = valid_chars
+        self.mutations = []
+        self._length_change = 0
+        self._mutated = None
+
+    def _check_position(self, position, last_position):
+        """
+        This function checks that a position is an integer from 0 to
+        last_position
+
+        Raises:
+            ValueError: If the position is invalid
+        """
+        if (not isinstance(position, int) or isinstance(position, bool)
+                or not 0 <= position <= last_position):
+            raise ValueError("Invalid position provided")
+
+    def _check_value(self, value):
+        """
+        This function checks that a value is a non-empty string of
+        valid chars
+
+        Raises:
+            ValueError: If the value is invalid
+        """
+        if not isinstance(value, str) or not value:
+            raise ValueError("Invalid value provided")
+        if (self.valid_chars is not None
+                and not self.valid_chars.issuperset(value)):
+            raise ValueError("Invalid value provided")
+
+    def _record(self, kind, position, value, length_change):
+        """
+        This function appends a mutation to the log together with keys
+        used to sort mutations when the sequence is built
+        """
+        self.mutations.append((position, _KIND_ORDER[kind],
+                               len(self.mutations), kind, value))
+        self._length_change += length_change
+        self._mutated = None
+
+    def insert(self, position, value):
+        """
+        This function records an insertion of a value before the base
+        at a given position (or at the end, if position equals length)
+
+        Arguments:
+            position (int): position in the original sequence
+            value (str): inserted bases
+
+        Raises:
+            ValueError: If position or value is invalid
+        """
+        self._check_position(position, len(self.data))
+        self._check_value(value)
+        self._record(INSERTION, position, value, len(value))
+
+    def substitute(self, position, value):
+        """
+        This function records a substitution of bases starting at
+        a given position by a value of the same length
+
+        Arguments:
+            position (int): position in the original sequence
+            value (str): new bases
+
+        Raises:
+            ValueError: If position or value is invalid or the value
+                does not fit into the sequence
+        """
+        self._check_value(value)
+        self._check_position(position, len(self.data) - len(value))
+        self._record(SUBSTITUTION, position, value, 0)
+
+    def delete(self, position, length=1):
+        """
+        This function records a deletion of bases starting at a given
+        position
+
+        Arguments:
+            position (int): position in the original sequence
+            length (int): number of deleted bases
+
+        Raises:
+            ValueError: If position or length is invalid
+        """
+        if not isinstance(length, int) or length <= 0:
+            raise ValueError("Invalid length provided")
+        self._check_position(position, len(self.data) - length)
+        self._record(DELETION, position, length, -length)
+
+    def apply(self, mutations):
+        """
+        This function records many mutations at once
+
+        Arguments:
+            mutations (iterable): tuples (kind, position, value), where
+                kind is 'insert', 'substitute' or 'delete' and value is
+                the number of deleted bases for deletions
+
+        Returns:
+            self: the log, so that calls can be chained
+
+        Raises:
+            ValueError: If any mutation is invalid
+        """
+        recorders = {INSERTION: self.insert,
+                     SUBSTITUTION: self.substitute,
+                     DELETION: self.delete}
+
+        for kind, position, value in mutations:
+            if kind not in recorders:
+                raise ValueError("Invalid mutation kind provided")
+            recorders[kind](position, value)
+
+        return self
+
+    def __len__(self):
+        """
+        This function calculates the length of the mutated sequence
+        without building it
+
+        Returns:
+            int: length of the mutated sequence
+        """
+        return len(self.data) + self._length_change
+
+    def materialize(self):
+        """
+        This function builds the mutated sequence. The result is cached
+        until another mutation is recorded.
+
+        Returns:
+            mutated (str): the mutated sequence
+
+        Raises:
+            ValueError: If substitutions or deletions overlap each other
+        """
+        if self._mutated is not None:
+            return self._mutated
+
+        pieces = []
+        cursor = 0
+
+        for position, _, _, kind, value in sorted(self.mutations):
+            if position < cursor:
+                raise ValueError("Overlapping mutations provided")
+
+            pieces.append(self.data[cursor:position])
+
+            if kind == INSERTION:
+                pieces.append(value)
+                cursor = position
+            elif kind == SUBSTITUTION:
+                pieces.append(value)
+                cursor = position + len(value)
+            else:
+                cursor = position + value
+
+        pieces.append(self.data[cursor:])
+        self._mutated = ''.join(pieces)
+        return self._mutated
+
+    def __str__(self):
+        """
+        This function returns the mutated sequence
+
+        Returns:
+            mutated (str): the mutated sequence
+        """
+        return self.materialize()
+
+
+if __name__ == '__main__':
+    log = MutationLog("ATCGGCTAATCGAAGCT", set('ACGT'))
+    log.apply([(INSERTION, 4, 'CCC'),
+               (SUBSTITUTION, 0, 'GG'),
+               (DELETION, 10, 3)])
+
+    print(f"Number of recorded mutations: {len(log.mutations)}")
+    print(f"Length of the mutated sequence: {len(log)}")
+    print(f"Mutated sequence: {log}")
@@ -0,0 +1,202 @@
+"""
+Module containing a compact storage of nucleotide strands, which keeps
+every base as a 2-bit code, so that four bases fit into a single byte
+"""
+from functools import lru_cache
+
+BASES_PER_BYTE = 4
+ITERATION_CHUNK = 4096
+
+
+@lru_cache
+def _unpack_table(bases):
+    """
+    This function builds a table of the four bases stored in every
+    possible byte, shared by all strands packed with the same bases
+
+    Arguments:
+        bases (str): four bases in the order of their codes
+
+    Returns:
+        table (tuple): unpacked bases (str) of every byte value
+    """
+    shifts = (6, 4, 2, 0)
+    return tuple(''.join(bases[(byte >> shift) & 3] for shift in shifts)
+                 for byte in range(256))
+
+
+class PackedSequence:
+    """
+    This class represents a strand of one of four bases packed into
+    a bytearray. The first base of every group of four is stored in the
+    two most significant bits of a byte. Only the bytes covering the
+    requested bases are unpacked by indexing, slicing and iteration.
+    """
+    __slots__ = ('bases', '_packed', '_length')
+
+    def __init__(self, data, bases=b'ACGT'):
+        """
+        This function packs a strand
+
+        Arguments:
+            data (str): strand to be packed
+            bases (bytes): four valid bases in the order of their codes
+
+        Raises:
+            ValueError: If bases are not four different characters or
+                any base of the strand does not belong to bases
+        """
+        if len(bases) != BASES_PER_BYTE or len(set(bases)) != len(bases):
+            raise ValueError("Exactly four different bases are required.")
+
+        codes_table = bytearray([BASES_PER_BYTE]) * 256
+        for code, base in enumerate(bases):
+            codes_table[base] = code
+
+        try:
+            codes = data.encode('ascii').translate(codes_table)
+        except UnicodeEncodeError:
+            raise ValueError("Invalid value provided.") from None
+
+        if codes.translate(None, bytes(range(BASES_PER_BYTE))):
+            raise ValueError("Invalid value provided.")
+
+        codes += bytes(-len(codes) % BASES_PER_BYTE)
+
+        self.bases = bases.decode('ascii')
+        self._length = len(data)
+        self._packed = bytearray(
+            first << 6 | second << 4 | third << 2 | fourth
+            for first, second, third, fourth
+            in zip(codes[0::4], codes[1::4], codes[2::4], codes[3::4]))
+
+    def _unpack(self, start, stop):
+        """
+        This function unpacks only the bytes holding bases from start
+        (inclusive) to stop (exclusive)
+
+        Arguments:
+            start (int): position of the first unpacked base
+            stop (int): position after the last unpacked base
+
+        Returns:
+            text (str): unpacked bases
+        """
+        first_byte = start // BASES_PER_BYTE
+        last_byte = -(-stop // BASES_PER_BYTE)
+        text = ''.join(map(_unpack_table(self.bases).__getitem__,
+                           self._packed[first_byte:last_byte]))
+        offset = first_byte * BASES_PER_BYTE
+        return text[start - offset:stop - offset]
+
+    def __len__(self):
+        """
+        This function returns the number of packed bases
+
+        Returns:
+            self._length (int): length of the strand
+        """
+        return self._length
+
+    def __getitem__(self, key):
+        """
+        This function returns a single base or a slice of the strand
+
+        Arguments:
+            key (int or slice): position or positions of bases
+
+        Returns:
+            base or bases (str): requested part of the strand
+
+        Raises:
+            IndexError: If the position is out of range
+            TypeError: If the key is neither an integer nor a slice
+        """
+        if isinstance(key, slice):
+            positions = range(*key.indices(self._length))
+            if not positions:
+                return ''
+            if positions.step == 1:
+                return self._unpack(positions.start, positions.stop)
+
+            low = min(positions[0], positions[-1])
+            text = self._unpack(low, max(positions[0], positions[-1]) + 1)
+            return ''.join([text[i - low] for i in positions])
+
+        if not isinstance(key, int):
+            raise TypeError("Indices must be integers or slices.")
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("Position out of range.")
+
+        byte = self._packed[key // BASES_PER_BYTE]
+        shift = 6 - 2 * (key % BASES_PER_BYTE)
+        return self.bases[(byte >> shift) & 3]
+
+    def __iter__(self):
+        """
+        This function iterates over bases of the strand unpacking them
+        chunk by chunk
+
+        Returns:
+            Generator of bases (str)
+        """
+        for start in range(0, self._length, ITERATION_CHUNK):
+            stop = min(start + ITERATION_CHUNK, self._length)
+            yield from self._unpack(start, stop)
+
+    def __str__(self):
+        """
+        This function unpacks the whole strand
+
+        Returns:
+            text (str): the strand as a string
+        """
+        return self._unpack(0, self._length)
+
+    def __repr__(self):
+        return f"PackedSequence({str(self)!r}, {self.bases.encode()!r})"
+
+    def __eq__(self, other):
+        """
+        This function compares the strand with another packed strand or
+        a string
+
+        Arguments:
+            other (PackedSequence or str): compared strand
+
+        Returns:
+            bool: True if both strands consist of the same bases
+        """
+        if isinstance(other, PackedSequence):
+            if self.bases == other.bases:
+                return (self._length == other._length
+                        and self._packed == other._packed)
+            return str(self) == str(other)
+
+        if isinstance(other, str):
+            return len(other) == self._length and str(self) == other
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def nbytes(self):
+        """
+        This function returns the number of bytes used to store the bases
+
+        Returns:
+            int: size of the packed buffer
+        """
+        return len(self._packed)
+
+
+if __name__ == '__main__':
+    packed = PackedSequence("ATCGGCTAATCGAAGCT")
+
+    print(f"Packed strand: {packed} ({len(packed)} bases"
+          f" in {packed.nbytes()} bytes)")
+    print(f"Base at position 5: {packed[5]}")
+    print(f"Bases from position 3 to 9: {packed[3:10]}")
@@ -1,16 +1,335 @@
+from fractions import Fraction
+from functools import lru_cache
+from itertools import islice
+from operator import add, sub
+
+from calculus import (batch_roots, derivative, divide_exactly, integral,
+                      real_roots, roots)
+from convolution import convolve
+from division import normalize, poly_divmod, poly_gcd
+from evaluation import (array_dtype, compile_horner, compile_sparse,
+                        horner, horner_many, multipoint_evaluate)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EVALUATION_METHODS = ('horner', 'tree')
+
+# lists of at least this length are stored as sparse polynomials when at
+# most SPARSE_DENSITY of their coefficients are non-zero
+SPARSE_MIN_LENGTH = 64
+SPARSE_DENSITY = 0.1
+
+# default number of integer arguments whose values are memoized by
+# a compiled polynomial
+MEMO_SIZE = 1024
+
+
+def _use_sparse(length, terms):
+    """
+    This function decides whether a polynomial should be stored sparsely
+
+    Arguments:
+        length (int): number of coefficients of the dense representation
+        terms (int): number of non-zero coefficients
+
+    Returns:
+        bool: True if the sparse representation is smaller
+    """
+    return length >= SPARSE_MIN_LENGTH and terms <= length * SPARSE_DENSITY
+
+
+def _aligned(a, b, operation):
+    """
+    This function adds or subtracts dense coefficients aligned at their
+    constant terms. Operands are only read: the leading part of the
+    longer one is copied into the result and the rest is combined pair
+    by pair, so the shorter operand is never padded with zeros.
+
+    Arguments:
+        a, b (tuple): coefficients from the highest power
+        operation (function): operator.add or operator.sub
+
+    Returns:
+        result (tuple): coefficients of the result
+    """
+    if len(a) >= len(b):
+        offset = len(a) - len(b)
+        head = a[:offset]
+        tail = map(operation, islice(a, offset, None), b)
+    else:
+        offset = len(b) - len(a)
+        head = (b[:offset] if operation is add
+                else tuple(-coefficient for coefficient in b[:offset]))
+        tail = map(operation, a, islice(b, offset, None))
+
+    return head + tuple(tail)
+
+
+def _strip_leading_zeros(coefficients):
+    """
+    This function removes zero coefficients of the highest powers, so
+    dense and sparse polynomials of the same value have the same degree
+
+    Arguments:
+        coefficients (list): coefficients from the highest power
+
+    Returns:
+        coefficients (list): coefficients starting with a non-zero one,
+            only the constant term if all of them are zero
+    """
+    for i, coefficient in enumerate(coefficients):
+        if coefficient != 0:
+            return coefficients[i:]
+    return coefficients[-1:]
+
+
 class Polynomial:
+    """
+    This class represents a polynomial. Coefficients are stored either
+    densely, as a tuple from the highest power to the constant term, or
+    sparsely, as a dictionary mapping exponents of non-zero terms to
+    their coefficients, which suits high-degree polynomials with few
+    terms (e.g. x^100000 + 1). Operators accept any mix of both and the
+    representation is not observable: zero coefficients of the highest
+    powers are dropped in both, so degrees, coefficients and strings
+    depend only on the value. Stored coefficients are never modified:
+    operators build new ones and in-place operators replace them. The
+    coefficients property returns a copy, so a polynomial is changed
+    only by assigning new coefficients (p.coefficients = [...]).
+
+    A polynomial evaluated very often can be compiled (see compile) into
+    a specialized function, which is rebuilt after in-place operators
+    change the polynomial.
+    """
+
+    # compilation is opt-in: _memo_size is None until compile is called,
+    # _evaluator holds the compiled function and the memoized one
+    _memo_size = None
+    _evaluator = None
+
+    def __init__(self, coefficients, sparse=None):
+        """
+        This function creates a polynomial
 
-    def __init__(self, coefficients):
+        Arguments:
+            coefficients (list or dict): coefficients (integers, floats or
+                fractions) from the highest power to the constant term,
+                or a dictionary mapping exponents to coefficients
+            sparse (bool): If True, the sparse representation is used,
+                if False, the dense one. By default a dictionary is
+                stored sparsely and a list densely, unless it is long
+                and mostly filled with zeros.
 
-        if not isinstance(coefficients, list):
+        Raises:
+            ValueError: If coefficients are not a list or a dictionary of
+                numbers, or any exponent is not a non-negative integer
+        """
+        if isinstance(coefficients, dict):
+            for exponent in coefficients:
+                if not isinstance(exponent, int) or exponent < 0:
+                    raise ValueError("Invalid input. Exponents have to be"
+                                     " non-negative integers.")
+            values = coefficients.values()
+        elif isinstance(coefficients, list):
+            values = coefficients
+        else:
             raise ValueError("Invalid input."
                              " Coefficients have to be a list.")
-        for i in coefficients:
-            if not isinstance(i, (int, float)):
+
+        for i in values:
+            if not isinstance(i, (int, float, Fraction)):
                 raise ValueError("Invalid input."
                                  " Coefficients have to be numbers.")
 
-        self.coefficients = coefficients
+        if isinstance(coefficients, dict):
+            terms = {exponent: coefficient
+                     for exponent, coefficient in coefficients.items()
+                     if coefficient}
+            if sparse is None or sparse:
+                self._set_terms(terms)
+            else:
+                self.coefficients = self._dense(terms)
+        else:
+            coefficients = _strip_leading_zeros(coefficients)
+            if sparse is None:
+                sparse = _use_sparse(len(coefficients),
+                                     len(coefficients)
+                                     - coefficients.count(0))
+            if sparse:
+                self._set_terms(self._sparse(coefficients))
+            else:
+                self.coefficients = coefficients
+
+    @staticmethod
+    def _sparse(coefficients):
+        """
+        This function converts dense coefficients to sparse terms
+
+        Arguments:
+            coefficients (list): coefficients from the highest power
+
+        Returns:
+            terms (dict): exponents of non-zero terms as keys and their
+                coefficients as items
+        """
+        degree = len(coefficients) - 1
+        return {degree - i: coefficient
+                for i, coefficient in enumerate(coefficients) if coefficient}
+
+    @staticmethod
+    def _dense(terms):
+        """
+        This function converts sparse terms to dense coefficients
+
+        Arguments:
+            terms (dict): exponents as keys and coefficients as items
+
+        Returns:
+            coefficients (list): coefficients from the highest power,
+                [0] for the zero polynomial
+        """
+        degree = max(terms, default=0)
+        return [terms.get(degree - i, 0) for i in range(degree + 1)]
+
+    @classmethod
+    def _from_coefficients(cls, coefficients):
+        """
+        This function creates a polynomial from dense coefficients of
+        a result of an operation, choosing the representation
+        automatically
+
+        Arguments:
+            coefficients (tuple or list): coefficients from the highest
+                power
+
+        Returns:
+            Polynomial: a new polynomial
+        """
+        polynomial = cls.__new__(cls)
+        coefficients = _strip_leading_zeros(coefficients)
+        if _use_sparse(len(coefficients),
+                       len(coefficients) - coefficients.count(0)):
+            polynomial._set_terms(cls._sparse(coefficients))
+        else:
+            polynomial.coefficients = coefficients
+        return polynomial
+
+    @classmethod
+    def _from_terms(cls, terms):
+        """
+        This function creates a polynomial from terms of a result of an
+        operation, choosing the representation automatically
+
+        Arguments:
+            terms (dict): exponents as keys and coefficients as items,
+                zero coefficients are dropped
+
+        Returns:
+            Polynomial: a new polynomial
+        """
+        terms = {exponent: coefficient
+                 for exponent, coefficient in terms.items() if coefficient}
+        polynomial = cls.__new__(cls)
+        if _use_sparse(max(terms, default=0) + 1, len(terms)):
+            polynomial._set_terms(terms)
+        else:
+            polynomial.coefficients = cls._dense(terms)
+        return polynomial
+
+    def _set_terms(self, terms):
+        """
+        This function switches the polynomial to the sparse
+        representation
+
+        Arguments:
+            terms (dict): exponents of non-zero terms as keys and their
+                coefficients as items
+        """
+        self._terms = terms
+        self._coefficients = None
+        self._evaluator = None
+
+    def _assign(self, other):
+        """
+        This function replaces the state of the polynomial with the state
+        of another one (used by in-place operators)
+
+        Arguments:
+            other (Polynomial): polynomial whose state is taken over
+        """
+        self._terms = other._terms
+        self._coefficients = other._coefficients
+        self._evaluator = None
+
+    @property
+    def coefficients(self):
+        """
+        This function returns dense coefficients of the polynomial,
+        building them for a sparse polynomial
+
+        Returns:
+            coefficients (list): a new list of coefficients from the
+                highest power to the constant term; changing it does not
+                change the polynomial, assign to coefficients instead
+        """
+        if self._terms is not None:
+            return self._dense(self._terms)
+        return list(self._coefficients)
+
+    @coefficients.setter
+    def coefficients(self, coefficients):
+        """
+        This function stores dense coefficients of the polynomial
+
+        Arguments:
+            coefficients (list): coefficients from the highest power to
+                the constant term
+        """
+        self._coefficients = tuple(_strip_leading_zeros(coefficients))
+        self._terms = None
+        self._evaluator = None
+
+    @property
+    def terms(self):
+        """
+        This function returns non-zero terms of the polynomial
+
+        Returns:
+            terms (dict): exponents as keys and coefficients as items
+        """
+        if self._terms is not None:
+            return dict(self._terms)
+        return self._sparse(self._coefficients)
+
+    def is_sparse(self):
+        """
+        This function checks which representation is used
+
+        Returns:
+            bool: True if the polynomial is stored sparsely
+        """
+        return self._terms is not None
+
+    def to_sparse(self):
+        """
+        This function creates a sparse copy of the polynomial
+
+        Returns:
+            Polynomial: a sparse polynomial
+        """
+        return Polynomial(self.terms, sparse=True)
+
+    def to_dense(self):
+        """
+        This function creates a dense copy of the polynomial
+
+        Returns:
+            Polynomial: a dense polynomial
+        """
+        return Polynomial(self.coefficients, sparse=False)
 
     def degree(self):
         """
@@ -20,56 +339,254 @@ class Polynomial:
             deg (int): A degree of a provided polynomial
 
         """
-        deg = len(self.coefficients) - 1
+        if self._terms is not None:
+            return max(self._terms, default=0)
+
+        deg = len(self._coefficients) - 1
         return deg
 
     def __str__(self):
         """
-        This function creates a string representation of a polynomial
+        This function creates a string representation of a polynomial,
+        the same for both representations (all terms down to the
+        constant one, including zero terms)
 
         Returns:
             pol_str (str): A string representation of a polynomial
         """
-        pol_str = ""
+        if self._terms is not None:
+            coefficients = (self._terms.get(power, 0) for power
+                            in range(self.degree(), -1, -1))
+        else:
+            coefficients = self._coefficients
+
+        parts = []
         power = self.degree()
-        for coefficient in self.coefficients:
+        for coefficient in coefficients:
             if power == 1:
                 if coefficient == 1:
-                    pol_str += "x + "
+                    parts.append("x + ")
                 elif coefficient == -1:
-                    pol_str += "-x + "
+                    parts.append("-x + ")
                 else:
-                    pol_str += str(coefficient) + "x + "
+                    parts.append(str(coefficient) + "x + ")
             elif power == 0:
-                pol_str += str(coefficient)
+                parts.append(str(coefficient))
             else:
                 if coefficient == 1:
-                    pol_str += "x^" + str(power) + " + "
+                    parts.append("x^" + str(power) + " + ")
                 elif coefficient == -1:
-                    pol_str += "-x^" + str(power) + " + "
+                    parts.append("-x^" + str(power) + " + ")
                 else:
-                    pol_str += str(coefficient) + "x^" + str(power) + " + "
+                    parts.append(str(coefficient) + "x^" + str(power)
+                                 + " + ")
 
             power -= 1
 
-        return pol_str
+        return "".join(parts)
+
+    def compile(self, memo_size=MEMO_SIZE):
+        """
+        This function makes the polynomial evaluated by a function
+        generated for its coefficients (Horner's scheme unrolled into
+        straight-line code, which also accepts NumPy arrays) instead of
+        walking its coefficients on every call. Values at integer points
+        are memoized in a bounded LRU cache. The function is built on the
+        first call and rebuilt after the polynomial changes.
+
+        Arguments:
+            memo_size (int): maximal number of memoized integer points,
+                0 disables memoization
+
+        Returns:
+            self: the compiled polynomial
+
+        Raises:
+            ValueError: If memo_size is not a non-negative integer
+        """
+        if not isinstance(memo_size, int) or memo_size < 0:
+            raise ValueError("Invalid input."
+                             " Memo size has to be a non-negative integer.")
+
+        self._memo_size = memo_size
+        self._evaluator = None
+        return self
+
+    def is_compiled(self):
+        """
+        This function checks whether the polynomial was compiled
+
+        Returns:
+            bool: True if compile was called
+        """
+        return self._memo_size is not None
+
+    def _compiled(self):
+        """
+        This function returns compiled functions of the polynomial,
+        building them if the polynomial changed since the last call
+
+        Returns:
+            evaluator, memo (tuple): the generated function and its
+                memoized version (None if memoization is disabled)
+        """
+        if self._evaluator is None:
+            evaluator = (compile_sparse(self._terms)
+                         if self._terms is not None
+                         else compile_horner(self._coefficients))
+            memo = (lru_cache(maxsize=self._memo_size)(evaluator)
+                    if self._memo_size else None)
+            self._evaluator = (evaluator, memo)
+        return self._evaluator
 
     def __call__(self, x):
         """
         This function calculates a result of a polynomial if we
-                substitute x with provided number
+                substitute x with provided number, using Horner's scheme.
+                A list, a tuple or a NumPy array of numbers is evaluated
+                point by point (see evaluate). A compiled polynomial uses
+                its generated function (see compile).
 
         Returns:
             result (int): A result of a polynomial if we
                 substitute x with provided number
         """
-        result = 0
-        power = self.degree()
-        for coefficient in self.coefficients:
-            result += coefficient * pow(x, power)
-            power -= 1
+        if self._memo_size is not None:
+            evaluator, memo = self._compiled()
+            if memo is not None and type(x) is int:
+                return memo(x)
+            if not isinstance(x, (list, tuple, range)) and not (
+                    np is not None and isinstance(x, np.ndarray)):
+                return evaluator(x)
+
+        if (isinstance(x, (list, tuple, range))
+                or (np is not None and isinstance(x, np.ndarray))):
+            return self.evaluate(x)
+
+        if self._terms is not None:
+            return sum(coefficient * pow(x, power)
+                       for power, coefficient in self._terms.items())
 
-        return result
+        return horner(self._coefficients, x)
+
+    def _points_array(self, points):
+        """
+        This function converts points to an array of a dtype in which the
+        polynomial is evaluated without overflow (see array_dtype)
+
+        Arguments:
+            points (iterable): points of evaluation
+
+        Returns:
+            points (numpy.ndarray): array of points
+        """
+        points = np.asarray(points)
+        if self._terms is not None:
+            dtype = array_dtype(list(self._terms.values()), points,
+                                max(self._terms, default=0))
+        else:
+            dtype = array_dtype(self._coefficients, points)
+        return points.astype(dtype, copy=False)
+
+    def evaluate(self, points, method='horner', use_numpy=None):
+        """
+        This function evaluates the polynomial at many points
+
+        Arguments:
+            points (iterable): points of evaluation
+            method (str): 'horner' evaluates all points at once with
+                a vectorized Horner's scheme (if NumPy is used) or point
+                by point, 'tree' uses a subproduct tree (exact, only for
+                integer or fractional coefficients and points; with
+                Python integers it is usually slower than Horner's
+                scheme)
+            use_numpy (bool): If True, the points are evaluated as
+                a NumPy array, by default only if they already are one
+
+        Returns:
+            values (list or numpy.ndarray): values at all points, an array
+                if NumPy was used
+
+        Raises:
+            ValueError: If the method is not supported or the method
+                'tree' gets a coefficient or a point which is not an
+                integer or a fraction
+        """
+        if method not in EVALUATION_METHODS:
+            raise ValueError("Method must be one of: "
+                             + ", ".join(EVALUATION_METHODS))
+
+        if use_numpy is None:
+            use_numpy = np is not None and isinstance(points, np.ndarray)
+
+        if method == 'tree':
+            values = multipoint_evaluate(self.coefficients, points)
+            if use_numpy and np is not None:
+                return np.array(values)
+            return values
+
+        if self._memo_size is not None:
+            if use_numpy and np is not None:
+                return self._compiled()[0](self._points_array(points))
+            return [self(x) for x in points]
+
+        if self._terms is not None:
+            if use_numpy and np is not None:
+                points = self._points_array(points)
+                return sum(coefficient * points ** power
+                           for power, coefficient in self._terms.items())
+            return [self(x) for x in points]
+
+        return horner_many(self._coefficients, points, use_numpy)
+
+    def _combine(self, other, sign):
+        """
+        This function adds (sign 1) or subtracts (sign -1) polynomials.
+        Dense polynomials are combined with aligned coefficients, any
+        sparse operand makes them combined term by term, touching only
+        non-zero terms.
+
+        Arguments:
+            other (Polynomial): the second operand
+            sign (int): 1 for addition, -1 for subtraction
+
+        Returns:
+            Polynomial: a new polynomial
+        """
+        if self._terms is None and other._terms is None:
+            return self._from_coefficients(_aligned(
+                self._coefficients, other._coefficients,
+                add if sign > 0 else sub))
+
+        terms = self.terms
+        for power, coefficient in other.terms.items():
+            terms[power] = terms.get(power, 0) + sign * coefficient
+        return self._from_terms(terms)
+
+    def _multiply(self, other):
+        """
+        This function multiplies polynomials: dense ones with the fastest
+        algorithm for their size, sparse ones term by term, which takes
+        time proportional to the product of numbers of non-zero terms
+
+        Arguments:
+            other (Polynomial): the second operand
+
+        Returns:
+            Polynomial: a new polynomial
+        """
+        if self._terms is None and other._terms is None:
+            return self._from_coefficients(_strip_leading_zeros(
+                convolve(self.coefficients, other.coefficients)))
+
+        terms = {}
+        other_terms = other.terms.items()
+        for power, coefficient in self.terms.items():
+            for other_power, other_coefficient in other_terms:
+                exponent = power + other_power
+                terms[exponent] = (terms.get(exponent, 0)
+                                   + coefficient * other_coefficient)
+        return self._from_terms(terms)
 
     def __add__(self, other):
         """
@@ -91,22 +608,7 @@ class Polynomial:
             raise ValueError("This is not a polynomial."
                              " Only polynomial can be added to a polynomial.")
 
-        added_coefficients = []
-        length = max(len(self.coefficients), len(other.coefficients))
-
-        if len(self.coefficients) < length:
-            self.coefficients = ([0] * (length - len(self.coefficients))
-                                 + self.coefficients)
-
-        if len(other.coefficients) < length:
-            other.coefficients = ([0] * (length - len(other.coefficients))
-                                  + other.coefficients)
-
-        for i in range(length):
-            added_coefficients.append(self.coefficients[i]
-                                      + other.coefficients[i])
-
-        return Polynomial(added_coefficients)
+        return self._combine(other, 1)
 
     def __sub__(self, other):
         """
@@ -127,22 +629,7 @@ class Polynomial:
             raise ValueError("This is not a polynomial."
                              " Only polynomial can be added to a polynomial.")
 
-        subtracted_coefficients = []
-        length = max(len(self.coefficients), len(other.coefficients))
-
-        if len(self.coefficients) < length:
-            self.coefficients = ([0] * (length - len(self.coefficients))
-                                 + self.coefficients)
-
-        if len(other.coefficients) < length:
-            other.coefficients = ([0] * (length - len(other.coefficients))
-                                  + other.coefficients)
-
-        for i in range(length):
-            subtracted_coefficients.append(self.coefficients[i]
-                                           - other.coefficients[i])
-
-        return Polynomial(subtracted_coefficients)
+        return self._combine(other, -1)
 
     def __mul__(self, other):
         """
@@ -163,26 +650,7 @@ class Polynomial:
             raise ValueError("This is not a polynomial."
                              " Only polynomial can be added to a polynomial.")
 
-        length = len(self.coefficients) + len(other.coefficients) - 1
-        multiplied_coefficients = [0] * length
-
-        for i in range(len(self.coefficients)):
-            for j in range(len(other.coefficients)):
-                multiplied_coefficients[i + j] += (self.coefficients[i]
-                                                   * other.coefficients[j])
-
-        zero_list = []
-
-        for i in multiplied_coefficients:
-            if i == 0:
-                zero_list.append(i)
-            else:
-                break
-
-        for i in zero_list:
-            multiplied_coefficients.remove(i)
-
-        return Polynomial(multiplied_coefficients)
+        return self._multiply(other)
 
     def __iadd__(self, other):
         """
@@ -202,19 +670,7 @@ class Polynomial:
             raise ValueError("This is not a polynomial."
                              " Only a polynomial can be added to a polynomial.")
 
-        length = max(len(self.coefficients), len(other.coefficients))
-
-        if len(self.coefficients) < length:
-            self.coefficients = ([0] * (length - len(self.coefficients))
-                                 + self.coefficients)
-
-        if len(other.coefficients) < length:
-            other.coefficients = ([0] * (length - len(other.coefficients))
-                                  + other.coefficients)
-
-        for i in range(length):
-            self.coefficients[i] += other.coefficients[i]
-
+        self._assign(self._combine(other, 1))
         return self
 
     def __isub__(self, other):
@@ -235,61 +691,258 @@ class Polynomial:
             raise ValueError("This is not a polynomial."
                              " Only a polynomial can be added to a polynomial.")
 
-        length = max(len(self.coefficients), len(other.coefficients))
+        self._assign(self._combine(other, -1))
+        return self
 
-        if len(self.coefficients) < length:
-            self.coefficients = ([0] * (length - len(self.coefficients))
-                                 + self.coefficients)
+    def __imul__(self, other):
+        """
+        This function implements a *= operator for polynomial objects
 
-        if len(other.coefficients) < length:
-            other.coefficients = ([0] * (length - len(other.coefficients))
-                                  + other.coefficients)
+        Arguments:
+            other (Polynomial): other polynomial that the first polynomial
+                will be multiplied by
 
-        for i in range(length):
-            self.coefficients[i] = self.coefficients[i] - other.coefficients[i]
+        Returns:
+            self: First polynomial multiplied by the other
 
+        Raises:
+            ValueError: If other is not a polynomial
+        """
+
+        if not isinstance(other, Polynomial):
+            raise ValueError("This is not a polynomial."
+                             " Only polynomial can be added to a polynomial.")
+
+        self._assign(self._multiply(other))
         return self
 
-    def __imul__(self, other):
+    def divide(self, other, modulus=None):
         """
-        This function implements a += operator for polynomial objects
+        This function divides polynomials with a remainder. Large ones are
+        divided with Newton's iteration, which reduces division to a few
+        fast multiplications. Integer coefficients which do not divide
+        evenly give exact fractions.
 
         Arguments:
-            other (Polynomial): other polynomial that will be added
-                to the first polynomial
+            other (Polynomial): divisor
+            modulus (int): If provided, coefficients are integers modulo
+                this prime
 
         Returns:
-            self: First polynomial increased by the other
+            quotient, remainder (tuple): new polynomials, such that
+                self = quotient * other + remainder and the degree of
+                the remainder is less than the degree of other
 
         Raises:
             ValueError: If other is not a polynomial
+            ZeroDivisionError: If other is the zero polynomial
+        """
+        if not isinstance(other, Polynomial):
+            raise ValueError("This is not a polynomial."
+                             " Only a polynomial can divide a polynomial.")
+
+        quotient, remainder = poly_divmod(self.coefficients,
+                                          other.coefficients, modulus)
+        return (self._from_coefficients(quotient or [0]),
+                self._from_coefficients(remainder or [0]))
+
+    def gcd(self, other, modulus=None):
         """
+        This function calculates the greatest common divisor of
+        polynomials with the Euclidean algorithm, accelerated by the
+        half-GCD algorithm for large degrees
 
+        Arguments:
+            other (Polynomial): the second polynomial
+            modulus (int): If provided, coefficients are integers modulo
+                this prime
+
+        Returns:
+            Polynomial: the monic greatest common divisor, the zero
+                polynomial if both polynomials are zero
+
+        Raises:
+            ValueError: If other is not a polynomial
+        """
         if not isinstance(other, Polynomial):
             raise ValueError("This is not a polynomial."
-                             " Only polynomial can be added to a polynomial.")
+                             " The GCD is defined only for polynomials.")
 
-        length = len(self.coefficients) + len(other.coefficients) - 1
-        result = [0] * length
+        return self._from_coefficients(
+            poly_gcd(self.coefficients, other.coefficients, modulus) or [0])
 
-        for i in range(len(self.coefficients)):
-            for j in range(len(other.coefficients)):
-                result[i + j] += self.coefficients[i] * other.coefficients[j]
+    def reduce(self, modulus):
+        """
+        This function reduces integer coefficients modulo a number
 
-        self.coefficients = result
+        Arguments:
+            modulus (int): modulus of coefficients
 
-        zero_list = []
+        Returns:
+            Polynomial: a new polynomial with coefficients from
+                0 to modulus - 1
 
-        for i in self.coefficients:
-            if i == 0:
-                zero_list.append(i)
-            else:
-                break
+        Raises:
+            ValueError: If the modulus is not a positive integer or any
+                coefficient is not an integer
+        """
+        if not isinstance(modulus, int) or modulus < 1:
+            raise ValueError("Invalid input."
+                             " Modulus has to be a positive integer.")
+        if not all(isinstance(coefficient, int)
+                   for coefficient in self.terms.values()):
+            raise ValueError("Invalid input. Only integer coefficients"
+                             " can be reduced modulo a number.")
+
+        if self._terms is not None:
+            return self._from_terms({power: coefficient % modulus
+                                     for power, coefficient
+                                     in self._terms.items()})
+        return self._from_coefficients(
+            normalize(self._coefficients, modulus) or [0])
+
+    def derivative(self):
+        """
+        This function calculates the derivative of the polynomial, term
+        by term for a sparse one
 
-        for i in zero_list:
-            self.coefficients.remove(i)
+        Returns:
+            Polynomial: a new polynomial
+        """
+        if self._terms is not None:
+            return self._from_terms({power - 1: coefficient * power
+                                     for power, coefficient
+                                     in self._terms.items() if power})
+        return self._from_coefficients(derivative(self._coefficients))
 
-        return self
+    def integral(self, constant=0):
+        """
+        This function calculates the integral of the polynomial, term by
+        term for a sparse one. Integer coefficients which are not
+        divisible by their new exponents become fractions.
+
+        Arguments:
+            constant (int, float or Fraction): the constant term
+
+        Returns:
+            Polynomial: a new polynomial
+
+        Raises:
+            ValueError: If the constant is not a number
+        """
+        if not isinstance(constant, (int, float, Fraction)):
+            raise ValueError("Invalid input. Constant has to be a number.")
+
+        if self._terms is not None:
+            terms = {power + 1: divide_exactly(coefficient, power + 1)
+                     for power, coefficient in self._terms.items()}
+            terms[0] = constant
+            return self._from_terms(terms)
+        return self._from_coefficients(integral(self._coefficients,
+                                                constant))
+
+    def roots(self, polish=True):
+        """
+        This function finds all complex roots of the polynomial, repeated
+        according to their multiplicities, as eigenvalues of its
+        companion matrix polished with Newton's method
+
+        Arguments:
+            polish (bool): If True, roots are polished with Newton's
+                method
+
+        Returns:
+            roots (list): complex roots sorted by real and imaginary parts
+
+        Raises:
+            ValueError: If the polynomial is zero
+        """
+        return roots(self.coefficients, polish)
+
+    def real_roots(self, tolerance=1e-12):
+        """
+        This function finds distinct real roots of the polynomial,
+        isolated exactly with the Sturm sequence and refined by bisection
+
+        Arguments:
+            tolerance (float): maximal error of roots
+
+        Returns:
+            roots (list): sorted real roots (floats)
+
+        Raises:
+            ValueError: If the polynomial is zero
+        """
+        return real_roots(self.coefficients, tolerance)
+
+    @staticmethod
+    def batch_roots(polynomials, polish=True):
+        """
+        This function finds roots of many polynomials of equal degree at
+        once, processing their coefficients as one 2-D NumPy array
+
+        Arguments:
+            polynomials (list): polynomials of equal degree
+            polish (bool): If True, roots are polished with Newton's
+                method
+
+        Returns:
+            roots (numpy.ndarray): complex array with one row of roots
+                for every polynomial
+
+        Raises:
+            ValueError: If the polynomials have different degrees or
+                NumPy is not available
+        """
+        if np is None:
+            raise ValueError("Batched root finding requires NumPy.")
+        if len({polynomial.degree() for polynomial in polynomials}) > 1:
+            raise ValueError("Invalid input. Polynomials have to be of"
+                             " equal degree.")
+
+        return batch_roots(np.array([polynomial.coefficients
+                                     for polynomial in polynomials],
+                                    dtype=float), polish)
+
+    def __divmod__(self, other):
+        """
+        This function implements the divmod function for polynomial
+        objects (see divide)
+
+        Returns:
+            quotient, remainder (tuple): new polynomials
+
+        Raises:
+            ValueError: If other is not a polynomial
+            ZeroDivisionError: If other is the zero polynomial
+        """
+        return self.divide(other)
+
+    def __floordiv__(self, other):
+        """
+        This function implements a // operator for polynomial objects
+
+        Returns:
+            Polynomial: the quotient of division
+
+        Raises:
+            ValueError: If other is not a polynomial
+            ZeroDivisionError: If other is the zero polynomial
+        """
+        return self.divide(other)[0]
+
+    def __mod__(self, other):
+        """
+        This function implements a % operator for polynomial objects
+
+        Returns:
+            Polynomial: the remainder of division
+
+        Raises:
+            ValueError: If other is not a polynomial
+            ZeroDivisionError: If other is the zero polynomial
+        """
+        return self.divide(other)[1]
 
 
 if __name__ == '__main__':
@@ -333,5 +986,29 @@ if __name__ == '__main__':
         print(f"The result of in-place multiplication of these polynomials is:"
               f" {pol1.coefficients} \n")
 
+        pol_div, pol_mod = divmod(Polynomial([1, 0, -3, 2]),
+                                  Polynomial([2, -2]))
+        print(f"The result of division of these polynomials is:"
+              f" {pol_div.coefficients} with remainder"
+              f" {pol_mod.coefficients} \n")
+
+        pol_gcd = Polynomial([1, 0, -3, 2]).gcd(Polynomial([1, 0, -1]))
+        print(f"The greatest common divisor of these polynomials is:"
+              f" {pol_gcd} \n")
+
+        pol_compiled = Polynomial([2, -3, 0, 5]).compile()
+        print(f"The values of a compiled polynomial are:"
+              f" {pol_compiled(list(range(6)))} \n")
+
+        pol_cubic = Polynomial([1, 0, -3, 2])
+        print(f"The derivative of {pol_cubic} is:"
+              f" {pol_cubic.derivative()} \n")
+        print(f"The real roots of {pol_cubic} are:"
+              f" {pol_cubic.real_roots()} \n")
+
+        pol_sparse = Polynomial({100000: 1, 0: 1})
+        print(f"The square of a sparse polynomial is:"
+              f" {pol_sparse * pol_sparse} \n")
+
     except ValueError as e:
         print(f"Error: {e}")
@@ -0,0 +1,413 @@
+"""
+Module containing a container of many polynomials stored as one 2-D NumPy
+array, so arithmetic and evaluation of all of them are done by a few
+vectorized operations instead of a loop over Polynomial objects
+"""
+from calculus import batch_derivative, batch_roots
+from polynomial import Polynomial
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# products of rows at least this long are computed with the FFT, shorter
+# ones with a vectorized schoolbook method
+BATCH_FFT_THRESHOLD = 32
+# integer products are computed with the FFT only if their coefficients
+# are smaller than this bound, so rounding keeps them exact
+FFT_EXACT_BOUND = 2 ** 50
+
+
+def _pad(matrix, width):
+    """
+    This function pads rows of coefficients with zeros of the highest
+    powers up to the given width
+
+    Arguments:
+        matrix (numpy.ndarray): 2-D array of coefficients
+        width (int): number of columns of the result
+
+    Returns:
+        matrix (numpy.ndarray): padded array
+    """
+    if matrix.shape[1] >= width:
+        return matrix
+    return np.pad(matrix, ((0, 0), (width - matrix.shape[1], 0)))
+
+
+def _largest(matrix):
+    """
+    This function returns the largest absolute value of an integer array
+    as a Python integer (0 for an empty array)
+    """
+    if not matrix.size:
+        return 0
+    return max(-int(matrix.min()), int(matrix.max()))
+
+
+def batch_convolve(a, b):
+    """
+    This function multiplies rows of two arrays of coefficients pairwise
+    (rows of length 1 are broadcast). Long rows are multiplied with the
+    batched real FFT, short ones with the schoolbook method applied to
+    whole columns. Integer products are exact.
+
+    Arguments:
+        a, b (numpy.ndarray): 2-D arrays of coefficients
+
+    Returns:
+        product (numpy.ndarray): 2-D array with a.shape[1] + b.shape[1] - 1
+            columns
+
+    Raises:
+        ValueError: If coefficients of an integer product could exceed
+            the range of int64
+    """
+    length = a.shape[1] + b.shape[1] - 1
+    integer = (np.issubdtype(a.dtype, np.integer)
+               and np.issubdtype(b.dtype, np.integer))
+    bound = (_largest(a) * _largest(b) * min(a.shape[1], b.shape[1])
+             if integer else 0)
+    if bound > np.iinfo(np.int64).max:
+        raise ValueError("Invalid input. Coefficients of the product"
+                         " exceed the range of int64, multiply"
+                         " Polynomial objects instead.")
+    if integer:
+        a, b = a.astype(np.int64), b.astype(np.int64)
+
+    if (min(a.shape[1], b.shape[1]) < BATCH_FFT_THRESHOLD
+            or bound >= FFT_EXACT_BOUND):
+        if a.shape[1] < b.shape[1]:
+            a, b = b, a
+        rows = max(a.shape[0], b.shape[0])
+        result = np.zeros((rows, length), dtype=np.result_type(a, b))
+        for column in range(b.shape[1]):
+            result[:, column:column + a.shape[1]] += (
+                a * b[:, column:column + 1])
+        return result
+
+    size = 1 << (length - 1).bit_length()
+    product = np.fft.irfft(np.fft.rfft(a, size, axis=1)
+                           * np.fft.rfft(b, size, axis=1),
+                           size, axis=1)[:, :length]
+    if integer:
+        return np.rint(product).astype(np.int64)
+    return product
+
+
+class PolynomialBatch:
+    """
+    This class represents many polynomials stored as rows of one 2-D
+    NumPy array of coefficients (from the highest power to the constant
+    term), padded with zeros to the highest degree. Operators work on
+    whole rows at once; a batch and a single Polynomial are combined
+    with every row.
+    """
+
+    def __init__(self, coefficients):
+        """
+        This function creates a batch of polynomials
+
+        Arguments:
+            coefficients: 2-D array-like of integer or float coefficients,
+                one row for every polynomial
+
+        Raises:
+            ValueError: If NumPy is not available or coefficients are not
+                a 2-D array of numbers
+        """
+        if np is None:
+            raise ValueError("PolynomialBatch requires NumPy.")
+
+        matrix = np.asarray(coefficients)
+        if (matrix.ndim != 2 or matrix.shape[1] == 0
+                or not (np.issubdtype(matrix.dtype, np.integer)
+                        or np.issubdtype(matrix.dtype, np.floating))):
+            raise ValueError("Invalid input. Coefficients have to be"
+                             " a 2-D array of numbers.")
+
+        self.coefficients = matrix
+
+    @classmethod
+    def from_polynomials(cls, polynomials):
+        """
+        This function creates a batch from Polynomial objects
+
+        Arguments:
+            polynomials (list): polynomials with integer or float
+                coefficients
+
+        Returns:
+            PolynomialBatch: batch with one row for every polynomial
+
+        Raises:
+            ValueError: If any item is not a polynomial or has fractional
+                coefficients
+        """
+        rows = []
+        for polynomial in polynomials:
+            if not isinstance(polynomial, Polynomial):
+                raise ValueError("This is not a polynomial."
+                                 " Only polynomials can form a batch.")
+            rows.append(polynomial.coefficients)
+
+        width = max(map(len, rows), default=1)
+        return cls([[0] * (width - len(row)) + row for row in rows]
+                   if rows else np.zeros((0, 1), dtype=np.int64))
+
+    def to_polynomials(self):
+        """
+        This function converts the batch to Polynomial objects
+
+        Returns:
+            polynomials (list): a polynomial for every row, without the
+                padding zeros
+        """
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self):
+        """
+        This function returns the number of polynomials in the batch
+
+        Returns:
+            int: number of rows
+        """
+        return self.coefficients.shape[0]
+
+    def __getitem__(self, index):
+        """
+        This function returns a single polynomial of the batch
+
+        Arguments:
+            index (int): number of the row
+
+        Returns:
+            Polynomial: polynomial stored in the row
+        """
+        row = self.coefficients[index].tolist()
+        nonzero = np.flatnonzero(self.coefficients[index])
+        start = nonzero[0] if len(nonzero) else len(row) - 1
+        return Polynomial(row[start:])
+
+    def degree(self):
+        """
+        This function returns the degree of the batch, i.e. the highest
+        degree of its polynomials before padding
+
+        Returns:
+            int: number of columns minus one
+        """
+        return self.coefficients.shape[1] - 1
+
+    def __str__(self):
+        """
+        This function creates a string representation of the batch, one
+        polynomial per line
+
+        Returns:
+            str: representations of all polynomials
+        """
+        return "\n".join(str(polynomial)
+                         for polynomial in self.to_polynomials())
+
+    def __repr__(self):
+        return (f"PolynomialBatch({len(self)} polynomials of degree"
+                f" {self.degree()})")
+
+    def _operand(self, other):
+        """
+        This function converts the second operand of an operator to
+        a 2-D array of coefficients
+
+        Arguments:
+            other (PolynomialBatch or Polynomial): the second operand
+
+        Returns:
+            matrix (numpy.ndarray): rows of coefficients (a single row
+                for a polynomial)
+
+        Raises:
+            ValueError: If other is neither a batch of the same length nor
+                a polynomial
+        """
+        if isinstance(other, Polynomial):
+            return np.array([other.coefficients])
+        if not isinstance(other, PolynomialBatch):
+            raise ValueError("Only a batch or a polynomial can be combined"
+                             " with a batch.")
+        if len(other) != len(self):
+            raise ValueError("Batches have to contain equal numbers of"
+                             " polynomials.")
+        return other.coefficients
+
+    def _combine(self, other, sign):
+        """
+        This function adds (sign 1) or subtracts (sign -1) coefficients
+        aligned at constant terms
+        """
+        matrix = self._operand(other)
+        if (np.issubdtype(self.coefficients.dtype, np.integer)
+                and np.issubdtype(matrix.dtype, np.integer)
+                and (_largest(self.coefficients) + _largest(matrix)
+                     > np.iinfo(np.int64).max)):
+            raise ValueError("Invalid input. Coefficients of the result"
+                             " exceed the range of int64, use Polynomial"
+                             " objects instead.")
+        width = max(self.coefficients.shape[1], matrix.shape[1])
+        first = _pad(self.coefficients, width)
+        second = _pad(matrix, width)
+        return PolynomialBatch(first + second if sign > 0
+                               else first - second)
+
+    def __add__(self, other):
+        """
+        This function implements an addition operator for batches
+
+        Arguments:
+            other (PolynomialBatch or Polynomial): batch added row by row
+                or a polynomial added to every row
+
+        Returns:
+            PolynomialBatch: a new batch
+
+        Raises:
+            ValueError: If other is not a batch of the same length or
+                a polynomial, or if integer coefficients of the result
+                could exceed int64
+        """
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        """
+        This function implements a subtraction operator for batches
+
+        Arguments:
+            other (PolynomialBatch or Polynomial): batch subtracted row by
+                row or a polynomial subtracted from every row
+
+        Returns:
+            PolynomialBatch: a new batch
+
+        Raises:
+            ValueError: If other is not a batch of the same length or
+                a polynomial, or if integer coefficients of the result
+                could exceed int64
+        """
+        return self._combine(other, -1)
+
+    def __mul__(self, other):
+        """
+        This function implements a multiplication operator for batches,
+        multiplying all rows at once with the batched FFT
+
+        Arguments:
+            other (PolynomialBatch or Polynomial): batch multiplied row by
+                row or a polynomial multiplying every row
+
+        Returns:
+            PolynomialBatch: a new batch
+
+        Raises:
+            ValueError: If other is not a batch of the same length or
+                a polynomial
+        """
+        return PolynomialBatch(batch_convolve(self.coefficients,
+                                              self._operand(other)))
+
+    def evaluate(self, points, per_row=False):
+        """
+        This function evaluates all polynomials with Horner's scheme,
+        every step applied to the whole batch
+
+        Arguments:
+            points: points shared by all polynomials (a number or
+                a 1-D array), or if per_row is True, points of every
+                polynomial (a 1-D array with one point per row or a 2-D
+                array with one row of points per polynomial)
+            per_row (bool): If True, every polynomial has its own points
+
+        Returns:
+            values (numpy.ndarray): for shared points an array of shape
+                (polynomials, points) (one column for a number), for
+                points per row an array of the shape of points; integer
+                values which could exceed int64 are Python integers in
+                an object array
+
+        Raises:
+            ValueError: If points per row do not match the batch
+        """
+        points = np.asarray(points)
+        if per_row:
+            if points.shape[:1] != (len(self),) or points.ndim > 2:
+                raise ValueError("Invalid input. Points have to be given"
+                                 " for every polynomial.")
+            columns = points.reshape(len(self), -1)
+        else:
+            columns = np.broadcast_to(points.reshape(1, -1),
+                                      (len(self), points.size))
+
+        dtype = np.result_type(self.coefficients, columns)
+        if np.issubdtype(dtype, np.integer):
+            # as in evaluation.array_dtype, Python integers if values
+            # could exceed int64
+            bits = (_largest(self.coefficients).bit_length()
+                    + self.coefficients.shape[1].bit_length()
+                    + self.degree() * max(_largest(columns), 1).bit_length())
+            if bits >= 64:
+                dtype = object
+                columns = columns.astype(object)
+        values = np.zeros(columns.shape, dtype=dtype)
+        for column in self.coefficients.T:
+            values *= columns
+            values += column[:, None]
+
+        return values.reshape(points.shape) if per_row else values
+
+    def __call__(self, points):
+        """
+        This function evaluates all polynomials at shared points (see
+        evaluate)
+        """
+        return self.evaluate(points)
+
+    def derivative(self):
+        """
+        This function differentiates all polynomials
+
+        Returns:
+            PolynomialBatch: a new batch
+        """
+        return PolynomialBatch(batch_derivative(self.coefficients))
+
+    def roots(self, polish=True):
+        """
+        This function finds roots of all polynomials at once (see
+        calculus.batch_roots)
+
+        Arguments:
+            polish (bool): If True, roots are polished with Newton's
+                method
+
+        Returns:
+            roots (numpy.ndarray): complex array with one row of roots
+                for every polynomial
+
+        Raises:
+            ValueError: If any polynomial has a lower degree than the
+                batch
+        """
+        return batch_roots(self.coefficients, polish)
+
+
+if __name__ == '__main__':
+    batch = PolynomialBatch.from_polynomials([Polynomial([1, 0, -1]),
+                                              Polynomial([2, 3]),
+                                              Polynomial([1, -3, 2])])
+
+    print(f"Batch:\n{batch}")
+    print(f"Squares:\n{batch * batch}")
+    print(f"Sums with x + 1:\n{batch + Polynomial([1, 1])}")
+    print(f"Values at 0, 1, 2:\n{batch([0, 1, 2])}")
+    print(f"Values at 1, 2, 3 (one per row):"
+          f" {batch.evaluate([1, 2, 3], per_row=True)}")
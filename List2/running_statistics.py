@@ -0,0 +1,298 @@
+"""
+Module containing an accumulator of statistics of a stream of numbers,
+computed in a single pass with constant memory: the count, the mean and
+the variance (Welford's algorithm), the minimum, the maximum and
+approximate quantiles (a streaming histogram with a bounded number of
+bins). Accumulators of parts of a stream (e.g. computed by parallel
+workers) can be merged.
+"""
+from bisect import bisect_left
+from math import inf, sqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# number of bins of the histogram used for quantiles (it is compressed
+# to about this size), streams with at most twice as many distinct
+# values have exact quantiles
+MAX_BINS = 128
+
+
+class RunningStatistics:
+    """
+    This class represents statistics of numbers seen so far. The mean and
+    the sum of squared deviations from it are updated with Welford's
+    algorithm, which is numerically stable, and merged with the formula
+    of Chan et al. Quantiles come from a histogram of sorted bins
+    (value, count): a new value gets its own bin and when there are too
+    many of them, neighbouring bins are merged into bins holding similar
+    numbers of values, so every bin spans a small range of ranks.
+    """
+
+    def __init__(self, values=(), max_bins=MAX_BINS):
+        """
+        This function creates an accumulator
+
+        Arguments:
+            values (iterable): initial values
+            max_bins (int): size of the compressed histogram
+
+        Raises:
+            ValueError: If max_bins is smaller than 2
+        """
+        if not isinstance(max_bins, int) or max_bins < 2:
+            raise ValueError("Invalid input. Number of bins has to be an"
+                             " integer of at least 2.")
+
+        self.max_bins = max_bins
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0
+        self.min = inf
+        self.max = -inf
+        self._values = []
+        self._counts = []
+        self.update(values)
+
+    def add(self, value):
+        """
+        This function adds a value to the statistics
+
+        Arguments:
+            value (int or float): the value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._insert(value, 1)
+
+    def update(self, values):
+        """
+        This function adds many values to the statistics. A NumPy array
+        is summarized with vectorized operations and merged.
+
+        Arguments:
+            values (iterable): values to add
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            self.merge(self._from_array(values.ravel()))
+            return
+
+        for value in values:
+            self.add(value)
+
+    def _from_array(self, values):
+        """
+        This function computes statistics of a NumPy array
+
+        Arguments:
+            values (numpy.ndarray): 1-D array of values
+
+        Returns:
+            RunningStatistics: statistics of the values
+        """
+        result = RunningStatistics(max_bins=self.max_bins)
+        if not values.size:
+            return result
+
+        result.count = int(values.size)
+        result.mean = float(values.mean())
+        result._squares = float(((values - result.mean) ** 2).sum())
+        result.min = values.min().item()
+        result.max = values.max().item()
+        distinct, counts = np.unique(values, return_counts=True)
+        if len(distinct) > self.max_bins:
+            # bins of equal numbers of values, like _compress
+            ends = np.cumsum(counts)
+            groups = np.searchsorted(
+                ends, np.linspace(0, ends[-1], self.max_bins + 1)[1:],
+                side='left')
+            groups = np.unique(np.minimum(groups, len(ends) - 1))
+            starts = np.concatenate(([0], groups[:-1] + 1))
+            sums = np.add.reduceat(distinct * counts, starts)
+            counts = np.add.reduceat(counts, starts)
+            distinct = sums / counts
+        result._values = distinct.tolist()
+        result._counts = counts.tolist()
+        return result
+
+    def merge(self, other):
+        """
+        This function adds statistics of other values, e.g. computed by
+        another worker, to these statistics
+
+        Arguments:
+            other (RunningStatistics): statistics of other values
+
+        Returns:
+            self: the merged statistics
+
+        Raises:
+            ValueError: If other is not a RunningStatistics object
+        """
+        if not isinstance(other, RunningStatistics):
+            raise ValueError("Only statistics can be merged.")
+        if not other.count:
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self._squares += (other._squares
+                          + delta * delta * self.count * other.count / count)
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for value, weight in zip(list(other._values), list(other._counts)):
+            self._insert(value, weight)
+        return self
+
+    def __add__(self, other):
+        """
+        This function merges statistics into new ones
+
+        Arguments:
+            other (RunningStatistics): statistics of other values
+
+        Returns:
+            RunningStatistics: statistics of values of both operands
+        """
+        result = RunningStatistics(max_bins=self.max_bins)
+        return result.merge(self).merge(other)
+
+    def _insert(self, value, count):
+        """
+        This function adds a value with a count to the histogram,
+        compressing it if it has twice as many bins as allowed
+        """
+        i = bisect_left(self._values, value)
+        if i < len(self._values) and self._values[i] == value:
+            self._counts[i] += count
+            return
+
+        self._values.insert(i, value)
+        self._counts.insert(i, count)
+        if len(self._values) > 2 * self.max_bins:
+            self._compress()
+
+    def _compress(self):
+        """
+        This function merges neighbouring bins (into their weighted mean)
+        as long as merged bins hold at most 2 * count / max_bins values,
+        which leaves at most max_bins + 1 bins and bounds the error of
+        ranks of quantiles
+        """
+        limit = 2 * self.count / self.max_bins
+        values, counts = [], []
+        for value, count in zip(self._values, self._counts):
+            if counts and counts[-1] + count <= limit:
+                total = counts[-1] + count
+                values[-1] = (values[-1] * counts[-1] + value * count) / total
+                counts[-1] = total
+            else:
+                values.append(value)
+                counts.append(count)
+        self._values, self._counts = values, counts
+
+    def variance(self):
+        """
+        This function returns the sample variance
+
+        Returns:
+            float: the sample variance
+
+        Raises:
+            ValueError: If there are fewer than two values
+        """
+        if self.count < 2:
+            raise ValueError("Variance requires at least two values.")
+        return self._squares / (self.count - 1)
+
+    def stdev(self):
+        """
+        This function returns the sample standard deviation
+
+        Returns:
+            float: the sample standard deviation
+
+        Raises:
+            ValueError: If there are fewer than two values
+        """
+        return sqrt(self.variance())
+
+    def quantile(self, q):
+        """
+        This function returns an approximate quantile: the bins are
+        treated as groups of equal values and the quantile is linearly
+        interpolated between them as for sorted data, so it is exact if
+        no bins were merged (the levels 0 and 1 always give the exact
+        minimum and maximum)
+
+        Arguments:
+            q (float): quantile level from 0 to 1
+
+        Returns:
+            float: the quantile
+
+        Raises:
+            ValueError: If q is out of range or there are no values
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile level has to be between 0 and 1.")
+        if not self.count:
+            raise ValueError("Quantiles require at least one value.")
+
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        end = -1
+        for i, (value, count) in enumerate(zip(self._values, self._counts)):
+            end += count
+            if rank <= end:
+                return value
+            if rank < end + 1:
+                following = self._values[i + 1]
+                return value + (following - value) * (rank - end)
+        return self._values[-1]
+
+    def quantiles(self, n=4):
+        """
+        This function returns cut points dividing values into n groups
+        of equal size
+
+        Arguments:
+            n (int): number of groups
+
+        Returns:
+            list: n - 1 approximate quantiles
+        """
+        return [self.quantile(i / n) for i in range(1, n)]
+
+    def __repr__(self):
+        return (f"RunningStatistics(count={self.count},"
+                f" mean={self.mean}, min={self.min}, max={self.max})")
+
+
+if __name__ == '__main__':
+    import random
+
+    stream = (random.gauss(50, 10) for _ in range(100000))
+    first = RunningStatistics(stream)
+    second = RunningStatistics(range(100))
+    merged = first + second
+
+    print(f"Count: {merged.count}")
+    print(f"Mean: {merged.mean:.2f}")
+    print(f"Standard deviation: {merged.stdev():.2f}")
+    print(f"Minimum and maximum: {merged.min:.2f}, {merged.max:.2f}")
+    print(f"Quartiles: {[round(q, 2) for q in merged.quantiles()]}")
@@ -0,0 +1,238 @@
+"""
+Module containing statistics of sequences (base composition, GC content
+and GC skew) over arbitrary windows. Every statistic is computed from
+prefix sums of base counts built in one linear pass, so a query for any
+window takes constant time.
+"""
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STATISTICS = ('gc_content', 'gc_skew')
+
+
+class SequenceStatistics:
+    """
+    This class represents prefix sums of counts of characters of
+    a sequence: the element i of the prefix sums of a set of characters
+    is the number of positions before i holding one of them. Prefix sums
+    are built lazily, only for sets of characters that are queried.
+    Windows are given as in slicing: from start (inclusive) to end
+    (exclusive).
+    """
+
+    def __init__(self, data, use_numpy=False):
+        """
+        This function prepares statistics of a sequence
+
+        Arguments:
+            data (str): the sequence
+            use_numpy (bool): If True and NumPy is available, prefix sums
+                are kept in NumPy arrays and window_values returns
+                a NumPy array
+        """
+        self.data = str(data)
+        self.use_numpy = use_numpy and np is not None
+        self._raw = self.data.encode('ascii', 'replace')
+        self._prefixes = {}
+
+    def __len__(self):
+        """
+        This function returns the length of the sequence
+
+        Returns:
+            int: length of the sequence
+        """
+        return len(self.data)
+
+    def _prefix(self, chars):
+        """
+        This function returns prefix sums of occurrences of any of the
+        characters, building them on the first request
+
+        Arguments:
+            chars (str): counted characters
+
+        Returns:
+            prefix (array or numpy.ndarray): len(data) + 1 prefix sums
+        """
+        key = ''.join(sorted(set(chars)))
+
+        if key not in self._prefixes:
+            flags = bytearray(256)
+            for char in key.encode('ascii', 'replace'):
+                flags[char] = 1
+            indicators = self._raw.translate(flags)
+
+            if self.use_numpy:
+                prefix = np.zeros(len(indicators) + 1, dtype=np.uint32)
+                np.cumsum(np.frombuffer(indicators, dtype=np.uint8),
+                          dtype=np.uint32, out=prefix[1:])
+            else:
+                prefix = array('I', accumulate(indicators, initial=0))
+
+            self._prefixes[key] = prefix
+
+        return self._prefixes[key]
+
+    def _window(self, start, end):
+        """
+        This function checks a window and fills in its default end
+
+        Arguments:
+            start (int): start of the window
+            end (int): end of the window or None
+
+        Returns:
+            start, end (tuple): the window
+
+        Raises:
+            ValueError: If the window is out of the sequence
+        """
+        if end is None:
+            end = len(self.data)
+
+        if (not isinstance(start, int) or not isinstance(end, int)
+                or not 0 <= start <= end <= len(self.data)):
+            raise ValueError("Invalid window provided.")
+
+        return start, end
+
+    def count(self, chars, start=0, end=None):
+        """
+        This function counts occurrences of characters in a window
+
+        Arguments:
+            chars (str): counted characters
+            start (int): start of the window
+            end (int): end of the window, the end of the sequence by
+                default
+
+        Returns:
+            count (int): number of positions holding any of chars
+
+        Raises:
+            ValueError: If the window is out of the sequence
+        """
+        start, end = self._window(start, end)
+        prefix = self._prefix(chars)
+        return int(prefix[end]) - int(prefix[start])
+
+    def composition(self, alphabet, start=0, end=None):
+        """
+        This function counts every character of an alphabet in a window
+
+        Arguments:
+            alphabet (iterable): characters to be counted
+            start (int): start of the window
+            end (int): end of the window
+
+        Returns:
+            composition (dict): character as a key and number of its
+                occurrences as an item
+        """
+        return {char: self.count(char, start, end)
+                for char in sorted(alphabet)}
+
+    def gc_content(self, start=0, end=None):
+        """
+        This function calculates the fraction of G and C bases in
+        a window
+
+        Arguments:
+            start (int): start of the window
+            end (int): end of the window
+
+        Returns:
+            gc_content (float): fraction of G and C bases, 0.0 for an
+                empty window
+        """
+        start, end = self._window(start, end)
+        if start == end:
+            return 0.0
+        return self.count('GC', start, end) / (end - start)
+
+    def gc_skew(self, start=0, end=None):
+        """
+        This function calculates the GC skew (G - C) / (G + C) of
+        a window
+
+        Arguments:
+            start (int): start of the window
+            end (int): end of the window
+
+        Returns:
+            gc_skew (float): GC skew, 0.0 if there are no G and C bases
+        """
+        g_count = self.count('G', start, end)
+        c_count = self.count('C', start, end)
+        if not g_count + c_count:
+            return 0.0
+        return (g_count - c_count) / (g_count + c_count)
+
+    def window_values(self, statistic, window, step=None):
+        """
+        This function calculates a statistic for all windows of a given
+        size, e.g. for a genome browser track. With NumPy all windows are
+        computed at once from the prefix sums.
+
+        Arguments:
+            statistic (str): 'gc_content' or 'gc_skew'
+            window (int): size of a window
+            step (int): distance between starts of consecutive windows,
+                equal to window by default (windows do not overlap)
+
+        Returns:
+            values (list or numpy.ndarray): value of the statistic for
+                every window that fits into the sequence
+
+        Raises:
+            ValueError: If the statistic is not supported or window or
+                step is not greater than 0
+        """
+        if statistic not in STATISTICS:
+            raise ValueError("Statistic must be one of: "
+                             + ", ".join(STATISTICS))
+
+        if step is None:
+            step = window
+
+        for value in (window, step):
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError("window and step must be integers"
+                                 " greater than 0.")
+
+        starts = range(0, len(self.data) - window + 1, step)
+
+        if not self.use_numpy:
+            function = getattr(self, statistic)
+            return [function(start, start + window) for start in starts]
+
+        starts = np.arange(starts.start, starts.stop, step)
+        ends = starts + window
+
+        if statistic == 'gc_content':
+            prefix = self._prefix('GC')
+            return (prefix[ends] - prefix[starts]) / window
+
+        g_prefix = self._prefix('G')
+        c_prefix = self._prefix('C')
+        g_counts = (g_prefix[ends] - g_prefix[starts]).astype(np.int64)
+        c_counts = (c_prefix[ends] - c_prefix[starts]).astype(np.int64)
+        totals = g_counts + c_counts
+        return np.divide(g_counts - c_counts, totals,
+                         out=np.zeros(len(starts)), where=totals > 0)
+
+
+if __name__ == '__main__':
+    statistics = SequenceStatistics("ATCGGCTAATCGAAGCTGGGCCC")
+
+    print(f"Composition: {statistics.composition('ACGT')}")
+    print(f"GC content: {statistics.gc_content():.2f}")
+    print(f"GC skew of the first 10 bases: {statistics.gc_skew(0, 10):.2f}")
+    print(f"GC content of windows: "
+          f"{statistics.window_values('gc_content', 5)}")
@@ -0,0 +1,306 @@
+"""
+Module containing a store of sequences kept in an indexed FASTA file.
+The index (compatible with the .fai index of samtools faidx) holds the
+position and the layout of lines of every record, so records and their
+regions are served straight from the memory-mapped file, without
+parsing or reading the file when the store is opened.
+"""
+import mmap
+import os
+
+from biological_sequences import DNASequence
+from mapped_sequence import MappedSequence
+
+INDEX_SUFFIX = '.fai'
+
+
+def index_fasta(source):
+    """
+    This function builds an index of a FASTA file in a single pass over
+    its lines. Sequence lines of every record have to be of equal length,
+    except for the last one, which may be shorter.
+
+    Arguments:
+        source: bytes, bytearray or memory-mapped file with FASTA data
+
+    Returns:
+        index (dict): identifier of a record (the first word of its
+            header) as a key and a tuple
+            (length, offset, line_bases, line_bytes) as an item, where
+            offset is the position of the first base of the record
+
+    Raises:
+        ValueError: If data is found before the first header, a header
+            is repeated or lines of a record have different lengths
+    """
+    index = {}
+    record = None
+    start = 0
+
+    while start < len(source):
+        end = source.find(b'\n', start)
+        end = len(source) if end == -1 else end + 1
+        line = bytes(source[start:end])
+        bases = len(line.rstrip(b'\r\n'))
+
+        if line.startswith(b'>'):
+            if record is not None:
+                index[record[0]] = tuple(record[1:5])
+            # like samtools, a record is named by the first word of its
+            # header, the rest is a description
+            header = line[1:].decode('ascii').split(None, 1)
+            identifier = header[0] if header else ''
+            if identifier in index:
+                raise ValueError(f"Record {identifier} is repeated.")
+            # identifier, length, offset, line bases, line bytes, last
+            # line length (None until the first line is found)
+            record = [identifier, 0, end, 0, 0, None]
+        elif record is None:
+            if bases:
+                raise ValueError("Sequence data found before the first"
+                                 " FASTA header.")
+        else:
+            if record[5] is None:
+                record[3], record[4] = bases, len(line)
+            elif record[5] != record[3] or bases > record[3]:
+                if bases:
+                    raise ValueError(f"Lines of record {record[0]} have"
+                                     f" different lengths.")
+            record[1] += bases
+            record[5] = bases
+
+        start = end
+
+    if record is not None:
+        index[record[0]] = tuple(record[1:5])
+
+    return index
+
+
+def write_index(index, destination):
+    """
+    This function writes an index in the .fai format: one tab separated
+    line with identifier, length, offset, bases and bytes per line for
+    every record
+
+    Arguments:
+        index (dict): index returned by index_fasta
+        destination: A path to a file or an open text file object
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, 'w') as handle:
+            return write_index(index, handle)
+
+    destination.write(''.join(
+        f"{identifier}\t{length}\t{offset}\t{line_bases}\t{line_bytes}\n"
+        for identifier, (length, offset, line_bases, line_bytes)
+        in index.items()))
+
+
+def read_index(source):
+    """
+    This function reads an index in the .fai format
+
+    Arguments:
+        source: A path to a file or an open text file object
+
+    Returns:
+        index (dict): index in the format returned by index_fasta
+
+    Raises:
+        ValueError: If any line of the index is invalid
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as handle:
+            return read_index(handle)
+
+    index = {}
+    for line in source:
+        fields = line.rstrip('\r\n').split('\t')
+        if len(fields) < 5:
+            raise ValueError("Invalid line of the index provided.")
+        index[fields[0]] = tuple(int(field) for field in fields[1:5])
+    return index
+
+
+class SequenceStore:
+    """
+    This class represents a FASTA file opened for random access. The file
+    is memory-mapped and its index is read from the .fai file next to it
+    (it is built and saved when it is missing or older than the file).
+    Sequences returned by the store are backed by zero-copy views of the
+    mapped file, so the operating system reads only pages of the regions
+    that are actually used.
+    """
+
+    def __init__(self, path, sequence_class=DNASequence, index_path=None):
+        """
+        This function opens a FASTA file
+
+        Arguments:
+            path: A path to the FASTA file
+            sequence_class (type): Class of returned sequences, one of
+                DNASequence, RNASequence or ProteinSequence
+            index_path: A path to the index, the path of the file with
+                the .fai suffix by default
+
+        Raises:
+            ValueError: If the file cannot be indexed
+        """
+        self.path = os.fspath(path)
+        self.sequence_class = sequence_class
+        self.index_path = (self.path + INDEX_SUFFIX if index_path is None
+                           else os.fspath(index_path))
+
+        with open(self.path, 'rb') as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be memory-mapped
+                self._map = None
+
+        self._data = self._map if self._map is not None else b''
+        self._view = memoryview(self._data)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """
+        This function reads the index if it is up to date, otherwise
+        builds it and tries to save it for later use
+
+        Returns:
+            index (dict): index of the file
+        """
+        if (os.path.exists(self.index_path)
+                and os.path.getmtime(self.index_path)
+                >= os.path.getmtime(self.path)):
+            return read_index(self.index_path)
+
+        index = index_fasta(self._data)
+        try:
+            write_index(index, self.index_path)
+        except OSError:
+            pass
+        return index
+
+    def __len__(self):
+        """
+        This function returns the number of records in the file
+
+        Returns:
+            int: number of records
+        """
+        return len(self.index)
+
+    def __contains__(self, identifier):
+        return identifier in self.index
+
+    def __iter__(self):
+        """
+        This function iterates over identifiers of records in the order
+        of the file
+
+        Returns:
+            Iterator of identifiers (str)
+        """
+        return iter(self.index)
+
+    def __getitem__(self, identifier):
+        """
+        This function returns a whole record
+
+        Arguments:
+            identifier (str): identifier of the record
+
+        Returns:
+            sequence (Sequence): sequence backed by the mapped file
+
+        Raises:
+            KeyError: If there is no such record
+        """
+        return self.fetch(identifier)
+
+    def length(self, identifier):
+        """
+        This function returns the length of a record using only the index
+
+        Arguments:
+            identifier (str): identifier of the record
+
+        Returns:
+            int: number of bases of the record
+
+        Raises:
+            KeyError: If there is no such record
+        """
+        return self.index[identifier][0]
+
+    def fetch(self, identifier, start=0, end=None):
+        """
+        This function returns a record or its region as a sequence object
+        without reading any bases. Positions within the returned sequence
+        (e.g. found by find_motif) are relative to start.
+
+        Arguments:
+            identifier (str): identifier of the record
+            start (int): position of the first base of the region
+            end (int): position after the last base of the region, the
+                end of the record by default
+
+        Returns:
+            sequence (Sequence): sequence_class object, whose data is
+                a MappedSequence
+
+        Raises:
+            KeyError: If there is no such record
+            ValueError: If the region is out of the record
+        """
+        length, offset, line_bases, line_bytes = self.index[identifier]
+        record = MappedSequence(self._view[offset:], length, line_bases,
+                                line_bytes)
+
+        if end is None:
+            end = length
+        if start == 0 and end == length:
+            return self.sequence_class(record, identifier)
+
+        return self.sequence_class(record.region(start, end),
+                                   f"{identifier}:{start}-{end}")
+
+    def close(self):
+        """
+        This function unmaps the file. Sequences fetched from the store
+        must not be used afterwards.
+
+        Raises:
+            BufferError: If sequences fetched from the store still exist
+        """
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        fasta_path = os.path.join(directory, "reference.fa")
+        with open(fasta_path, 'w') as fasta_file:
+            fasta_file.write(">HumanDNA\nATCGGCTAAT\nCGAAGCTGGG\nCCC\n"
+                             ">MouseDNA\nGGGCTTAA\n")
+
+        with SequenceStore(fasta_path) as store:
+            print(f"Records: {list(store)}")
+            print(f"Length of HumanDNA: {store.length('HumanDNA')}")
+            region = store.fetch('HumanDNA', 10, 20)
+            print(f"Region: {region}")
+            print(f"Positions of 'GCT' in the region:"
+                  f" {region.find_motif('GCT')}")
+            del region
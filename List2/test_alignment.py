@@ -0,0 +1,93 @@
+import random
+import unittest
+from alignment import (banded_alignment, global_alignment, local_alignment,
+                       np)
+
+
+def matrix_score(a, b, match=1, mismatch=-1, gap=-1, local=False):
+    rows = [[0 if local else gap * (i + j) if not i or not j else 0
+             for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    best = 0
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            score = max(rows[i - 1][j - 1]
+                        + (match if a[i - 1] == b[j - 1] else mismatch),
+                        rows[i - 1][j] + gap, rows[i][j - 1] + gap)
+            rows[i][j] = max(score, 0) if local else score
+            best = max(best, rows[i][j])
+    return best if local else rows[-1][-1]
+
+
+class TestAlignment(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(12)
+        self.pairs = [(''.join(random.choice('ACGT')
+                               for _ in range(random.randint(0, 150))),
+                       ''.join(random.choice('ACGT')
+                               for _ in range(random.randint(0, 150))))
+                      for _ in range(20)]
+
+    def test_global_alignment(self):
+        alignment = global_alignment("GATTACA", "GATCA")
+        self.assertEqual(alignment.score, 3)
+        self.assertEqual(alignment.first, "GATTACA")
+        self.assertEqual(alignment.second.replace('-', ''), "GATCA")
+        self.assertEqual(str(alignment).count('|'), 5)
+
+    def test_global_alignment_random(self):
+        for a, b in self.pairs:
+            alignment = global_alignment(a, b, 2, -3, -2)
+            self.assertEqual(alignment.score, matrix_score(a, b, 2, -3, -2))
+            self.assertEqual(alignment.first.replace('-', ''), a)
+            self.assertEqual(alignment.second.replace('-', ''), b)
+
+    def test_local_alignment(self):
+        alignment = local_alignment("TTTTGATTACATTTT", "CCGATTACACC")
+        self.assertEqual(alignment.score, 7)
+        self.assertEqual(alignment.first, "GATTACA")
+        self.assertEqual(alignment.first_range, (4, 10))
+        self.assertEqual(alignment.second_range, (2, 8))
+        self.assertEqual(alignment.identity(), 1.0)
+
+    def test_local_alignment_random(self):
+        for a, b in self.pairs:
+            alignment = local_alignment(a, b)
+            self.assertEqual(alignment.score, matrix_score(a, b, local=True))
+
+    def test_local_alignment_empty(self):
+        alignment = local_alignment("AAAA", "CCCC")
+        self.assertEqual(alignment.score, 0)
+        self.assertEqual(alignment.first, '')
+        self.assertIsNone(alignment.first_range)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy(self):
+        for a, b in self.pairs:
+            self.assertEqual(global_alignment(a, b, use_numpy=True).score,
+                             global_alignment(a, b).score)
+            self.assertEqual(local_alignment(a, b, use_numpy=True).score,
+                             local_alignment(a, b).score)
+
+    def test_banded_alignment(self):
+        a = "ACGTACGTTAGCATGCA" * 10
+        b = a[:50] + 'G' + a[50:120] + a[121:]
+        self.assertEqual(banded_alignment(a, b, 3).score,
+                         global_alignment(a, b).score)
+        alignment = banded_alignment(a, b, 3)
+        self.assertEqual(alignment.first.replace('-', ''), a)
+        self.assertEqual(alignment.second.replace('-', ''), b)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            global_alignment("ACGT", "ACGT", gap=1)
+        with self.assertRaises(ValueError):
+            local_alignment("ACGT", "ACGT", match='1')
+        with self.assertRaises(ValueError):
+            banded_alignment("ACGTACGT", "ACGT", 2)
+        with self.assertRaises(ValueError):
+            banded_alignment("ACGT", "ACGT", -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
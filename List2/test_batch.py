@@ -0,0 +1,55 @@
+import unittest
+from batch import run_batch
+from biological_sequences import DNASequence, RNASequence, ProteinSequence
+
+
+class TestRunBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.dna = [DNASequence("ATGCGTACG" * (i + 1), f"dna_seq_{i}")
+                    for i in range(7)]
+
+    def test_complement(self):
+        results = list(run_batch(self.dna, 'complement', processes=2,
+                                 chunk_size=2))
+        self.assertEqual(results, [seq.complement() for seq in self.dna])
+
+    def test_find_motif(self):
+        results = list(run_batch(iter(self.dna), 'find_motif', 'CG',
+                                 processes=2, chunk_size=3))
+        self.assertEqual(results, [seq.find_motif('CG') for seq in self.dna])
+
+    def test_transcribe_and_translate(self):
+        rna = list(run_batch(self.dna, 'transcribe', processes=2))
+        self.assertIsInstance(rna[0], RNASequence)
+        self.assertEqual(rna[1].identifier, "dna_seq_1")
+        proteins = list(run_batch(rna, 'translate', processes=2))
+        self.assertIsInstance(proteins[0], ProteinSequence)
+        self.assertEqual(proteins[1].data, "MRTMRT")
+
+    def test_single_process(self):
+        results = list(run_batch(self.dna, 'reverse_complement',
+                                 processes=1))
+        self.assertEqual(results,
+                         [seq.reverse_complement() for seq in self.dna])
+
+    def test_empty_input(self):
+        self.assertEqual(list(run_batch([], 'complement', processes=2)), [])
+
+    def test_operation_error(self):
+        sequences = self.dna + [DNASequence("ATGU", "dna_seq_bad")]
+        with self.assertRaises(ValueError):
+            list(run_batch(sequences, 'complement', processes=2,
+                           chunk_size=2))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            run_batch(self.dna, 'mutate')
+        with self.assertRaises(ValueError):
+            run_batch(self.dna, 'complement', processes=0)
+        with self.assertRaises(ValueError):
+            run_batch(self.dna, 'complement', chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from biological_sequences import np
 from biological_sequences import DNASequence, RNASequence, ProteinSequence
 
 
@@ -11,6 +12,15 @@ class TestDNSequence(unittest.TestCase):
     def test_len(self):
         self.assertEqual(len(self.valid_dna), 9)
 
+    def test_validated(self):
+        self.assertTrue(self.valid_dna.validated)
+        self.assertFalse(self.invalid_dna.validated)
+        self.assertTrue(self.valid_dna.pack().validated)
+        self.valid_dna.data = "ATGU"
+        self.assertFalse(self.valid_dna.validated)
+        with self.assertRaises(ValueError):
+            self.valid_dna.transcribe()
+
     def test_str(self):
         self.assertEqual(str(self.valid_dna), ">dna_seq_1 \n ATGCGTACG")
 
@@ -28,17 +38,70 @@ class TestDNSequence(unittest.TestCase):
             self.valid_dna.mutate(2, 'U')
             self.valid_dna.mutate(2, 4)
 
+    def test_mutate_many(self):
+        mutated_seq = self.valid_dna.mutate_many([("insert", 2, "C"),
+                                                  ("substitute", 5, "AA"),
+                                                  ("delete", 8, 1)])
+        self.assertEqual(mutated_seq, "ATCGCGAAC")
+        self.assertEqual(self.valid_dna.data, "ATGCGTACG")
+
+    def test_mutate_many_invalid(self):
+        with self.assertRaises(ValueError):
+            self.valid_dna.mutate_many([("insert", 2, "U")])
+        with self.assertRaises(ValueError):
+            self.valid_dna.mutate_many([("delete", 2, 3),
+                                        ("substitute", 3, "A")])
+
     def test_find_motif(self):
         self.assertEqual(self.valid_dna.find_motif("AG"), [])
         self.assertEqual(self.valid_dna.find_motif("TG"), [(1, 2)])
         self.assertEqual(self.valid_dna.find_motif("CG"), [(3, 4), (7, 8)])
 
+    def test_find_motif_overlapping(self):
+        dna = DNASequence("AAAATAAA", "dna_seq_3")
+        self.assertEqual(dna.find_motif("AA"),
+                         [(0, 1), (1, 2), (2, 3), (5, 6), (6, 7)])
+
+    def test_find_motif_index(self):
+        dna = DNASequence("AAAATAAA", "dna_seq_3")
+        dna.build_index()
+        self.assertEqual(dna.find_motif("AA"),
+                         [(0, 1), (1, 2), (2, 3), (5, 6), (6, 7)])
+        self.assertEqual(self.valid_dna.build_index().find("CG"), [3, 7])
+        self.assertEqual(self.valid_dna.find_motif("CG"), [(3, 4), (7, 8)])
+
+    def test_find_motifs(self):
+        self.assertEqual(self.valid_dna.find_motifs(["AG", "TG", "CG"]),
+                         {"AG": [], "TG": [(1, 2)], "CG": [(3, 4), (7, 8)]})
+
+    def test_find_motifs_invalid(self):
+        with self.assertRaises(ValueError):
+            self.valid_dna.find_motifs(["CG", "CU"])
+
     def test_complement_valid(self):
         self.assertEqual(self.valid_dna.complement(), "TACGCATGC")
 
     def test_complement_invalid(self):
         with self.assertRaises(ValueError):
             self.invalid_dna.complement()
+        with self.assertRaises(ValueError):
+            DNASequence("ATGĄ", "dna_seq_3").complement()
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_complement_numpy(self):
+        self.assertEqual(self.valid_dna.complement(use_numpy=True),
+                         "TACGCATGC")
+        self.assertEqual(self.valid_dna.reverse_complement(use_numpy=True),
+                         "CGTACGCAT")
+        with self.assertRaises(ValueError):
+            self.invalid_dna.complement(use_numpy=True)
+
+    def test_reverse_complement_valid(self):
+        self.assertEqual(self.valid_dna.reverse_complement(), "CGTACGCAT")
+
+    def test_reverse_complement_invalid(self):
+        with self.assertRaises(ValueError):
+            self.invalid_dna.reverse_complement()
 
     def test_transcribe_valid(self):
         transcribed_rna = self.valid_dna.transcribe()
@@ -49,6 +112,88 @@ class TestDNSequence(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.invalid_dna.transcribe()
 
+    def test_kmer_counts(self):
+        self.assertEqual(self.valid_dna.kmer_counts(4),
+                         {"ATGC": 1, "TGCG": 1, "GCGT": 1, "CGTA": 1,
+                          "GTAC": 1, "TACG": 1})
+        self.assertEqual(self.valid_dna.kmer_counts(2, canonical=True),
+                         {"AT": 1, "CA": 1, "GC": 1, "CG": 2, "AC": 2,
+                          "TA": 1})
+
+    def test_statistics(self):
+        statistics = self.valid_dna.statistics()
+        self.assertIs(statistics, self.valid_dna.statistics())
+        self.assertAlmostEqual(statistics.gc_content(), 5 / 9)
+        self.assertEqual(statistics.composition(self.valid_dna.valid_chars),
+                         {'A': 2, 'C': 2, 'G': 3, 'T': 2})
+        self.valid_dna.data = "GGGG"
+        self.assertEqual(self.valid_dna.statistics().gc_skew(), 1.0)
+
+    def test_find_motif_mismatches(self):
+        self.assertEqual(self.valid_dna.find_motif("TAG", 1), [(5, 7, 1)])
+        self.assertEqual(self.valid_dna.find_motif("TAG", 2),
+                         [(0, 2, 2), (1, 3, 2), (2, 4, 2), (5, 7, 1),
+                          (6, 8, 2)])
+        self.assertEqual(self.valid_dna.find_motif("GCTA", 1, indels=True),
+                         [(4, 6, 1)])
+        with self.assertRaises(ValueError):
+            self.valid_dna.find_motif("TAG", -1)
+
+    def test_align(self):
+        other = DNASequence("ATGCTACG", "dna_seq_3")
+        alignment = self.valid_dna.align(other)
+        self.assertEqual(alignment.score, 7)
+        self.assertEqual(alignment.second.replace('-', ''), "ATGCTACG")
+        self.assertEqual(self.valid_dna.align(other, band=2).score, 7)
+        self.assertEqual(self.valid_dna.align(other, local=True).score, 7)
+
+    def test_align_invalid(self):
+        with self.assertRaises(ValueError):
+            self.valid_dna.align(ProteinSequence("ACD", "protein_seq_1"))
+        with self.assertRaises(ValueError):
+            self.valid_dna.align(self.valid_dna, local=True, band=2)
+
+    def test_kmer_counts_invalid(self):
+        with self.assertRaises(ValueError):
+            self.invalid_dna.kmer_counts(3)
+
+    def test_six_frame_translation(self):
+        dna = DNASequence("ATGGCCATTGTAATGGGCCGCTGAAAGGGTGCCCGATAG",
+                          "dna_seq_3")
+        frames = dna.six_frame_translation()
+        self.assertEqual(frames[1], "MAIVMGR*KGAR*")
+        self.assertEqual(frames[2], "WPL*WAAERVPD")
+        self.assertEqual(frames[3], "GHCNGPLKGCPI")
+        self.assertEqual(frames[-1], "LSGTLSAAHYNGH")
+        self.assertEqual(frames[-2], "YRAPFQRPITMA")
+        self.assertEqual(frames[-3], "IGHPFSGPLQWP")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_six_frame_translation_numpy(self):
+        dna = DNASequence("ATGGCCATTGTAATGGGCCGCTGAAAGGGTGCCCGATAG",
+                          "dna_seq_3")
+        self.assertEqual(dna.six_frame_translation(use_numpy=True),
+                         dna.six_frame_translation())
+
+    def test_pack(self):
+        packed_dna = self.valid_dna.pack()
+        self.assertIsInstance(packed_dna, DNASequence)
+        self.assertEqual(len(packed_dna), 9)
+        self.assertEqual(str(packed_dna), ">dna_seq_1 \n ATGCGTACG")
+        self.assertEqual(packed_dna.data[3:7], "CGTA")
+        self.assertEqual(packed_dna.complement(), "TACGCATGC")
+        self.assertEqual(packed_dna.find_motif("CG"), [(3, 4), (7, 8)])
+        self.assertEqual(packed_dna.transcribe().data, "AUGCGUACG")
+        self.assertEqual(packed_dna.mutate(2, 'C'), "ATCGCGTACG")
+
+    def test_pack_invalid(self):
+        with self.assertRaises(ValueError):
+            self.invalid_dna.pack()
+
+    def test_six_frame_translation_invalid(self):
+        with self.assertRaises(ValueError):
+            self.invalid_dna.six_frame_translation()
+
 
 class TestRNASequence(unittest.TestCase):
 
@@ -83,14 +228,35 @@ class TestRNASequence(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.invalid_rna.complement()
 
+    def test_reverse_complement_valid(self):
+        self.assertEqual(self.valid_rna.reverse_complement(), "CACCCUCAG")
+
     def test_translate_valid(self):
         translated_protein = self.valid_rna.translate()
         self.assertEqual(translated_protein.data, "LRV")
         self.assertIsInstance(translated_protein, ProteinSequence)
 
+    def test_pack(self):
+        packed_rna = self.valid_rna.pack()
+        self.assertEqual(packed_rna.data, "CUGAGGGUG")
+        self.assertEqual(packed_rna.translate().data, "LRV")
+
+    def test_translate_stop_codon(self):
+        rna = RNASequence("AUGUUUUAGXXX", "rna_seq_3")
+        self.assertEqual(rna.translate().data, "MF")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_translate_numpy(self):
+        translated_protein = self.valid_rna.translate(use_numpy=True)
+        self.assertEqual(translated_protein.data, "LRV")
+        with self.assertRaises(ValueError):
+            self.invalid_rna.translate(use_numpy=True)
+
     def test_translate_invalid(self):
         with self.assertRaises(ValueError):
             self.invalid_rna.translate()
+        with self.assertRaises(ValueError):
+            RNASequence("AUGUU", "rna_seq_3").translate()
 
 
 class TestProteinSequence(unittest.TestCase):
@@ -127,6 +293,17 @@ class TestProteinSequence(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.invalid_protein.find_motif("F4H")
 
+    def test_pack_invalid(self):
+        with self.assertRaises(ValueError):
+            self.valid_protein.pack()
+
+    def test_align_local(self):
+        other = ProteinSequence("WWWKLMNPQWWW", "protein_seq_3")
+        alignment = self.valid_protein.align(other, local=True)
+        self.assertEqual(alignment.first, "KLMNPQ")
+        self.assertEqual(alignment.first_range, (8, 13))
+        self.assertEqual(alignment.second_range, (3, 8))
+
 
 if __name__ == '__main__':
     unittest.main()
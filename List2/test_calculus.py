@@ -0,0 +1,89 @@
+import unittest
+from fractions import Fraction
+from calculus import (batch_derivative, batch_integral, batch_roots,
+                      derivative, integral, isolate_real_roots, real_roots,
+                      roots, sign_changes, sturm_sequence, np)
+
+
+class TestCalculus(unittest.TestCase):
+
+    def assertRootsAlmostEqual(self, found, expected, places=7):
+        self.assertEqual(len(found), len(expected))
+        for root, value in zip(found, expected):
+            self.assertAlmostEqual(root, value, places=places)
+
+    def test_derivative(self):
+        self.assertEqual(derivative([1, 0, -3, 2]), [3, 0, -3])
+        self.assertEqual(derivative([5]), [0])
+        self.assertEqual(derivative([1.5, 1]), [1.5])
+
+    def test_integral(self):
+        self.assertEqual(integral([3, 0, -3]), [1, 0, -3, 0])
+        self.assertEqual(integral([1, 1], 4), [Fraction(1, 2), 1, 4])
+        self.assertEqual(integral([1.0]), [1.0, 0])
+
+    def test_roots(self):
+        self.assertRootsAlmostEqual(roots([1, 0, -3, 2]), [-2, 1, 1],
+                                    places=6)
+        self.assertRootsAlmostEqual(roots([1, 0, 1]), [-1j, 1j])
+        self.assertRootsAlmostEqual(roots([2, -4, 0, 0]), [0, 0, 2])
+        self.assertEqual(roots([7]), [])
+        with self.assertRaises(ValueError):
+            roots([0, 0])
+
+    def test_roots_polish(self):
+        coefficients = [1]
+        for k in range(1, 13):
+            coefficients = [a - k * b for a, b in
+                            zip(coefficients + [0], [0] + coefficients)]
+        self.assertRootsAlmostEqual(roots(coefficients), range(1, 13),
+                                    places=6)
+
+    def test_sturm_sequence(self):
+        sequence = sturm_sequence([1, 0, -2])
+        self.assertEqual(sign_changes(sequence, -2)
+                         - sign_changes(sequence, 2), 2)
+        self.assertEqual(sign_changes(sequence, 0)
+                         - sign_changes(sequence, 2), 1)
+
+    def test_real_roots(self):
+        self.assertRootsAlmostEqual(real_roots([1, 0, -2]),
+                                    [-2 ** 0.5, 2 ** 0.5], places=11)
+        self.assertRootsAlmostEqual(real_roots([1, -2, 1]), [1])
+        self.assertRootsAlmostEqual(real_roots([1, 0, -3, 2]), [-2, 1])
+        self.assertRootsAlmostEqual(real_roots([1, 0, 0, 0]), [0])
+        self.assertRootsAlmostEqual(real_roots([0.5, -0.25, -0.125]),
+                                    [(1 - 5 ** 0.5) / 4, (1 + 5 ** 0.5) / 4])
+        self.assertEqual(real_roots([1, 0, 1]), [])
+        with self.assertRaises(ValueError):
+            real_roots([0])
+
+    def test_isolate_real_roots(self):
+        intervals = isolate_real_roots([1, 0, -5, 0, 4])
+        self.assertEqual(len(intervals), 4)
+        for (low, high), root in zip(intervals, (-2, -1, 1, 2)):
+            self.assertTrue(low < root <= high)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_calculus(self):
+        matrix = np.array([[1, 2, 3], [4, 0, -1]])
+        self.assertEqual(batch_derivative(matrix).tolist(), [[2, 2], [8, 0]])
+        self.assertEqual(batch_integral([[3, 2, 1]], 5).tolist(),
+                         [[1, 1, 1, 5]])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_roots(self):
+        rng = np.random.default_rng(21)
+        matrix = rng.normal(size=(50, 6))
+        found = batch_roots(matrix)
+        self.assertEqual(found.shape, (50, 5))
+        for row, row_roots in zip(matrix, found):
+            self.assertRootsAlmostEqual(row_roots, roots(row.tolist()))
+        with self.assertRaises(ValueError):
+            batch_roots([[0, 1]])
+        with self.assertRaises(ValueError):
+            batch_roots([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
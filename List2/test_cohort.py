@@ -0,0 +1,104 @@
+import unittest
+from cohort import Cohort, np
+from health_profile import HealthProfile
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestCohort(unittest.TestCase):
+
+    def setUp(self):
+        self.profiles = [
+            HealthProfile("John Smith", 2003, 189, 81),
+            HealthProfile("Michael Jackson", 1958, 176, 70),
+            HealthProfile("Ricky Martin", 1971, 174, 72),
+            HealthProfile("Lionel Messi", 1987, 170, 72),
+            HealthProfile("Joe Big", 1977, 170, 150)
+        ]
+        self.cohort = Cohort.from_profiles(self.profiles)
+
+    def test_columns(self):
+        self.assertEqual(len(self.cohort), 5)
+        self.assertEqual(self.cohort.dob.tolist(),
+                         [2003, 1958, 1971, 1987, 1977])
+        self.assertIs(Cohort(["a" + "b"], [2000], [170], [70]).names[0],
+                      Cohort(["ab"], [2000], [170], [70]).names[0])
+
+    def test_views(self):
+        patient = self.cohort[1]
+        self.assertIsInstance(patient, HealthProfile)
+        self.assertEqual(patient.name, "Michael Jackson")
+        self.assertEqual(patient.get_bmi(), self.profiles[1].get_bmi())
+        self.assertIsInstance(patient.dob, int)
+        patient.weight = 90
+        self.assertEqual(self.cohort.weight[1], 90)
+        self.assertEqual(self.cohort[-1].name, "Joe Big")
+        self.assertEqual([p.name for p in self.cohort][2], "Ricky Martin")
+        with self.assertRaises(IndexError):
+            self.cohort[5]
+        with self.assertRaises(AttributeError):
+            patient.nickname = "MJ"
+
+    def test_subsets(self):
+        subset = self.cohort[self.cohort.weight > 71]
+        self.assertEqual(subset.names, ["John Smith", "Ricky Martin",
+                                        "Lionel Messi", "Joe Big"])
+        self.assertEqual(self.cohort[1:3].height.tolist(), [176, 174])
+
+    def test_view_writes_validated(self):
+        patient = self.cohort[0]
+        for field, value in (('dob', 1990.7), ('height', "180"),
+                             ('weight', True), ('name', 5),
+                             ('dob', 2 ** 70)):
+            with self.assertRaises(ValueError):
+                setattr(patient, field, value)
+        self.assertEqual(self.cohort.dob[0], 2003)
+        self.assertEqual(self.cohort.names[0], "John Smith")
+        patient.dob = np.int64(1990)
+        patient.name = "".join(["Jo", "hn"])
+        self.assertEqual(patient.get_age(), self.profiles[0].get_age() + 13)
+        self.assertIs(self.cohort.names[0], Cohort(["John"], [2000], [170],
+                                                   [70]).names[0])
+
+    def test_ages_and_target_hr(self):
+        self.assertEqual(self.cohort.get_ages(2023).tolist(),
+                         [20, 65, 52, 36, 46])
+        low, high = self.cohort.get_target_hr(2023)
+        self.assertAlmostEqual(low[0], 128.0)
+        self.assertAlmostEqual(high[0], 152.0)
+        mean_age, std_dev_age = self.cohort.calculate_age_stats(2023)
+        self.assertAlmostEqual(mean_age, 43.80, places=2)
+        self.assertAlmostEqual(std_dev_age, 16.95, places=2)
+
+    def test_accumulate_age_stats(self):
+        stats = self.cohort[:2].accumulate_age_stats(year=2023)
+        self.cohort[2:].accumulate_age_stats(stats, year=2023)
+        self.assertEqual(stats.count, 5)
+        self.assertAlmostEqual(stats.mean, 43.8)
+        self.assertAlmostEqual(stats.stdev(), 16.95, places=2)
+        self.assertEqual((stats.min, stats.max), (20, 65))
+
+    def test_bmi_and_risk(self):
+        self.assertEqual(self.cohort.get_bmi().tolist(),
+                         [p.get_bmi() for p in self.profiles])
+        self.assertEqual(self.cohort.find_people_at_risk().tolist(), [3, 4])
+
+    def test_invalid_data(self):
+        cohort = Cohort(["A", "B", "C"], [2000, 1800, 2000], [170, 170, 20],
+                        [70, 70, 70])
+        self.assertEqual(cohort.valid_ages(2023).tolist(),
+                         [True, False, True])
+        self.assertEqual(cohort.valid_bmi().tolist(), [True, True, False])
+        with self.assertRaises(ValueError):
+            cohort.get_ages(2023)
+        with self.assertRaises(ValueError):
+            cohort.get_bmi()
+        with self.assertRaises(ValueError):
+            Cohort(["A"], ['f'], [170], [70])
+        with self.assertRaises(ValueError):
+            Cohort(["A", "B"], [2000], [170], [70])
+        with self.assertRaises(ValueError):
+            Cohort([1], [2000], [170], [70])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import csv
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+from cohort_loader import (REJECTED_COLUMNS, load_cohort, read_cohort,
+                           validate_chunk, np, pq)
+
+EXTRACT = ("name,dob,height,weight\n"
+           "John Smith,2003,189,81\n"
+           "Michael Jackson,1958,176,70\n"
+           "Unknown,1850,170,70\n"
+           "Lionel Messi,1987,170,72\n"
+           "Tall Person,1990,310,90\n"
+           "Adam Malysz,1977,170,55\n"
+           "Broken Row,19x7,170,55\n"
+           ",1990,170,70\n"
+           "Short Row,1990\n"
+           "Light Person,1990,170,1\n")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestCohortLoader(unittest.TestCase):
+
+    def test_read_cohort_chunks(self):
+        chunks = list(read_cohort(io.StringIO(EXTRACT), chunk_size=3,
+                                  year=2023))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual([len(cohort) for cohort, _ in chunks], [2, 2, 0, 0])
+        self.assertEqual([row[0] for _, rejected in chunks
+                          for row in rejected], [2, 4, 6, 7, 8, 9])
+        self.assertEqual(chunks[1][0].names, ["Lionel Messi", "Adam Malysz"])
+
+    def test_rejection_reasons(self):
+        cohort, rejected = load_cohort(io.StringIO(EXTRACT), year=2023)
+        self.assertEqual(cohort.names, ["John Smith", "Michael Jackson",
+                                        "Lionel Messi", "Adam Malysz"])
+        self.assertEqual(cohort.dob.tolist(), [2003, 1958, 1987, 1977])
+        self.assertEqual([row[:2] for row in rejected],
+                         [(2, "impossible age"), (4, "impossible height"),
+                          (6, "invalid dob"), (7, "invalid name"),
+                          (8, "missing fields"), (9, "impossible weight")])
+        self.assertEqual(rejected[2], (6, "invalid dob", "Broken Row",
+                                       "19x7", "170", "55"))
+        self.assertEqual(rejected[4], (8, "missing fields", "Short Row",
+                                       "1990", None, None))
+
+    def test_same_bounds_as_health_profile(self):
+        names = ["A"] * 6
+        cohort, rejected = validate_chunk(
+            names, [2023, 1903, 1902, 2000, 2000, 2000],
+            [50, 270, 170, 49, 170, 170], [2, 300, 70, 70, 301, 70],
+            year=2023)
+        self.assertEqual(len(cohort), 3)
+        self.assertEqual([row[1] for row in rejected],
+                         ["impossible age", "impossible height",
+                          "impossible weight"])
+
+    def test_float_and_missing_values(self):
+        cohort, rejected = validate_chunk(
+            ["A", "B", None], np.array([2000.0, np.nan, 2000.0]),
+            [170, 170, 170], ["70", " 71 ", "72"], year=2023)
+        self.assertEqual(cohort.weight.tolist(), [70])
+        self.assertEqual([row[1] for row in rejected],
+                         ["invalid dob", "invalid name"])
+
+    def test_non_ascii_digits(self):
+        extract = ("name,dob,height,weight\n"
+                   "John Smith,19\u00b20,189,81\n"
+                   "Lionel Messi,1987,\u0661\u0667\u0660,72\n"
+                   "Adam Malysz,1977,170,55\n")
+        cohort, rejected = load_cohort(io.StringIO(extract), year=2023)
+        self.assertEqual(cohort.names, ["Adam Malysz"])
+        self.assertEqual([row[:2] for row in rejected],
+                         [(0, "invalid dob"), (1, "invalid height")])
+
+    def test_long_field(self):
+        rows = ["name,dob,height,weight"]
+        rows += [f"Patient {i},1990,170,70" for i in range(1000)]
+        rows[500] = "Bad Row," + "1" * 20000 + ",170,70"
+        tracemalloc.start()
+        try:
+            cohort, rejected = load_cohort(io.StringIO("\n".join(rows)),
+                                           year=2023)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(cohort), 999)
+        self.assertEqual(rejected[0][:3], (499, "invalid dob", "Bad Row"))
+        # 1000 fixed-width strings of 20000 characters take 80 MB
+        self.assertLess(peak, 10 * 2 ** 20)
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "extract.csv")
+            side_table = os.path.join(directory, "rejected.csv")
+            with open(source, 'w') as handle:
+                handle.write(EXTRACT)
+            cohort, rejected = load_cohort(source, side_table,
+                                           chunk_size=4, year=2023)
+            self.assertEqual(len(cohort), 4)
+            self.assertEqual(rejected, [])
+            with open(side_table, newline='') as handle:
+                rows = list(csv.reader(handle))
+            self.assertEqual(tuple(rows[0]), REJECTED_COLUMNS)
+            self.assertEqual(len(rows), 7)
+
+    def test_column_order(self):
+        extract = ("weight,extra,dob,name,height\n"
+                   "81,x,2003,John Smith,189\n")
+        cohort, rejected = load_cohort(io.StringIO(extract), year=2023)
+        self.assertEqual(cohort[0].name, "John Smith")
+        self.assertEqual(cohort[0].get_bmi(), 22.68)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            list(read_cohort(io.StringIO("name,dob\nA,2000\n")))
+        with self.assertRaises(ValueError):
+            list(read_cohort(io.StringIO(EXTRACT), chunk_size=0))
+        with self.assertRaises(ValueError):
+            list(read_cohort(io.StringIO(EXTRACT), file_format='xls'))
+
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_parquet(self):
+        import pyarrow
+
+        table = pyarrow.table({
+            'Weight': [81, 70, 70, 72],
+            'extra': ['a', 'b', 'c', 'd'],
+            'DOB': [2003, 1958, 1850, None],
+            'Name': ["John Smith", "Michael Jackson", "Unknown",
+                     "Lionel Messi"],
+            'Height': [189, 176, 170, 170]})
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "extract.parquet")
+            pq.write_table(table, source)
+            chunks = list(read_cohort(source, chunk_size=3, year=2023))
+        self.assertEqual(len(chunks), 2)
+        cohort, rejected = chunks[0]
+        self.assertEqual(cohort.names, ["John Smith", "Michael Jackson"])
+        self.assertEqual(cohort.weight.tolist(), [81, 70])
+        self.assertEqual(cohort.height.tolist(), [189, 176])
+        self.assertEqual(rejected[0][:2], (2, "impossible age"))
+        self.assertEqual(chunks[1][1][0][:2], (3, "invalid dob"))
+
+    @unittest.skipIf(pq is not None, "pyarrow is installed")
+    def test_parquet_without_pyarrow(self):
+        with self.assertRaises(ValueError):
+            list(read_cohort("extract.parquet"))
+
+
+if __name__ == '__main__':
+    unittest.main()
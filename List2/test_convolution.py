@@ -0,0 +1,63 @@
+import random
+import unittest
+from fractions import Fraction
+from convolution import (convolve, fft_convolve, karatsuba, ntt_convolve,
+                         schoolbook, np)
+
+
+class TestConvolution(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(16)
+
+    def random_list(self, length, limit=10 ** 6):
+        return [random.randint(-limit, limit) for _ in range(length)]
+
+    def test_schoolbook(self):
+        self.assertEqual(schoolbook([1, 2, 1], [1, 1, 1]), [1, 3, 4, 3, 1])
+        self.assertEqual(convolve([], [1, 2]), [])
+
+    def test_karatsuba(self):
+        for length_a, length_b in ((32, 32), (100, 37), (33, 150),
+                                   (257, 256), (40, 300)):
+            a = self.random_list(length_a)
+            b = self.random_list(length_b)
+            self.assertEqual(karatsuba(a, b), schoolbook(a, b))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_ntt_convolve(self):
+        for length_a, length_b in ((1, 1), (5, 3), (600, 700), (1024, 1)):
+            a = self.random_list(length_a)
+            b = self.random_list(length_b)
+            self.assertEqual(ntt_convolve(a, b), schoolbook(a, b))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_ntt_convolve_large_coefficients(self):
+        a = self.random_list(50, 10 ** 30)
+        self.assertIsNone(ntt_convolve(a, a))
+        self.assertEqual(convolve(a, a), schoolbook(a, a))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_fft_convolve(self):
+        a = [random.random() for _ in range(600)]
+        b = [random.random() for _ in range(520)]
+        for x, y in zip(fft_convolve(a, b), schoolbook(a, b)):
+            self.assertAlmostEqual(x, y)
+
+    def test_convolve_large(self):
+        a = self.random_list(3000, 1000)
+        b = self.random_list(2000, 1000)
+        result = convolve(a, b)
+        self.assertEqual(len(result), 4999)
+        self.assertEqual(result[:50], schoolbook(a[:50], b[:50])[:50])
+        self.assertEqual(result[-1], a[-1] * b[-1])
+        self.assertEqual(result, karatsuba(a, b))
+
+    def test_convolve_fractions(self):
+        a = [Fraction(value, 3) for value in self.random_list(600, 100)]
+        b = [Fraction(1, value or 1) for value in self.random_list(600, 100)]
+        self.assertEqual(convolve(a, b), karatsuba(a, b))
+
+
+if __name__ == '__main__':
+    unittest.main()
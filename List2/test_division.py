@@ -0,0 +1,108 @@
+import random
+import time
+import unittest
+from fractions import Fraction
+from unittest.mock import patch
+from division import (HALF_GCD_BASE, NEWTON_THRESHOLD, long_divmod,
+                      newton_divmod, normalize, poly_divmod, poly_gcd,
+                      series_inverse)
+from convolution import convolve
+
+PRIME = 998244353
+
+
+class TestDivision(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(19)
+
+    def random_polynomial(self, length, limit=PRIME - 1):
+        return [random.randint(1, limit)] + [random.randint(0, limit)
+                                             for _ in range(length - 1)]
+
+    def test_long_divmod(self):
+        self.assertEqual(long_divmod([1, 0, -3, 2], [1, -1]),
+                         ([1, 1, -2], []))
+        self.assertEqual(long_divmod([1, 0, 1], [2, 0]),
+                         ([Fraction(1, 2), 0], [1]))
+        self.assertEqual(long_divmod([3, 1], [1, 0, 0]), ([], [3, 1]))
+
+    def test_normalize(self):
+        self.assertEqual(normalize([0, 0, 1, 0]), [1, 0])
+        self.assertEqual(normalize([7, 14, 3], 7), [3])
+        self.assertEqual(normalize([0, 0]), [])
+
+    def test_series_inverse(self):
+        series = self.random_polynomial(100)
+        inverse = series_inverse(series, 100, PRIME)
+        product = [value % PRIME for value in convolve(series, inverse)]
+        self.assertEqual(product[:100], [1] + [0] * 99)
+
+    def test_newton_divmod_modular(self):
+        a = self.random_polynomial(700)
+        b = self.random_polynomial(300)
+        self.assertEqual(newton_divmod(a, b, PRIME),
+                         long_divmod(a, b, PRIME))
+
+    def test_newton_divmod_rational(self):
+        a = self.random_polynomial(2 * NEWTON_THRESHOLD + 10, 20)
+        b = self.random_polynomial(NEWTON_THRESHOLD, 20)
+        quotient, remainder = poly_divmod(a, b)
+        self.assertEqual((quotient, remainder), long_divmod(a, b))
+        self.assertEqual(newton_divmod(a, b), (quotient, remainder))
+        product = convolve(quotient, b)
+        offset = len(product) - len(remainder)
+        product[offset:] = [x + y for x, y in
+                            zip(product[offset:], remainder)]
+        self.assertEqual(product, a)
+
+    def test_exact_divmod_time(self):
+        # series inverses of exact coefficients grow, so exact division
+        # has to stay with long division
+        b = self.random_polynomial(300, 20)
+        a = convolve(b, self.random_polynomial(300, 20))
+        start = time.perf_counter()
+        self.assertEqual(poly_divmod(a, b)[1], [])
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_divide_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            poly_divmod([1, 2], [0, 0])
+        with self.assertRaises(ZeroDivisionError):
+            poly_divmod([1, 2], [7], 7)
+
+    def test_gcd_small(self):
+        self.assertEqual(poly_gcd([1, 0, -3, 2], [1, 0, -1]), [1, -1])
+        self.assertEqual(poly_gcd([2, 4], [3, 6]), [1, 2])
+        self.assertEqual(poly_gcd([1, 0, 1], [1, 1]), [1])
+        self.assertEqual(poly_gcd([0], [0, 0]), [])
+        self.assertEqual(poly_gcd([1, 0, 0, 6], [1, 5, 6], 7), [1, 3])
+
+    def test_gcd_integer(self):
+        common = self.random_polynomial(50, 20)
+        a = convolve(common, self.random_polynomial(150, 20))
+        b = convolve(common, self.random_polynomial(140, 20))
+        start = time.perf_counter()
+        gcd = poly_gcd(a, b)
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(gcd, [Fraction(value, common[0])
+                               for value in common])
+        self.assertEqual(poly_gcd([Fraction(1, 2), Fraction(-1, 2)],
+                                  [3, 0, -3]), [1, -1])
+        self.assertEqual(poly_gcd([4, 8], [6, -6]), [1])
+
+    def test_gcd_half_gcd(self):
+        common = self.random_polynomial(60)
+        a = normalize(convolve(common, self.random_polynomial(
+            4 * HALF_GCD_BASE)), PRIME)
+        b = normalize(convolve(common, self.random_polynomial(
+            4 * HALF_GCD_BASE - 30)), PRIME)
+        inverse = pow(common[0], -1, PRIME)
+        # the half-GCD algorithm for polynomials above HALF_GCD_BASE
+        with patch('division.HALF_GCD_THRESHOLD', HALF_GCD_BASE):
+            self.assertEqual(poly_gcd(a, b, PRIME),
+                             [value * inverse % PRIME for value in common])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from fractions import Fraction
+from evaluation import (COMPILE_MAX_TERMS, array_dtype, compile_horner,
+                        compile_sparse, horner, horner_many,
+                        multipoint_evaluate, subproduct_tree, np)
+
+
+class TestEvaluation(unittest.TestCase):
+
+    def test_horner(self):
+        self.assertEqual(horner([2, -3, 0, 5], 2), 9)
+        self.assertEqual(horner([], 3), 0)
+        self.assertEqual(horner([-42, 32, -1.5, 3.7, 0, 2], 2), -827.2)
+
+    def test_horner_many(self):
+        self.assertEqual(horner_many([1, 0, -1], [0, 1, 2]), [-1, 0, 3])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_horner_many_numpy(self):
+        values = horner_many([1.5, 0, -1], np.arange(4.0), use_numpy=True)
+        self.assertEqual(values.tolist(), [-1.0, 0.5, 5.0, 12.5])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_array_dtype(self):
+        points = np.array([-3, 2])
+        self.assertEqual(array_dtype([1, 0, 1], points), np.int64)
+        self.assertEqual(array_dtype([1] * 40, points), object)
+        self.assertEqual(array_dtype([2 ** 62, 0], points), object)
+        self.assertEqual(array_dtype([1, 0.5], points), np.float64)
+        self.assertEqual(array_dtype([Fraction(1, 2)], points), object)
+        self.assertEqual(array_dtype([1, 1], np.array([2 ** 63],
+                                                      dtype=np.uint64)),
+                         object)
+        values = horner_many([1] * 40, points, use_numpy=True)
+        self.assertEqual(values.tolist(),
+                         [horner([1] * 40, x) for x in (-3, 2)])
+
+    def test_subproduct_tree(self):
+        tree = subproduct_tree([1, 2, 3])
+        self.assertEqual(tree[0], [[1, -1], [1, -2], [1, -3]])
+        self.assertEqual(tree[-1], [[1, -6, 11, -6]])
+
+    def test_multipoint_evaluate(self):
+        random.seed(17)
+        for _ in range(20):
+            coefficients = [random.randint(-99, 99)
+                            for _ in range(random.randint(1, 60))]
+            points = [random.randint(-50, 50)
+                      for _ in range(random.randint(0, 90))]
+            self.assertEqual(multipoint_evaluate(coefficients, points),
+                             [horner(coefficients, x) for x in points])
+        coefficients = [random.randint(-99, 99) for _ in range(300)]
+        points = list(range(-100, 100))
+        self.assertEqual(multipoint_evaluate(coefficients, points),
+                         [horner(coefficients, x) for x in points])
+        coefficients = [Fraction(1, 3), 0, -2] * 20
+        points = [Fraction(i, 7) for i in range(50)]
+        self.assertEqual(multipoint_evaluate(coefficients, points),
+                         [horner(coefficients, x) for x in points])
+
+    def test_multipoint_evaluate_invalid_input(self):
+        with self.assertRaises(ValueError):
+            multipoint_evaluate([1, 2], [0.5])
+        with self.assertRaises(ValueError):
+            multipoint_evaluate([1.5, 2], [1, 2])
+
+    def test_compile_horner(self):
+        for coefficients in ([], [4], [2, -3, 0, 5], [0, 0, 1],
+                             list(range(COMPILE_MAX_TERMS + 5))):
+            evaluate = compile_horner(coefficients)
+            for x in (0, 2, -1.5):
+                self.assertEqual(evaluate(x), horner(coefficients, x))
+
+    def test_compile_sparse(self):
+        self.assertEqual(compile_sparse({3: 2, 1: 1, 0: -4})(2), 14)
+        self.assertEqual(compile_sparse({})(7), 0)
+        terms = {2 * i: i for i in range(COMPILE_MAX_TERMS + 1)}
+        self.assertEqual(compile_sparse(terms)(1), sum(terms.values()))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_compile_numpy(self):
+        points = np.arange(5)
+        self.assertEqual(compile_horner([1, 0, 1])(points).tolist(),
+                         [1, 2, 5, 10, 17])
+        self.assertEqual(compile_horner([3])(points).tolist(), [3] * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
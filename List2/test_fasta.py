@@ -0,0 +1,82 @@
+import io
+import os
+import tempfile
+import unittest
+from biological_sequences import DNASequence, RNASequence, ProteinSequence
+from fasta import read_fasta, write_fasta
+
+
+class TestFasta(unittest.TestCase):
+
+    def setUp(self):
+        self.fasta_text = (">dna_seq_1\nATGCG\nTACG\n"
+                           "; comment line\n"
+                           "\n"
+                           ">dna_seq_2 description\nGGCTA\n")
+
+    def test_read_fasta_text_file(self):
+        records = list(read_fasta(io.StringIO(self.fasta_text)))
+        self.assertEqual(len(records), 2)
+        self.assertIsInstance(records[0], DNASequence)
+        self.assertEqual(records[0].identifier, "dna_seq_1")
+        self.assertEqual(records[0].data, "ATGCGTACG")
+        self.assertEqual(records[1].identifier, "dna_seq_2")
+        self.assertEqual(records[1].data, "GGCTA")
+
+    def test_read_fasta_buffer(self):
+        records = list(read_fasta(self.fasta_text.encode()))
+        self.assertEqual([r.data for r in records], ["ATGCGTACG", "GGCTA"])
+
+    def test_read_fasta_is_lazy(self):
+        records = read_fasta(io.StringIO(self.fasta_text + ">bad\n"))
+        self.assertEqual(next(records).identifier, "dna_seq_1")
+
+    def test_read_fasta_sequence_class(self):
+        records = list(read_fasta(io.StringIO(">rna\nCUGAGG\n"),
+                                  RNASequence))
+        self.assertIsInstance(records[0], RNASequence)
+
+    def test_read_fasta_str_format(self):
+        text = str(DNASequence("ATGCGTACG", "dna_seq_1"))
+        record = next(read_fasta(io.StringIO(text)))
+        self.assertEqual(record.identifier, "dna_seq_1")
+        self.assertEqual(record.data, "ATGCGTACG")
+
+    def test_read_fasta_invalid(self):
+        with self.assertRaises(ValueError):
+            list(read_fasta(io.StringIO("ATGC\n>dna\nATGC\n")))
+        with self.assertRaises(TypeError):
+            list(read_fasta(42))
+
+    def test_write_and_read_file(self):
+        sequences = [ProteinSequence("ACDEFGHIKLMNPQRSTVWY", "protein_1"),
+                     ProteinSequence("MSRSL", "protein_2")]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "proteins.fasta")
+            written = write_fasta(sequences, path, line_width=7,
+                                  batch_size=1)
+            self.assertEqual(written, 2)
+            records = list(read_fasta(path, ProteinSequence))
+        self.assertEqual([r.data for r in records],
+                         ["ACDEFGHIKLMNPQRSTVWY", "MSRSL"])
+
+    def test_write_fasta_layout(self):
+        output = io.StringIO()
+        write_fasta([DNASequence("ATGCGTACG", "dna_seq_1")], output,
+                    line_width=4)
+        self.assertEqual(output.getvalue(), ">dna_seq_1\nATGC\nGTAC\nG\n")
+
+    def test_write_fasta_invalid(self):
+        with self.assertRaises(ValueError):
+            write_fasta([], io.StringIO(), line_width=-1)
+            write_fasta([], io.StringIO(), batch_size=0)
+
+    def test_read_empty_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "empty.fasta")
+            open(path, 'w').close()
+            self.assertEqual(list(read_fasta(path)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
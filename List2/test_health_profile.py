@@ -1,4 +1,5 @@
 import unittest
+from statistics import mean, stdev
 from health_profile import HealthProfile
 
 
@@ -67,6 +68,39 @@ class TestHealthProfile(unittest.TestCase):
         self.assertAlmostEqual(mean_age, 43.80, places=2)
         self.assertAlmostEqual(std_dev_age, 16.95, places=2)
 
+    def test_calculate_age_stats_generator(self):
+        patients = [HealthProfile("Patient", year, 170, 70)
+                    for year in range(1950, 2010, 7)]
+        ages = [patient.get_age() for patient in patients]
+        mean_age, std_dev_age = HealthProfile.calculate_age_stats(
+            patient for patient in patients)
+        self.assertAlmostEqual(mean_age, mean(ages))
+        self.assertAlmostEqual(std_dev_age, stdev(ages))
+
+    def test_accumulate_age_stats(self):
+        patients = [HealthProfile("Patient", year, 170, 70)
+                    for year in range(1950, 2010, 3)]
+        ages = [patient.get_age() for patient in patients]
+        stats = HealthProfile.accumulate_age_stats(patients[:7])
+        HealthProfile.accumulate_age_stats(iter(patients[7:]), stats)
+        self.assertEqual(stats.count, len(patients))
+        self.assertEqual((stats.min, stats.max), (min(ages), max(ages)))
+        self.assertAlmostEqual(stats.variance(), stdev(ages) ** 2)
+
+    def test_calculate_age_stats_invalid_input(self):
+        with self.assertRaises(ValueError):
+            HealthProfile.calculate_age_stats(5)
+        with self.assertRaises(ValueError):
+            HealthProfile.calculate_age_stats(
+                [HealthProfile("John Smith", 2003, 189, 81)])
+        with self.assertRaises(ValueError):
+            HealthProfile.calculate_age_stats("ab")
+        with self.assertRaises(ValueError):
+            HealthProfile.calculate_age_stats(b"ab")
+        with self.assertRaises(ValueError):
+            HealthProfile.calculate_age_stats(
+                [HealthProfile("John Smith", 2003, 189, 81), 1990])
+
     def test_find_people_at_risk(self):
         patients_list = [
             HealthProfile("John Smith", 2003, 189, 81),
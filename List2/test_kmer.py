@@ -0,0 +1,67 @@
+import random
+import unittest
+from kmer import (kmer_counts, count_kmer_codes, encode_kmer, decode_kmer,
+                  np)
+
+
+def naive_counts(data, k, canonical=False):
+    complement = str.maketrans('ACGT', 'TGCA')
+    counts = {}
+    for i in range(len(data) - k + 1):
+        kmer = data[i:i + k]
+        if canonical:
+            kmer = min(kmer, kmer.translate(complement)[::-1])
+        counts[kmer] = counts.get(kmer, 0) + 1
+    return counts
+
+
+class TestKmer(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.strand = ''.join(random.choice('ACGT') for _ in range(3000))
+
+    def test_encode_decode(self):
+        self.assertEqual(encode_kmer("ACGT"), 0b00011011)
+        self.assertEqual(decode_kmer(0b00011011, 4), "ACGT")
+        with self.assertRaises(ValueError):
+            encode_kmer("ACGU")
+
+    def test_kmer_counts(self):
+        self.assertEqual(kmer_counts("ATCGATC", 3),
+                         {"ATC": 2, "TCG": 1, "CGA": 1, "GAT": 1})
+        self.assertEqual(kmer_counts("AC", 3), {})
+
+    def test_kmer_counts_random(self):
+        for k in (1, 4, 21):
+            self.assertEqual(kmer_counts(self.strand, k),
+                             naive_counts(self.strand, k))
+
+    def test_canonical(self):
+        self.assertEqual(kmer_counts("AAATTT", 3, canonical=True),
+                         {"AAA": 2, "AAT": 2})
+        self.assertEqual(kmer_counts(self.strand, 5, canonical=True),
+                         naive_counts(self.strand, 5, canonical=True))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy(self):
+        for k in (3, 21, 32):
+            for canonical in (False, True):
+                self.assertEqual(
+                    count_kmer_codes(self.strand, k, canonical,
+                                     use_numpy=True),
+                    count_kmer_codes(self.strand, k, canonical))
+
+    def test_invalid_input(self):
+        with self.assertRaises(TypeError):
+            kmer_counts("ACGT", 'a')
+        with self.assertRaises(ValueError):
+            kmer_counts("ACGT", 0)
+        with self.assertRaises(ValueError):
+            kmer_counts("ACGT", 33)
+        with self.assertRaises(ValueError):
+            kmer_counts("ACGU", 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
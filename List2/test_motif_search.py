@@ -0,0 +1,128 @@
+import random
+import unittest
+from motif_search import (SuffixArray, AhoCorasick, find_edits,
+                          find_mismatches)
+
+
+def naive_find(text, motif):
+    return [i for i in range(len(text) - len(motif) + 1)
+            if text[i:i + len(motif)] == motif]
+
+
+class TestSuffixArray(unittest.TestCase):
+
+    def test_suffixes(self):
+        index = SuffixArray("banana")
+        self.assertEqual(index.suffixes, [5, 3, 1, 0, 4, 2])
+        self.assertEqual(SuffixArray("").suffixes, [])
+
+    def test_find(self):
+        index = SuffixArray("ATCGGCTAATCGAAGCT")
+        self.assertEqual(index.find("GCT"), [4, 14])
+        self.assertEqual(index.find("TTT"), [])
+
+    def test_find_random(self):
+        random.seed(3)
+        text = ''.join(random.choice("ACGT") for _ in range(500))
+        index = SuffixArray(text)
+        for k in range(1, 6):
+            motif = text[k * 17:k * 17 + k]
+            self.assertEqual(index.find(motif), naive_find(text, motif))
+
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def test_find_all(self):
+        automaton = AhoCorasick(["GCT", "ATC", "CG"])
+        self.assertEqual(automaton.find_all("ATCGGCTAATCGAAGCT"),
+                         {"GCT": [(4, 6), (14, 16)],
+                          "ATC": [(0, 2), (8, 10)],
+                          "CG": [(2, 3), (10, 11)]})
+
+    def test_nested_motifs(self):
+        automaton = AhoCorasick(["AA", "AAA", "A"])
+        positions = automaton.find_all("AAAA")
+        self.assertEqual(positions["A"], [(0, 0), (1, 1), (2, 2), (3, 3)])
+        self.assertEqual(positions["AA"], [(0, 1), (1, 2), (2, 3)])
+        self.assertEqual(positions["AAA"], [(0, 2), (1, 3)])
+
+    def test_find_all_random(self):
+        random.seed(5)
+        text = ''.join(random.choice("ACGT") for _ in range(1000))
+        motifs = [''.join(random.choice("ACGT") for _ in range(k % 5 + 1))
+                  for k in range(40)]
+        positions = AhoCorasick(motifs).find_all(text)
+        for motif in motifs:
+            self.assertEqual([start for start, end in positions[motif]],
+                             naive_find(text, motif))
+
+    def test_empty_motif(self):
+        with self.assertRaises(ValueError):
+            AhoCorasick(["ACG", ""])
+
+
+def edit_distance(a, b):
+    column = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        previous, column = column, [i]
+        for j, char_b in enumerate(b, 1):
+            column.append(min(previous[j - 1] + (char_a != char_b),
+                              previous[j] + 1, column[j - 1] + 1))
+    return column[-1]
+
+
+class TestApproximateSearch(unittest.TestCase):
+
+    def test_find_mismatches(self):
+        self.assertEqual(find_mismatches("ATCGGCTAATCGAAGCT", "GCA", 1),
+                         [(4, 6, 1), (11, 13, 1), (14, 16, 1)])
+        self.assertEqual(find_mismatches("ACGT", "ACGT", 0), [(0, 3, 0)])
+        self.assertEqual(find_mismatches("AC", "ACGT", 2), [])
+
+    def test_find_mismatches_random(self):
+        random.seed(13)
+        text = ''.join(random.choice("ACGT") for _ in range(300))
+        for length in range(1, 12):
+            motif = ''.join(random.choice("ACGT") for _ in range(length))
+            expected = []
+            for start in range(len(text) - length + 1):
+                mismatches = sum(x != y for x, y in
+                                 zip(text[start:start + length], motif))
+                if mismatches <= 2:
+                    expected.append((start, start + length - 1, mismatches))
+            self.assertEqual(find_mismatches(text, motif, 2), expected)
+
+    def test_find_edits(self):
+        self.assertEqual(find_edits("TTACGGTTT", "ACGT", 1),
+                         [(2, 4, 1), (2, 5, 1), (2, 6, 1)])
+        self.assertEqual(find_edits("ACGT", "ACGT", 0), [(0, 3, 0)])
+
+    def test_find_edits_random(self):
+        random.seed(14)
+        text = ''.join(random.choice("ACGT") for _ in range(60))
+        for length in range(1, 8):
+            motif = ''.join(random.choice("ACGT") for _ in range(length))
+            found = find_edits(text, motif, 2)
+            expected = []
+            for end in range(len(text)):
+                distance = min(edit_distance(motif, text[start:end + 1])
+                               for start in range(end + 2))
+                if distance <= 2:
+                    expected.append((end, distance))
+            self.assertEqual([(end, edits) for _, end, edits in found],
+                             expected)
+            for start, end, edits in found:
+                self.assertEqual(
+                    edit_distance(motif, text[start:end + 1]), edits)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            find_mismatches("ACGT", "", 1)
+        with self.assertRaises(ValueError):
+            find_edits("ACGT", "AC", -1)
+        with self.assertRaises(ValueError):
+            find_edits("ACGT", "AC", 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
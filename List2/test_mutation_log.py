@@ -0,0 +1,72 @@
+import unittest
+from mutation_log import MutationLog
+
+
+class TestMutationLog(unittest.TestCase):
+
+    def setUp(self):
+        self.log = MutationLog("ATCGGCTAAT", set('ACGT'))
+
+    def test_no_mutations(self):
+        self.assertEqual(self.log.materialize(), "ATCGGCTAAT")
+        self.assertEqual(len(self.log), 10)
+
+    def test_insert(self):
+        self.log.insert(4, "CCC")
+        self.log.insert(10, "GG")
+        self.assertEqual(str(self.log), "ATCGCCCGCTAATGG")
+        self.assertEqual(len(self.log), 15)
+
+    def test_insert_same_position(self):
+        self.log.insert(2, "A")
+        self.log.insert(2, "C")
+        self.assertEqual(str(self.log), "ATACCGGCTAAT")
+
+    def test_substitute(self):
+        self.log.substitute(8, "GG")
+        self.log.substitute(0, "C")
+        self.assertEqual(str(self.log), "CTCGGCTAGG")
+
+    def test_delete(self):
+        self.log.delete(0)
+        self.log.delete(5, 3)
+        self.assertEqual(str(self.log), "TCGGAT")
+        self.assertEqual(len(self.log), 6)
+
+    def test_apply_order_independent(self):
+        mutations = [("delete", 7, 2), ("insert", 3, "TT"),
+                     ("substitute", 0, "GG"), ("insert", 7, "A")]
+        log2 = MutationLog("ATCGGCTAAT")
+        self.log.apply(mutations)
+        log2.apply(reversed(mutations))
+        self.assertEqual(str(self.log), "GGCTTGGCTAT")
+        self.assertEqual(str(self.log), str(log2))
+        self.assertEqual(len(self.log), len(str(self.log)))
+
+    def test_materialize_cached(self):
+        self.log.insert(1, "A")
+        self.assertIs(self.log.materialize(), self.log.materialize())
+        self.log.insert(1, "C")
+        self.assertEqual(str(self.log), "AACTCGGCTAAT")
+
+    def test_invalid_mutations(self):
+        with self.assertRaises(ValueError):
+            self.log.insert(11, "A")
+        with self.assertRaises(ValueError):
+            self.log.insert(2, "U")
+        with self.assertRaises(ValueError):
+            self.log.substitute(9, "AA")
+        with self.assertRaises(ValueError):
+            self.log.delete(2, 0)
+        with self.assertRaises(ValueError):
+            self.log.apply([("swap", 2, "A")])
+
+    def test_overlapping_mutations(self):
+        self.log.delete(2, 4)
+        self.log.insert(3, "A")
+        with self.assertRaises(ValueError):
+            self.log.materialize()
+
+
+if __name__ == '__main__':
+    unittest.main()
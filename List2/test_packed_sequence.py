@@ -0,0 +1,58 @@
+import unittest
+from packed_sequence import PackedSequence
+
+
+class TestPackedSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.data = "ATCGGCTAATCGAAGCT"
+        self.packed = PackedSequence(self.data)
+
+    def test_len(self):
+        self.assertEqual(len(self.packed), 17)
+        self.assertEqual(len(PackedSequence("")), 0)
+
+    def test_nbytes(self):
+        self.assertEqual(self.packed.nbytes(), 5)
+
+    def test_str(self):
+        self.assertEqual(str(self.packed), self.data)
+        self.assertEqual(str(PackedSequence("")), "")
+
+    def test_getitem_index(self):
+        for i in range(-len(self.data), len(self.data)):
+            self.assertEqual(self.packed[i], self.data[i])
+
+    def test_getitem_invalid_index(self):
+        with self.assertRaises(IndexError):
+            self.packed[17]
+        with self.assertRaises(TypeError):
+            self.packed['a']
+
+    def test_getitem_slice(self):
+        for key in (slice(3, 10), slice(None, 5), slice(-6, None),
+                    slice(1, 16, 3), slice(None, None, -1),
+                    slice(15, 2, -2), slice(10, 3)):
+            self.assertEqual(self.packed[key], self.data[key])
+
+    def test_iter(self):
+        self.assertEqual(''.join(self.packed), self.data)
+
+    def test_eq(self):
+        self.assertEqual(self.packed, self.data)
+        self.assertEqual(self.packed, PackedSequence(self.data))
+        self.assertNotEqual(self.packed, PackedSequence(self.data[:-1]))
+
+    def test_rna_bases(self):
+        packed = PackedSequence("CUGAGGGUG", b'ACGU')
+        self.assertEqual(str(packed), "CUGAGGGUG")
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            PackedSequence("ATGCU")
+        with self.assertRaises(ValueError):
+            PackedSequence("ATGC", b'ACG')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from polynomial import Polynomial
+from fractions import Fraction
+from polynomial import SPARSE_MIN_LENGTH, Polynomial, np
 
 
 class TestPolynomial(unittest.TestCase):
@@ -32,6 +33,47 @@ class TestPolynomial(unittest.TestCase):
         pol2 = Polynomial([-42, 32, -1.5, 3.7, 0, 2])
         self.assertEqual(pol2.__call__(2), -827.2)
 
+    def test_call_many_points(self):
+        pol1 = Polynomial([2, -3, 0, 5])
+        self.assertEqual(pol1([0, 1, 2, 3]), [5, 4, 9, 32])
+        self.assertEqual(pol1.evaluate(range(-3, 4), method='tree'),
+                         [pol1(x) for x in range(-3, 4)])
+        self.assertEqual(Polynomial({50: 1, 0: -1})((1, 2)),
+                         [0, 2 ** 50 - 1])
+        with self.assertRaises(ValueError):
+            pol1.evaluate([1, 2], method='newton')
+        with self.assertRaises(ValueError):
+            pol1.evaluate([0.5, 1.5], method='tree')
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_call_numpy_array(self):
+        pol1 = Polynomial([-42, 32, -1.5, 3.7, 0, 2])
+        points = np.linspace(-2, 2, 101)
+        values = pol1(points)
+        self.assertIsInstance(values, np.ndarray)
+        for x, value in zip(points, values):
+            self.assertAlmostEqual(value, pol1(float(x)))
+        sparse = Polynomial({80: 1.0, 1: 2.0})
+        self.assertTrue(np.allclose(sparse(np.array([0.5, -1.0])),
+                                    [0.5 ** 80 + 1.0, -1.0]))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_call_numpy_array_exact(self):
+        self.assertEqual(Polynomial([1] + [0] * 10)(np.array([100])).tolist(),
+                         [10 ** 20])
+        self.assertEqual(Polynomial([2 ** 70, 1])(np.array([2, 3])).tolist(),
+                         [2 ** 71 + 1, 3 * 2 ** 70 + 1])
+        self.assertEqual(
+            Polynomial([Fraction(1, 2), 1])(np.array([2, 3])).tolist(),
+            [2, Fraction(5, 2)])
+        self.assertEqual(Polynomial([3, 0, 1])(np.array([1, 2])).dtype,
+                         np.int64)
+        compiled = Polynomial([1] + [0] * 10)
+        compiled.compile()
+        self.assertEqual(compiled(np.array([100])).tolist(), [10 ** 20])
+        sparse = Polynomial({80: 1, 0: 1})
+        self.assertEqual(sparse(np.array([2])).tolist(), [2 ** 80 + 1])
+
     def test_call_invalid_input(self):
         with self.assertRaises(ValueError):
             pol1 = Polynomial(['cadsa', 4.11, -0, 4])
@@ -48,6 +90,31 @@ class TestPolynomial(unittest.TestCase):
         result2 = pol1 + pol3
         self.assertAlmostEqual(result2.coefficients, [4.7, 2, 7.1])
 
+    def test_operands_not_modified(self):
+        pol1 = Polynomial([1, 2, 4])
+        pol2 = Polynomial([-4, 7])
+        pol1 + pol2
+        pol2 - pol1
+        self.assertEqual(pol1.coefficients, [1, 2, 4])
+        self.assertEqual(pol2.coefficients, [-4, 7])
+        pol2 += pol1
+        self.assertEqual(pol1.coefficients, [1, 2, 4])
+        self.assertEqual(pol2.coefficients, [1, -2, 11])
+        pol1.coefficients.append(5)
+        self.assertEqual(pol1.degree(), 2)
+        pol1.coefficients[0] = 5
+        self.assertEqual(pol1.coefficients, [1, 2, 4])
+        coefficients = pol1.coefficients
+        coefficients[0] = 5
+        pol1.coefficients = coefficients
+        self.assertEqual(pol1.coefficients, [5, 2, 4])
+
+    def test_add_shorter_first(self):
+        pol1 = Polynomial([1, 1])
+        pol2 = Polynomial([2, 0, 0, 3])
+        self.assertEqual((pol1 + pol2).coefficients, [2, 0, 1, 4])
+        self.assertEqual((pol1 - pol2).coefficients, [-2, 0, 1, -2])
+
     def test_add_invalid_input(self):
         with self.assertRaises(ValueError):
             pol1 = Polynomial(['acgt', 4.11, -0, 4])
@@ -78,6 +145,13 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(result.coefficients, [1, 3, 4, 3, 1])
         self.assertEqual(result2.coefficients, [4.1, 8.2, 6.5, 4.8, 2.4])
 
+    def test_mul_large(self):
+        pol1 = Polynomial([1] * 3000)
+        pol2 = Polynomial([1, -1])
+        result = pol1 * pol2
+        self.assertEqual(result.coefficients, [1] + [0] * 2999 + [-1])
+        self.assertEqual((pol1 * pol1).coefficients[2999], 3000)
+
     def test_mul_invalid_input(self):
         with self.assertRaises(ValueError):
             pol1 = Polynomial(['acgt', 4.11, -0, 4])
@@ -129,6 +203,221 @@ class TestPolynomial(unittest.TestCase):
             pol2 = Polynomial([4, 3, 7, 1])
             pol1 *= pol2
 
+    def test_divmod(self):
+        pol1 = Polynomial([1, 0, -3, 2])
+        pol2 = Polynomial([2, -2])
+        quotient, remainder = divmod(pol1, pol2)
+        self.assertEqual(quotient.coefficients,
+                         [Fraction(1, 2), Fraction(1, 2), -1])
+        self.assertEqual(remainder.coefficients, [0])
+        self.assertEqual((pol1 // Polynomial([1, 1])).coefficients,
+                         [1, -1, -2])
+        self.assertEqual((pol1 % Polynomial([1, 0, 0])).coefficients,
+                         [-3, 2])
+        self.assertEqual((Polynomial([1, 2]) // pol1).coefficients, [0])
+        self.assertEqual(pol1.coefficients, [1, 0, -3, 2])
+
+    def test_divmod_modular(self):
+        quotient, remainder = Polynomial([1, 0, 1]).divide(
+            Polynomial([2, 0]), modulus=7)
+        self.assertEqual(quotient.coefficients, [4, 0])
+        self.assertEqual(remainder.coefficients, [1])
+
+    def test_divmod_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Polynomial([1, 2]) // [1, 2]
+        with self.assertRaises(ZeroDivisionError):
+            Polynomial([1, 2]) % Polynomial([0])
+
+    def test_gcd(self):
+        pol1 = Polynomial([1, 0, -3, 2])
+        self.assertEqual(pol1.gcd(Polynomial([1, 0, -1])).coefficients,
+                         [1, -1])
+        self.assertEqual(Polynomial([1, 0, 0, 6]).gcd(
+            Polynomial([1, 5, 6]), modulus=7).coefficients, [1, 3])
+        self.assertEqual(Polynomial([0]).gcd(Polynomial([0])).coefficients,
+                         [0])
+        with self.assertRaises(ValueError):
+            pol1.gcd(3)
+
+    def test_reduce(self):
+        self.assertEqual(Polynomial([8, -1, 14]).reduce(7).coefficients,
+                         [1, 6, 0])
+        self.assertEqual(Polynomial({100: 8, 0: 3}).reduce(3).terms,
+                         {100: 2})
+        with self.assertRaises(ValueError):
+            Polynomial([1.5, 2]).reduce(7)
+        with self.assertRaises(ValueError):
+            Polynomial([1, 2]).reduce(0)
+
+    def test_derivative_and_integral(self):
+        pol1 = Polynomial([1, 0, -3, 2])
+        self.assertEqual(pol1.derivative().coefficients, [3, 0, -3])
+        self.assertEqual(pol1.integral(1).coefficients,
+                         [Fraction(1, 4), 0, Fraction(-3, 2), 2, 1])
+        self.assertEqual(pol1.integral().derivative().coefficients,
+                         [1, 0, -3, 2])
+        sparse = Polynomial({100: 2, 0: 1})
+        self.assertEqual(sparse.derivative().terms, {99: 200})
+        self.assertEqual(sparse.integral().terms,
+                         {101: Fraction(2, 101), 1: 1})
+        with self.assertRaises(ValueError):
+            pol1.integral('c')
+
+    def test_roots(self):
+        pol1 = Polynomial([1, 0, -1])
+        for root, value in zip(pol1.roots(), (-1, 1)):
+            self.assertAlmostEqual(root, value)
+        for root, value in zip(Polynomial([1, 0, -3, 2]).real_roots(),
+                               (-2, 1)):
+            self.assertAlmostEqual(root, value)
+        with self.assertRaises(ValueError):
+            Polynomial([0]).roots()
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_roots(self):
+        found = Polynomial.batch_roots([Polynomial([1, 0, -1]),
+                                        Polynomial([1, -3, 2])])
+        self.assertTrue(np.allclose(found, [[-1, 1], [1, 2]]))
+        with self.assertRaises(ValueError):
+            Polynomial.batch_roots([Polynomial([1, 2]), Polynomial([1])])
+
+
+class TestCompiledPolynomial(unittest.TestCase):
+
+    def test_compiled_values(self):
+        for coefficients in ([2, -3, 0, 5], [0, 1, -2, 2], [7], [1.5, 0]):
+            polynomial = Polynomial(coefficients)
+            compiled = Polynomial(coefficients).compile()
+            self.assertTrue(compiled.is_compiled())
+            for x in (0, 1, -2, 3.5, Fraction(1, 3)):
+                self.assertEqual(compiled(x), polynomial(x))
+        self.assertFalse(Polynomial([1]).is_compiled())
+
+    def test_compiled_sparse(self):
+        polynomial = Polynomial({100: 2, 1: -1, 0: 3}).compile()
+        self.assertEqual(polynomial(2), 2 * 2 ** 100 + 1)
+        self.assertEqual(Polynomial({}, sparse=True).compile()(5), 0)
+
+    def test_compiled_many_points(self):
+        polynomial = Polynomial([1, 2, 3]).compile()
+        self.assertEqual(polynomial([0, 1, 2]), [3, 6, 11])
+        if np is not None:
+            self.assertEqual(polynomial(np.array([0, 1, 2])).tolist(),
+                             [3, 6, 11])
+
+    def test_memoization(self):
+        polynomial = Polynomial([1, 0, 1]).compile(memo_size=2)
+        self.assertEqual(polynomial(3), 10)
+        self.assertEqual(polynomial(3), 10)
+        memo = polynomial._compiled()[1]
+        self.assertEqual(memo.cache_info().hits, 1)
+        polynomial(4)
+        polynomial(5)
+        self.assertEqual(memo.cache_info().currsize, 2)
+        self.assertIsNone(Polynomial([1]).compile(0)._compiled()[1])
+
+    def test_invalidation(self):
+        polynomial = Polynomial([1, 1]).compile()
+        self.assertEqual(polynomial(2), 3)
+        polynomial += Polynomial([1, 0, 0])
+        self.assertEqual(polynomial(2), 7)
+        polynomial -= Polynomial([1])
+        self.assertEqual(polynomial(2), 6)
+        polynomial *= Polynomial({100: 1})
+        self.assertEqual(polynomial(2), 6 * 2 ** 100)
+        self.assertTrue(polynomial.is_compiled())
+
+    def test_compile_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Polynomial([1]).compile(-1)
+
+
+class TestSparsePolynomial(unittest.TestCase):
+
+    def setUp(self):
+        self.sparse = Polynomial({100000: 1, 0: 1})
+        self.dense = Polynomial([2, 0, -1])
+
+    def test_representation(self):
+        self.assertTrue(self.sparse.is_sparse())
+        self.assertFalse(self.dense.is_sparse())
+        self.assertTrue(Polynomial([1] + [0] * 99).is_sparse())
+        self.assertFalse(Polynomial({2: 1, 1: 1}, sparse=False).is_sparse())
+        self.assertEqual(Polynomial({2: 3, 0: 1}).coefficients, [3, 0, 1])
+        self.assertEqual(self.dense.to_sparse().terms, {2: 2, 0: -1})
+        self.assertEqual(self.dense.to_sparse().to_dense().coefficients,
+                         [2, 0, -1])
+
+    def test_degree_and_str(self):
+        self.assertEqual(self.sparse.degree(), 100000)
+        self.assertEqual(str(self.sparse),
+                         str(Polynomial([1] + [0] * 99999 + [1],
+                                        sparse=False)))
+        self.assertEqual(str(Polynomial({3: -1, 1: 2.5}, sparse=True)),
+                         "-x^3 + 0x^2 + 2.5x + 0")
+        self.assertEqual(str(Polynomial({}, sparse=True)), "0")
+
+    def test_same_as_dense(self):
+        # the representation, chosen by the length, is not observable
+        for length in (10, SPARSE_MIN_LENGTH - 1, SPARSE_MIN_LENGTH, 200):
+            coefficients = [0] * 5 + [1] + [0] * length + [-2, 0]
+            forms = [Polynomial(coefficients),
+                     Polynomial(coefficients, sparse=False),
+                     Polynomial(coefficients, sparse=True)]
+            self.assertTrue(forms[2].is_sparse())
+            for polynomial in forms:
+                self.assertEqual(polynomial.degree(), length + 2)
+                self.assertEqual(polynomial.coefficients,
+                                 coefficients[5:])
+                self.assertEqual(str(polynomial), str(forms[1]))
+
+            first = Polynomial([3] + [0] * length + [1])
+            second = Polynomial([-3] + [0] * (length - 2) + [2, 0, 5])
+            total = first + second
+            self.assertEqual(total.degree(), 2)
+            self.assertEqual(total.coefficients, [2, 0, 6])
+            self.assertEqual(str(total), "2x^2 + 0x + 6")
+            self.assertEqual((first - first).coefficients, [0])
+
+    def test_call(self):
+        self.assertEqual(self.sparse(1), 2)
+        self.assertEqual(self.sparse(-1), 2)
+        self.assertEqual(Polynomial({3: 3, 1: -2})(2), 20)
+
+    def test_add_sub_mixed(self):
+        result = self.sparse + self.dense
+        self.assertTrue(result.is_sparse())
+        self.assertEqual(result.terms, {100000: 1, 2: 2})
+        self.assertEqual((self.dense - self.sparse).terms,
+                         {100000: -1, 2: 2, 0: -2})
+        self.assertEqual((self.sparse - self.sparse).terms, {})
+        self.assertEqual(self.dense.coefficients, [2, 0, -1])
+
+    def test_mul_mixed(self):
+        result = self.sparse * self.sparse
+        self.assertEqual(result.terms, {200000: 1, 100000: 2, 0: 1})
+        self.assertEqual((self.dense * Polynomial({1: 1})).coefficients,
+                         [2, 0, -1, 0])
+
+    def test_inplace_mixed(self):
+        polynomial = Polynomial([1, 1])
+        polynomial += self.sparse
+        self.assertEqual(polynomial.terms, {100000: 1, 1: 1, 0: 2})
+        polynomial -= self.sparse
+        self.assertEqual(polynomial.coefficients, [1, 1])
+        polynomial *= self.sparse
+        self.assertEqual(polynomial.terms,
+                         {100001: 1, 100000: 1, 1: 1, 0: 1})
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Polynomial({-1: 2})
+        with self.assertRaises(ValueError):
+            Polynomial({2: 'a'})
+        with self.assertRaises(ValueError):
+            self.sparse + [1, 2]
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from convolution import schoolbook
+from polynomial import Polynomial
+from polynomial_batch import PolynomialBatch, batch_convolve, np
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestPolynomialBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.polynomials = [Polynomial([1, 0, -1]), Polynomial([2, 3]),
+                            Polynomial([1, -3, 2])]
+        self.batch = PolynomialBatch.from_polynomials(self.polynomials)
+
+    def assertBatchEqual(self, batch, polynomials):
+        self.assertEqual([polynomial.coefficients
+                          for polynomial in batch.to_polynomials()],
+                         [polynomial.coefficients
+                          for polynomial in polynomials])
+
+    def test_conversion(self):
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch.degree(), 2)
+        self.assertEqual(self.batch.coefficients[1].tolist(), [0, 2, 3])
+        self.assertBatchEqual(self.batch, self.polynomials)
+        self.assertEqual(self.batch[1].coefficients, [2, 3])
+        self.assertEqual(PolynomialBatch([[0, 0]])[0].coefficients, [0])
+
+    def test_add_sub(self):
+        other = PolynomialBatch([[1, 1, 1, 1], [0, 0, 0, 1], [0, 0, 1, 0]])
+        self.assertBatchEqual(self.batch + other,
+                              [p + q for p, q in
+                               zip(self.polynomials, other.to_polynomials())])
+        self.assertBatchEqual(self.batch - other,
+                              [Polynomial([-1, 0, -1, -2]),
+                               Polynomial([2, 2]),
+                               Polynomial([1, -4, 2])])
+        self.assertBatchEqual(self.batch - Polynomial([1, 0, 0]),
+                              [Polynomial([-1]), Polynomial([-1, 2, 3]),
+                               Polynomial([-3, 2])])
+
+    def test_mul(self):
+        self.assertBatchEqual(self.batch * self.batch,
+                              [p * p for p in self.polynomials])
+        self.assertBatchEqual(self.batch * Polynomial([1, 1]),
+                              [p * Polynomial([1, 1])
+                               for p in self.polynomials])
+
+    def test_batch_convolve(self):
+        rng = np.random.default_rng(22)
+        a = rng.integers(-1000, 1000, (20, 70))
+        b = rng.integers(-1000, 1000, (20, 40))
+        product = batch_convolve(a, b)
+        self.assertTrue(np.issubdtype(product.dtype, np.integer))
+        for i in range(20):
+            self.assertEqual(product[i].tolist(),
+                             schoolbook(a[i].tolist(), b[i].tolist()))
+        x = rng.normal(size=(5, 50))
+        self.assertTrue(np.allclose(
+            batch_convolve(x, x)[0], schoolbook(x[0].tolist(), x[0].tolist())))
+
+    def test_batch_convolve_large_integers(self):
+        # too large for exact FFT products, but within int64
+        large = np.array([[2 ** 28 - i for i in range(40)]] * 2)
+        product = batch_convolve(large, large)
+        self.assertEqual(product[1].tolist(),
+                         schoolbook(large[1].tolist(), large[1].tolist()))
+        small = np.array([[7, -5]], dtype=np.int32)
+        wide = np.array([[2 ** 31 - 1, 1]], dtype=np.int32)
+        self.assertEqual(batch_convolve(small, wide).tolist(),
+                         [schoolbook([7, -5], [2 ** 31 - 1, 1])])
+        huge = np.array([[2 ** 40, 3, 2 ** 40 - 1], [1, 1, 1]])
+        with self.assertRaises(ValueError):
+            batch_convolve(huge, huge)
+        with self.assertRaises(ValueError):
+            PolynomialBatch(huge) * Polynomial([2 ** 30, 1])
+
+    def test_evaluate(self):
+        values = self.batch([0, 1, 2])
+        self.assertEqual(values.tolist(), [[-1, 0, 3], [3, 5, 7], [2, 0, 0]])
+        self.assertEqual(self.batch(2).tolist(), [[3], [7], [0]])
+        self.assertEqual(self.batch.evaluate([1, 2, 3], per_row=True)
+                         .tolist(), [0, 7, 2])
+        self.assertEqual(self.batch.evaluate([[0, 1]] * 3, per_row=True)
+                         .tolist(), [[-1, 0], [3, 5], [2, 0]])
+        with self.assertRaises(ValueError):
+            self.batch.evaluate([1, 2], per_row=True)
+
+    def test_large_integers(self):
+        large = PolynomialBatch([[3_000_000_000, 1]])
+        values = large.evaluate(10 ** 10)
+        self.assertEqual(values.tolist(), [[3 * 10 ** 19 + 1]])
+        self.assertEqual(large.evaluate([10 ** 10], per_row=True).tolist(),
+                         [3 * 10 ** 19 + 1])
+        self.assertEqual(self.batch(2).dtype, np.int64)
+        x = PolynomialBatch([[2 ** 62, 1]])
+        with self.assertRaises(ValueError):
+            x + x
+        with self.assertRaises(ValueError):
+            x - PolynomialBatch([[-2 ** 62, 1]])
+        self.assertEqual((x + Polynomial([1])).coefficients.tolist(),
+                         [[2 ** 62, 2]])
+
+    def test_derivative_and_roots(self):
+        self.assertBatchEqual(self.batch.derivative(),
+                              [p.derivative() for p in self.polynomials])
+        batch = PolynomialBatch.from_polynomials([self.polynomials[0],
+                                                  self.polynomials[2]])
+        self.assertTrue(np.allclose(batch.roots(), [[-1, 1], [1, 2]]))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            PolynomialBatch([1, 2, 3])
+        with self.assertRaises(ValueError):
+            PolynomialBatch([['a', 'b']])
+        with self.assertRaises(ValueError):
+            PolynomialBatch.from_polynomials([[1, 2]])
+        with self.assertRaises(ValueError):
+            self.batch + PolynomialBatch([[1, 2]])
+        with self.assertRaises(ValueError):
+            self.batch * 3
+
+
+if __name__ == '__main__':
+    unittest.main()
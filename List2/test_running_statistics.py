@@ -0,0 +1,75 @@
+import random
+import unittest
+from statistics import mean, quantiles, variance
+from running_statistics import RunningStatistics, np
+
+
+class TestRunningStatistics(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(24)
+        self.values = [random.randint(0, 100) for _ in range(1000)]
+
+    def test_moments(self):
+        stats = RunningStatistics(iter(self.values))
+        self.assertEqual(stats.count, 1000)
+        self.assertAlmostEqual(stats.mean, mean(self.values))
+        self.assertAlmostEqual(stats.variance(), variance(self.values))
+        self.assertEqual(stats.min, min(self.values))
+        self.assertEqual(stats.max, max(self.values))
+
+    def test_exact_quantiles(self):
+        stats = RunningStatistics(self.values)
+        self.assertEqual(stats.quantiles(10),
+                         quantiles(self.values, n=10, method='inclusive'))
+        self.assertEqual(stats.quantile(0), min(self.values))
+        self.assertEqual(stats.quantile(1), max(self.values))
+
+    def test_approximate_quantiles(self):
+        values = [random.gauss(0, 1) for _ in range(20000)]
+        stats = RunningStatistics(values, max_bins=64)
+        self.assertLessEqual(len(stats._values), 2 * 64)
+        ordered = sorted(values)
+        for q in (0.1, 0.25, 0.5, 0.75, 0.9):
+            rank = sum(value <= stats.quantile(q) for value in ordered)
+            self.assertLess(abs(rank / len(values) - q), 2 / 64)
+
+    def test_merge(self):
+        parts = [RunningStatistics(self.values[i::4]) for i in range(4)]
+        merged = parts[0] + parts[1]
+        merged.merge(parts[2]).merge(parts[3])
+        self.assertEqual(merged.count, 1000)
+        self.assertAlmostEqual(merged.mean, mean(self.values))
+        self.assertAlmostEqual(merged.variance(), variance(self.values))
+        self.assertEqual(merged.quantiles(),
+                         quantiles(self.values, method='inclusive'))
+        self.assertEqual(parts[0].count, 250)
+        self.assertIs(parts[0].merge(RunningStatistics()), parts[0])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_update(self):
+        stats = RunningStatistics(self.values[:500])
+        stats.update(np.array(self.values[500:]))
+        self.assertAlmostEqual(stats.mean, mean(self.values))
+        self.assertAlmostEqual(stats.variance(), variance(self.values))
+        self.assertEqual(stats.quantiles(),
+                         quantiles(self.values, method='inclusive'))
+        values = np.random.default_rng(24).normal(size=10000)
+        stats = RunningStatistics(values)
+        self.assertLess(abs(stats.quantile(0.5) - np.median(values)), 0.05)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            RunningStatistics([1]).variance()
+        with self.assertRaises(ValueError):
+            RunningStatistics().quantile(0.5)
+        with self.assertRaises(ValueError):
+            RunningStatistics([1, 2]).quantile(1.5)
+        with self.assertRaises(ValueError):
+            RunningStatistics(max_bins=1)
+        with self.assertRaises(ValueError):
+            RunningStatistics().merge([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
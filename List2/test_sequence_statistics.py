@@ -0,0 +1,62 @@
+import random
+import unittest
+from sequence_statistics import SequenceStatistics, np
+
+
+class TestSequenceStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.statistics = SequenceStatistics("ATCGGCTAATCGAAGCTGGGCCC")
+
+    def test_count(self):
+        self.assertEqual(self.statistics.count('G'), 7)
+        self.assertEqual(self.statistics.count('GC', 0, 6), 4)
+        self.assertEqual(self.statistics.count('A', 5, 5), 0)
+
+    def test_composition(self):
+        self.assertEqual(self.statistics.composition('ACGT', 0, 10),
+                         {'A': 3, 'C': 2, 'G': 2, 'T': 3})
+
+    def test_gc_content(self):
+        self.assertAlmostEqual(self.statistics.gc_content(), 14 / 23)
+        self.assertAlmostEqual(self.statistics.gc_content(6, 10), 0.0)
+        self.assertEqual(self.statistics.gc_content(4, 4), 0.0)
+
+    def test_gc_skew(self):
+        self.assertAlmostEqual(self.statistics.gc_skew(0, 6), 0.0)
+        self.assertAlmostEqual(self.statistics.gc_skew(17, 20), 1.0)
+        self.assertEqual(self.statistics.gc_skew(7, 10), 0.0)
+
+    def test_window_values(self):
+        self.assertEqual(self.statistics.window_values('gc_content', 10),
+                         [0.4, 0.7])
+        self.assertEqual(
+            len(self.statistics.window_values('gc_skew', 5, step=2)), 10)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_window_values_numpy(self):
+        random.seed(11)
+        data = ''.join(random.choice('ACGT') for _ in range(1000))
+        plain = SequenceStatistics(data)
+        vectorized = SequenceStatistics(data, use_numpy=True)
+        for statistic in ('gc_content', 'gc_skew'):
+            values = vectorized.window_values(statistic, 50, step=7)
+            self.assertIsInstance(values, np.ndarray)
+            np.testing.assert_allclose(
+                values, plain.window_values(statistic, 50, step=7))
+        self.assertEqual(vectorized.count('GC', 10, 100),
+                         plain.count('GC', 10, 100))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.statistics.count('G', 5, 30)
+        with self.assertRaises(ValueError):
+            self.statistics.gc_content(6, 2)
+        with self.assertRaises(ValueError):
+            self.statistics.window_values('at_content', 5)
+        with self.assertRaises(ValueError):
+            self.statistics.window_values('gc_content', 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
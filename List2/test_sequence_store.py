@@ -0,0 +1,149 @@
+import os
+import random
+import tempfile
+import unittest
+from biological_sequences import DNASequence, ProteinSequence
+from fasta import read_fasta, write_fasta
+from mapped_sequence import MappedSequence
+from sequence_store import SequenceStore, index_fasta, read_index
+
+
+class TestMappedSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.data = "ATCGGCTAATCGAAGCTGGGCCC"
+        lines = b"ATCGGCTAAT\r\nCGAAGCTGGG\r\nCCC\r\n"
+        self.mapped = MappedSequence(memoryview(lines), 23, 10, 12)
+
+    def test_len_and_str(self):
+        self.assertEqual(len(self.mapped), 23)
+        self.assertEqual(str(self.mapped), self.data)
+
+    def test_getitem(self):
+        for i in range(-23, 23):
+            self.assertEqual(self.mapped[i], self.data[i])
+        for start in range(24):
+            for stop in range(start, 24):
+                self.assertEqual(self.mapped[start:stop],
+                                 self.data[start:stop])
+        self.assertEqual(self.mapped[::-3], self.data[::-3])
+        with self.assertRaises(IndexError):
+            self.mapped[23]
+
+    def test_region(self):
+        region = self.mapped.region(8, 21)
+        self.assertEqual(region, self.data[8:21])
+        self.assertEqual(region.region(2, 5), self.data[10:13])
+        self.assertEqual(''.join(region), self.data[8:21])
+        with self.assertRaises(ValueError):
+            self.mapped.region(5, 24)
+
+
+class TestSequenceStore(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(14)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "reference.fa")
+        self.records = [DNASequence(''.join(random.choice("ACGT")
+                                            for _ in range(length)),
+                                    f"chr{length}")
+                        for length in (0, 1, 59, 60, 61, 250)]
+        write_fasta(self.records, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_index(self):
+        with SequenceStore(self.path) as store:
+            self.assertEqual(list(store), [record.identifier
+                                           for record in self.records])
+            self.assertEqual(store.length("chr250"), 250)
+        self.assertTrue(os.path.exists(self.path + ".fai"))
+        self.assertEqual(read_index(self.path + ".fai"), store.index)
+
+    def test_fetch(self):
+        with SequenceStore(self.path) as store:
+            for record in self.records:
+                sequence = store[record.identifier]
+                self.assertIsInstance(sequence.data, MappedSequence)
+                self.assertEqual(len(sequence), len(record))
+                self.assertEqual(str(sequence.data), record.data)
+                self.assertTrue(sequence.validated)
+            del sequence
+
+    def test_fetch_region(self):
+        data = self.records[-1].data
+        with SequenceStore(self.path) as store:
+            region = store.fetch("chr250", 55, 130)
+            self.assertEqual(region.identifier, "chr250:55-130")
+            self.assertEqual(str(region.data), data[55:130])
+            motif = data[100:104]
+            self.assertEqual(region.find_motif(motif),
+                             DNASequence(data[55:130], "x").find_motif(motif))
+            self.assertEqual(region.complement(),
+                             DNASequence(data[55:130], "x").complement())
+            with self.assertRaises(ValueError):
+                store.fetch("chr250", 200, 251)
+            with self.assertRaises(KeyError):
+                store.fetch("chrX")
+            del region
+
+    def test_pack(self):
+        with SequenceStore(self.path) as store:
+            for record in self.records:
+                packed = store[record.identifier].pack()
+                self.assertIsInstance(packed, DNASequence)
+                self.assertEqual(packed.data, record.pack().data)
+                self.assertEqual(str(packed.data), record.data)
+            region = store.fetch("chr250", 55, 130).pack()
+            self.assertEqual(str(region.data), self.records[-1].data[55:130])
+            del packed, region
+
+    def test_protein_store(self):
+        with open(self.path, 'w') as handle:
+            handle.write(">p1\nMSRSLL\nLRF\n")
+        with SequenceStore(self.path, ProteinSequence) as store:
+            protein = store["p1"]
+            self.assertEqual(protein.find_motif("LLL"), [(4, 6)])
+            with self.assertRaises(ValueError):
+                protein.pack()
+            del protein
+
+    def test_invalid_layout(self):
+        self.assertEqual(index_fasta(b">a\nACG\nAC\n\n>b\nA"),
+                         {"a": (5, 3, 3, 4), "b": (1, 14, 1, 1)})
+        with self.assertRaises(ValueError):
+            index_fasta(b">a\nACG\nA\nACG\n")
+        with self.assertRaises(ValueError):
+            index_fasta(b">a\nACG\nACGT\n")
+        with self.assertRaises(ValueError):
+            index_fasta(b"ACG\n>a\nACG\n")
+
+    def test_header_description(self):
+        index = index_fasta(b">chr1 some description\nACG\n>chr2\tx\nA\n")
+        self.assertEqual(list(index), ["chr1", "chr2"])
+        with open(self.path, 'w') as handle:
+            handle.write(">chr1 Homo sapiens chromosome 1\nACGT\nAC\n")
+        with SequenceStore(self.path) as store:
+            self.assertEqual(store.fetch("chr1", 2, 5).identifier,
+                             "chr1:2-5")
+            self.assertEqual(str(store["chr1"].data), "ACGTAC")
+            for record in read_fasta(self.path):
+                self.assertEqual(record.identifier, "chr1")
+                self.assertEqual(str(store[record.identifier].data),
+                                 record.data)
+        with open(self.path + ".fai") as handle:
+            self.assertEqual(handle.read().split('\t')[0], "chr1")
+        with self.assertRaises(ValueError):
+            index_fasta(b">chr1 first\nA\n>chr1 second\nC\n")
+
+    def test_read_fasta_agrees(self):
+        with SequenceStore(self.path) as store:
+            for record in read_fasta(self.path):
+                self.assertEqual(str(store[record.identifier].data),
+                                 record.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from validators import AlphabetValidator
+
+
+class TestAlphabetValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.dna_validator = AlphabetValidator.for_alphabet('ACGT')
+
+    def test_valid_sequence(self):
+        self.assertTrue(self.dna_validator('TTGCTAAGG'))
+        self.assertTrue(self.dna_validator(''))
+
+    def test_invalid_sequence(self):
+        self.assertFalse(self.dna_validator('UUGCUAAGG'))
+        self.assertFalse(self.dna_validator('ACGTĄ'))
+        self.assertFalse(self.dna_validator(42))
+
+    def test_shared(self):
+        self.assertIs(self.dna_validator,
+                      AlphabetValidator.for_alphabet('ACGT'))
+        self.assertEqual(self.dna_validator.alphabet, frozenset('ACGT'))
+
+    def test_invalid_alphabet(self):
+        with self.assertRaises(ValueError):
+            AlphabetValidator('ACGĄ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Module containing validators of sequence alphabets. Every alphabet is
+compiled only once into a table of bytes to be deleted by
+bytes.translate, so checking a sequence is a single pass done in C
+instead of a Python loop over its characters.
+"""
+from functools import lru_cache
+
+
+class AlphabetValidator:
+    """
+    This class represents a compiled check whether a sequence consists
+    only of characters of a given alphabet. Validators are shared, so
+    they should be obtained with AlphabetValidator.for_alphabet.
+    """
+    __slots__ = ('alphabet', '_deleted')
+
+    def __init__(self, alphabet):
+        """
+        This function compiles an alphabet
+
+        Arguments:
+            alphabet (str): valid characters
+
+        Raises:
+            ValueError: If the alphabet contains non-ASCII characters
+        """
+        try:
+            self._deleted = ''.join(sorted(set(alphabet))).encode('ascii')
+        except UnicodeEncodeError:
+            raise ValueError("Alphabet must consist of ASCII"
+                             " characters.") from None
+        self.alphabet = frozenset(alphabet)
+
+    @staticmethod
+    @lru_cache
+    def for_alphabet(alphabet):
+        """
+        This function returns the validator of an alphabet, compiling it
+        only when it is requested for the first time
+
+        Arguments:
+            alphabet (str): valid characters
+
+        Returns:
+            validator (AlphabetValidator): shared validator
+        """
+        return AlphabetValidator(alphabet)
+
+    def __call__(self, data):
+        """
+        This function checks whether all characters of data belong to
+        the alphabet
+
+        Arguments:
+            data (str): checked sequence
+
+        Returns:
+            bool: True if data is valid, False otherwise (also if data
+                is not a string)
+        """
+        if not isinstance(data, str):
+            return False
+
+        try:
+            raw = data.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+
+        return not raw.translate(None, self._deleted)
+
+    def __repr__(self):
+        return f"AlphabetValidator({self._deleted.decode('ascii')!r})"
+
+
+if __name__ == '__main__':
+    dna_validator = AlphabetValidator.for_alphabet('ACGT')
+
+    print(dna_validator('TTGCTAAGG'))
+    print(dna_validator('UUGCUAAGG'))
+    print(dna_validator is AlphabetValidator.for_alphabet('ACGT'))
@@ -1,9 +1,8 @@
 def seq_validator_gen(alphabet):
+    deleted_letters = str.maketrans('', '', ''.join(alphabet))
+
     def seq_validator(seq):
-        for letter in seq:
-            if letter not in alphabet:
-                return False
-        return True
+        return not seq.translate(deleted_letters)
 
     return seq_validator
 